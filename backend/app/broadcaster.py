@@ -0,0 +1,68 @@
+import asyncio
+import logging
+import os
+from typing import Any
+
+from .cache import game_cache
+from .ws import manager
+
+logger = logging.getLogger(__name__)
+
+BROADCAST_WINDOW_SECONDS = float(os.getenv("BROADCAST_WINDOW_MS", "25")) / 1000
+
+
+async def build_snapshot(game_id: str) -> dict | None:
+    view = await game_cache.aget(game_id)
+    if view is None:
+        return None
+    return {
+        "game": view.game,
+        "teams": view.teams,
+        "game_state": view.game_state,
+        "players": view.players,
+    }
+
+
+class SnapshotScheduler:
+    def __init__(self, window_seconds: float = BROADCAST_WINDOW_SECONDS) -> None:
+        self._window_seconds = window_seconds
+        self._pending: dict[str, asyncio.Task] = {}
+        self.stats = {"requested": 0, "coalesced": 0, "immediate": 0, "flushed": 0}
+
+    async def schedule(self, game_id: str, immediate: bool = False) -> None:
+        self.stats["requested"] += 1
+        if immediate or self._window_seconds <= 0:
+            self.stats["immediate"] += 1
+            await self.flush(game_id)
+            return
+        if game_id in self._pending:
+            self.stats["coalesced"] += 1
+            return
+        self._pending[game_id] = asyncio.create_task(self._flush_later(game_id))
+
+    async def flush(self, game_id: str) -> None:
+        task = self._pending.pop(game_id, None)
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
+        data = await build_snapshot(game_id)
+        if data is None:
+            return
+        self.stats["flushed"] += 1
+        await manager.broadcast_state(game_id, data)
+
+    async def _flush_later(self, game_id: str) -> None:
+        await asyncio.sleep(self._window_seconds)
+        try:
+            await self.flush(game_id)
+        except Exception:
+            logger.exception("Failed to broadcast snapshot for game %s", game_id)
+
+    async def drain(self) -> None:
+        for game_id in list(self._pending):
+            await self.flush(game_id)
+
+    def metrics(self) -> dict[str, Any]:
+        return {**self.stats, "pending": len(self._pending), "window_ms": self._window_seconds * 1000}
+
+
+snapshot_scheduler = SnapshotScheduler()
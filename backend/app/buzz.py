@@ -0,0 +1,203 @@
+import asyncio
+import logging
+import os
+import time
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Any, AsyncIterator
+
+from . import crud
+from .cache import GameView, game_cache
+from .database import run_db
+
+logger = logging.getLogger(__name__)
+
+PERSIST_DELAY_SECONDS = float(os.getenv("BUZZ_PERSIST_DELAY_MS", "25")) / 1000
+
+
+@dataclass
+class BuzzEntry:
+    team_id: str
+    player_id: str | None
+    player_name: str | None
+    question_text: str | None
+    was_first: bool
+    delta_ms: float | None
+
+
+@dataclass
+class BuzzWindow:
+    open: bool
+    incorrect_team_id: str | None
+    first_ns: int | None = None
+    pending: list[BuzzEntry] = field(default_factory=list)
+    flush_task: asyncio.Task | None = None
+
+
+@dataclass
+class HostWrite:
+    count: int = 0
+    done: asyncio.Event = field(default_factory=asyncio.Event)
+
+
+class BuzzArbiter:
+    def __init__(self) -> None:
+        self._windows: dict[str, BuzzWindow] = {}
+        self._host_writes: dict[str, HostWrite] = {}
+        self.shared = False
+        self.stats = {"accepted": 0, "late": 0, "rejected": 0, "queued": 0, "persisted": 0, "persist_failures": 0}
+        self._last_resolve_us = 0.0
+
+    def _window(self, game_id: str, view: GameView) -> BuzzWindow:
+        window = self._windows.get(game_id)
+        if window is not None:
+            return window
+        state = view.game_state
+        trivia_data = (state.get("round_data") or {}).get("trivia") or {}
+        window = BuzzWindow(
+            open=bool(state["can_buzz"]) and not state["buzzed_team_id"],
+            incorrect_team_id=trivia_data.get("incorrect_team_id"),
+        )
+        self._windows[game_id] = window
+        return window
+
+    async def submit(
+        self,
+        game_id: str,
+        team_id: str,
+        player_id: str | None,
+        player_name: str | None,
+        question_text: str | None,
+    ) -> tuple[bool, str | None]:
+        arrived_ns = time.perf_counter_ns()
+        if game_id in self._host_writes:
+            self.stats["queued"] += 1
+        while (write := self._host_writes.get(game_id)) is not None:
+            await write.done.wait()
+        view = await game_cache.aget(game_id)
+        if view is None or view.game_state is None:
+            return False, "Game state not found"
+        window = self._window(game_id, view)
+
+        if not window.open:
+            if window.first_ns is None:
+                self.stats["rejected"] += 1
+                return False, "Cannot buzz right now"
+            entry = BuzzEntry(
+                team_id=team_id,
+                player_id=player_id,
+                player_name=player_name,
+                question_text=question_text,
+                was_first=False,
+                delta_ms=(arrived_ns - window.first_ns) / 1_000_000,
+            )
+            self._queue(game_id, window, entry)
+            self.stats["late"] += 1
+            return False, "Cannot buzz right now"
+
+        if window.incorrect_team_id and window.incorrect_team_id == team_id:
+            self.stats["rejected"] += 1
+            return False, "Only the opposing team can steal"
+
+        window.open = False
+        window.first_ns = arrived_ns
+        if player_id and not player_name:
+            player_name = next((player["name"] for player in view.players if player["id"] == player_id), None)
+        entry = BuzzEntry(
+            team_id=team_id,
+            player_id=player_id,
+            player_name=player_name,
+            question_text=question_text,
+            was_first=True,
+            delta_ms=0.0,
+        )
+        if self.shared:
+            if not await self._claim(game_id, entry):
+                window.first_ns = None
+                entry.was_first = False
+                entry.delta_ms = None
+                self._queue(game_id, window, entry)
+                self.stats["late"] += 1
+                return False, "Cannot buzz right now"
+        else:
+            self._apply_winner(game_id, view, entry)
+            self._queue(game_id, window, entry)
+        self.stats["accepted"] += 1
+        self._last_resolve_us = (time.perf_counter_ns() - arrived_ns) / 1000
+        return True, None
+
+    async def _claim(self, game_id: str, entry: BuzzEntry) -> bool:
+        try:
+            return await run_db(crud.claim_buzz, game_id, asdict(entry)) is not None
+        except Exception:
+            logger.exception("Failed to claim buzz for game %s", game_id)
+            self.forget(game_id)
+            return False
+
+    def _apply_winner(self, game_id: str, view: GameView, entry: BuzzEntry) -> None:
+        round_data = dict(view.game_state.get("round_data") or {})
+        trivia_data = dict(round_data.get("trivia") or {})
+        trivia_data["buzzed_player_id"] = entry.player_id
+        trivia_data["buzzed_player_name"] = entry.player_name
+        round_data["trivia"] = trivia_data
+        game_cache.patch_state(
+            game_id,
+            {"buzzed_team_id": entry.team_id, "can_buzz": False, "round_data": round_data},
+        )
+
+    def _queue(self, game_id: str, window: BuzzWindow, entry: BuzzEntry) -> None:
+        window.pending.append(entry)
+        if window.flush_task is None or window.flush_task.done():
+            window.flush_task = asyncio.create_task(self._flush_later(game_id, window))
+
+    async def _flush_later(self, game_id: str, window: BuzzWindow) -> None:
+        await asyncio.sleep(PERSIST_DELAY_SECONDS)
+        while window.pending:
+            entries, window.pending = window.pending, []
+            try:
+                await run_db(crud.record_buzzes, game_id, [asdict(entry) for entry in entries])
+                self.stats["persisted"] += len(entries)
+            except Exception:
+                self.stats["persist_failures"] += 1
+                logger.exception("Failed to persist %s buzzes for game %s", len(entries), game_id)
+                game_cache.invalidate(game_id)
+                if self._windows.get(game_id) is window:
+                    self._windows.pop(game_id, None)
+
+    def forget(self, game_id: str) -> None:
+        self._windows.pop(game_id, None)
+
+    async def settle(self, game_id: str) -> None:
+        window = self._windows.get(game_id)
+        if window is not None and window.flush_task is not None:
+            await asyncio.shield(window.flush_task)
+
+    @asynccontextmanager
+    async def host_write(self, game_id: str) -> AsyncIterator[None]:
+        write = self._host_writes.setdefault(game_id, HostWrite())
+        write.count += 1
+        try:
+            await self.settle(game_id)
+            yield
+        finally:
+            self._windows.pop(game_id, None)
+            write.count -= 1
+            if not write.count:
+                del self._host_writes[game_id]
+                write.done.set()
+
+    async def drain(self) -> None:
+        tasks = [window.flush_task for window in self._windows.values() if window.flush_task is not None]
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def metrics(self) -> dict[str, Any]:
+        return {
+            **self.stats,
+            "games": len(self._windows),
+            "pending": sum(len(window.pending) for window in self._windows.values()),
+            "last_resolve_us": round(self._last_resolve_us, 1),
+        }
+
+
+buzz_arbiter = BuzzArbiter()
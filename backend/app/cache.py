@@ -0,0 +1,216 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Any, Callable
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session, joinedload
+
+from . import models
+from .database import run_db
+from .snapshots import bundle_payload, game_payload, player_payload, state_payload, team_payload
+
+CACHE_MAX_GAMES = int(os.getenv("GAME_CACHE_MAX_GAMES", "512"))
+CACHE_TTL_SECONDS = float(os.getenv("GAME_CACHE_TTL_SECONDS", "60"))
+
+
+def _game_id_for_code(db: Session, code: str) -> str | None:
+    return db.execute(select(models.Game.id).where(models.Game.code == code)).scalar_one_or_none()
+
+
+def _game_bundle(db: Session, game_id: str) -> models.Game | None:
+    return (
+        db.execute(
+            select(models.Game)
+            .where(models.Game.id == game_id)
+            .options(
+                joinedload(models.Game.game_state).joinedload(models.GameState.rounds),
+                joinedload(models.Game.teams).joinedload(models.Team.players),
+            )
+        )
+        .unique()
+        .scalar_one_or_none()
+    )
+
+
+@dataclass(frozen=True)
+class GameView:
+    game: dict[str, Any]
+    teams: list[dict[str, Any]]
+    game_state: dict[str, Any] | None
+    players: list[dict[str, Any]]
+    loaded_at: float
+    version: int = 0
+
+
+class GameStateCache:
+    def __init__(self, max_games: int = CACHE_MAX_GAMES, ttl_seconds: float = CACHE_TTL_SECONDS) -> None:
+        self._max_games = max_games
+        self._ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, GameView] = OrderedDict()
+        self._codes: dict[str, str] = {}
+        self._generations: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0, "writes": 0}
+
+    def _lookup(self, game_id: str) -> tuple[GameView | None, int]:
+        with self._lock:
+            entry = self._entries.get(game_id)
+            if entry is not None and time.monotonic() - entry.loaded_at < self._ttl_seconds:
+                self._entries.move_to_end(game_id)
+                self.stats["hits"] += 1
+                return entry, 0
+            self.stats["misses"] += 1
+            return None, self._generations.get(game_id, 0)
+
+    def get(self, db: Session, game_id: str) -> GameView | None:
+        entry, generation = self._lookup(game_id)
+        if entry is not None:
+            return entry
+        return self._load(db, game_id, generation)
+
+    async def aget(self, game_id: str) -> GameView | None:
+        entry, generation = self._lookup(game_id)
+        if entry is not None:
+            return entry
+        return await run_db(self._load, game_id, generation)
+
+    def get_by_code(self, db: Session, code: str) -> GameView | None:
+        game_id = self._code_lookup(code) or _game_id_for_code(db, code)
+        if game_id is None:
+            return None
+        return self._match_code(self.get(db, game_id), code)
+
+    async def aget_by_code(self, code: str) -> GameView | None:
+        game_id = self._code_lookup(code) or await run_db(_game_id_for_code, code)
+        if game_id is None:
+            return None
+        return self._match_code(await self.aget(game_id), code)
+
+    def _code_lookup(self, code: str) -> str | None:
+        with self._lock:
+            return self._codes.get(code)
+
+    def _match_code(self, view: GameView | None, code: str) -> GameView | None:
+        if view is None or view.game["code"] != code:
+            return None
+        return view
+
+    def _load(self, db: Session, game_id: str, generation: int) -> GameView | None:
+        game = _game_bundle(db, game_id)
+        if game is None:
+            return None
+        view = GameView(**bundle_payload(game), loaded_at=time.monotonic(), version=game.version)
+        with self._lock:
+            if self._generations.get(game_id, 0) == generation:
+                self._store(game_id, view)
+        return view
+
+    def _store(self, game_id: str, view: GameView) -> None:
+        self._entries[game_id] = view
+        self._entries.move_to_end(game_id)
+        self._codes[view.game["code"]] = game_id
+        while len(self._entries) > self._max_games:
+            evicted_id, evicted = self._entries.popitem(last=False)
+            self._codes.pop(evicted.game["code"], None)
+            self._generations.pop(evicted_id, None)
+            self.stats["evictions"] += 1
+
+    def _apply(self, game_id: str, build: Callable[[GameView], dict[str, Any]], version: int | None = None) -> None:
+        with self._lock:
+            self._generations[game_id] = self._generations.get(game_id, 0) + 1
+            entry = self._entries.get(game_id)
+            if entry is None:
+                return
+            self._entries[game_id] = replace(entry, **build(entry), version=max(entry.version, version or 0))
+            self.stats["writes"] += 1
+
+    def put_new_game(
+        self,
+        game: models.Game,
+        teams: list[models.Team],
+        state: models.GameState,
+    ) -> None:
+        view = GameView(
+            game=game_payload(game),
+            teams=[team_payload(team, []) for team in teams],
+            game_state=state_payload(state),
+            players=[],
+            loaded_at=time.monotonic(),
+            version=game.version,
+        )
+        with self._lock:
+            self._generations[game.id] = self._generations.get(game.id, 0) + 1
+            self._store(game.id, view)
+            self.stats["writes"] += 1
+
+    def put_game(self, game: models.Game) -> None:
+        view = game_payload(game)
+        self._apply(game.id, lambda entry: {"game": view}, game.version)
+
+    def put_state(self, state: models.GameState, version: int) -> None:
+        view = state_payload(state)
+        self._apply(state.game_id, lambda entry: {"game_state": view}, version)
+
+    def patch_state(self, game_id: str, updates: dict[str, Any]) -> None:
+        def build(entry: GameView) -> dict[str, Any]:
+            if entry.game_state is None:
+                return {}
+            return {"game_state": {**entry.game_state, **updates}}
+
+        self._apply(game_id, build)
+
+    def put_team_score(self, game_id: str, team_id: str, score: int, version: int) -> None:
+        def build(entry: GameView) -> dict[str, Any]:
+            return {
+                "teams": [
+                    {**cached, "score": score} if cached["id"] == team_id else cached
+                    for cached in entry.teams
+                ]
+            }
+
+        self._apply(game_id, build, version)
+
+    def put_player(self, player: models.Player, version: int) -> None:
+        updated = player_payload(player)
+
+        def build(entry: GameView) -> dict[str, Any]:
+            if any(cached["id"] == player.id for cached in entry.players):
+                return {
+                    "players": [updated if cached["id"] == player.id else cached for cached in entry.players]
+                }
+            return {
+                "players": [*entry.players, updated],
+                "teams": [
+                    {**cached, "players": [*cached["players"], player.name]}
+                    if cached["id"] == player.team_id
+                    else cached
+                    for cached in entry.teams
+                ],
+            }
+
+        self._apply(player.game_id, build, version)
+
+    def etag(self, view: GameView, suffix: str = "") -> str:
+        return f'W/"{view.version}{suffix}"'
+
+    def invalidate(self, game_id: str) -> None:
+        with self._lock:
+            self._generations[game_id] = self._generations.get(game_id, 0) + 1
+            entry = self._entries.pop(game_id, None)
+            if entry is not None:
+                self._codes.pop(entry.game["code"], None)
+
+    def metrics(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self.stats["hits"] + self.stats["misses"]
+            return {
+                **self.stats,
+                "games": len(self._entries),
+                "hit_ratio": round(self.stats["hits"] / lookups, 4) if lookups else None,
+            }
+
+
+game_cache = GameStateCache()
@@ -1,11 +1,13 @@
 import hashlib
 import random
 from datetime import datetime
+from typing import Any
 
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy import Row, case, func, select, update
+from sqlalchemy.orm import Session, selectinload
 
 from . import models, schemas
+from .cache import game_cache
 
 
 GAME_CODE_WORDS = [
@@ -92,20 +94,24 @@ def create_game(db: Session, payload: schemas.GameCreate) -> tuple[models.Game,
     state = models.GameState(
         game_id=game.id,
         can_buzz=False,
-        round_data={
-            "game_setup": {
-                "rounds": payload.rounds,
-                "round_settings": {},
-                "difficulty": payload.difficulty,
-                "host_pin_hash": host_pin_hash,
-            }
-        },
+        rounds=[
+            models.RoundState(
+                namespace="game_setup",
+                data={
+                    "rounds": payload.rounds,
+                    "round_settings": {},
+                    "difficulty": payload.difficulty,
+                    "host_pin_hash": host_pin_hash,
+                },
+            )
+        ],
     )
     db.add(state)
     db.commit()
     db.refresh(game)
     for team_row in teams:
         db.refresh(team_row)
+    game_cache.put_new_game(game, teams, state)
 
     return game, teams
 
@@ -123,6 +129,16 @@ def get_game(db: Session, game_id: str) -> models.Game | None:
     return db.execute(select(models.Game).where(models.Game.id == game_id)).scalar_one_or_none()
 
 
+def _bump_version(db: Session, game_id: str) -> int:
+    return db.execute(
+        update(models.Game)
+        .where(models.Game.id == game_id)
+        .values(version=models.Game.version + 1)
+        .returning(models.Game.version)
+        .execution_options(synchronize_session=False)
+    ).scalar_one()
+
+
 def update_game(db: Session, game_id: str, updates: schemas.GameUpdate) -> models.Game:
     game = get_game(db, game_id)
     if not game:
@@ -132,14 +148,20 @@ def update_game(db: Session, game_id: str, updates: schemas.GameUpdate) -> model
     for key, value in update_data.items():
         setattr(game, key, value)
     game.updated_at = datetime.utcnow()
+    _bump_version(db, game_id)
 
     db.commit()
     db.refresh(game)
+    game_cache.put_game(game)
     return game
 
 
 def get_teams_for_game(db: Session, game_id: str) -> list[models.Team]:
-    return list(db.execute(select(models.Team).where(models.Team.game_id == game_id)).scalars())
+    return list(
+        db.execute(
+            select(models.Team).where(models.Team.game_id == game_id).options(selectinload(models.Team.players))
+        ).scalars()
+    )
 
 
 def get_players_for_game(db: Session, game_id: str) -> list[models.Player]:
@@ -154,8 +176,10 @@ def create_player(db: Session, game_id: str, team_id: str, player_name: str) ->
         connected=True,
     )
     db.add(player)
+    version = _bump_version(db, game_id)
     db.commit()
     db.refresh(player)
+    game_cache.put_player(player, version)
     return player
 
 
@@ -165,13 +189,19 @@ def set_player_connected(db: Session, player_id: str, connected: bool) -> models
         raise ValueError("Player not found")
     player.connected = connected
     player.last_seen = datetime.utcnow()
+    version = _bump_version(db, player.game_id)
     db.commit()
     db.refresh(player)
+    game_cache.put_player(player, version)
     return player
 
 
 def get_game_state(db: Session, game_id: str) -> models.GameState | None:
-    return db.execute(select(models.GameState).where(models.GameState.game_id == game_id)).scalar_one_or_none()
+    return db.execute(
+        select(models.GameState)
+        .where(models.GameState.game_id == game_id)
+        .options(selectinload(models.GameState.rounds))
+    ).scalar_one_or_none()
 
 
 def update_game_state(db: Session, game_id: str, updates: schemas.GameStateUpdate) -> models.GameState:
@@ -183,19 +213,36 @@ def update_game_state(db: Session, game_id: str, updates: schemas.GameStateUpdat
     if "round_data" in update_data:
         incoming = update_data.pop("round_data")
         if incoming is None:
-            state.round_data = None
+            state.rounds.clear()
         else:
-            existing = state.round_data or {}
-            state.round_data = _deep_merge_dicts(existing, incoming)
+            for namespace, value in incoming.items():
+                merge_round_namespace(state, namespace, value)
     for key, value in update_data.items():
         setattr(state, key, value)
     state.updated_at = datetime.utcnow()
+    version = _bump_version(db, game_id)
 
     db.commit()
     db.refresh(state)
+    game_cache.put_state(state, version)
     return state
 
 
+def merge_round_namespace(state: models.GameState, namespace: str, value: Any) -> models.RoundState:
+    round_state = state.round_namespace(namespace)
+    if round_state is None:
+        round_state = models.RoundState(namespace=namespace, data=value)
+        state.rounds.append(round_state)
+        return round_state
+    if isinstance(value, dict) and isinstance(round_state.data, dict):
+        value = _deep_merge_dicts(round_state.data, value)
+    if value == round_state.data:
+        return round_state
+    round_state.data = value
+    round_state.version += 1
+    return round_state
+
+
 def _deep_merge_dicts(base: dict, updates: dict) -> dict:
     merged = dict(base)
     for key, value in updates.items():
@@ -206,66 +253,94 @@ def _deep_merge_dicts(base: dict, updates: dict) -> dict:
     return merged
 
 
-def update_team_score(db: Session, team_id: str, points: int) -> models.Team:
-    team = db.execute(select(models.Team).where(models.Team.id == team_id)).scalar_one_or_none()
-    if not team:
-        raise ValueError("Team not found")
+def _increment_score(db: Session, team_id: str, points: int, game_id: str | None = None) -> Row | None:
+    new_score = models.Team.score + points
+    statement = (
+        update(models.Team)
+        .where(models.Team.id == team_id)
+        .values(score=case((new_score < 0, 0), else_=new_score))
+        .returning(models.Team.id, models.Team.game_id, models.Team.score)
+    )
+    if game_id is not None:
+        statement = statement.where(models.Team.game_id == game_id)
+    return db.execute(statement).one_or_none()
+
 
-    team.score = max(0, team.score + points)
+def update_team_score(db: Session, team_id: str, points: int) -> Row:
+    team = _increment_score(db, team_id, points)
+    if team is None:
+        raise ValueError("Team not found")
+    version = _bump_version(db, team.game_id)
     db.commit()
-    db.refresh(team)
+    game_cache.put_team_score(team.game_id, team.id, team.score, version)
     return team
 
 
-def send_buzz(
-    db: Session,
-    game_id: str,
-    team_id: str,
-    player_id: str | None,
-    player_name: str | None,
-    question_text: str | None,
-) -> tuple[bool, str | None]:
-    state = get_game_state(db, game_id)
-    if not state:
-        return False, "Game state not found"
-
-    if not state.can_buzz or state.buzzed_team_id:
-        return False, "Cannot buzz right now"
-
-    round_data = state.round_data or {}
-    trivia_data = dict(round_data.get("trivia") or {})
-    incorrect_team_id = trivia_data.get("incorrect_team_id")
-    if incorrect_team_id and incorrect_team_id == team_id:
-        return False, "Only the opposing team can steal"
-
-    resolved_player_name = player_name
-    if player_id and not resolved_player_name:
-        player = (
-            db.execute(select(models.Player).where(models.Player.id == player_id))
-            .scalar_one_or_none()
+def update_team_scores(db: Session, game_id: str, deltas: list[schemas.TeamScoreDelta]) -> list[Row]:
+    teams = []
+    for delta in deltas:
+        team = _increment_score(db, delta.team_id, delta.points, game_id)
+        if team is None:
+            db.rollback()
+            raise ValueError(f"Team {delta.team_id} not found in game")
+        teams.append(team)
+    version = _bump_version(db, game_id)
+    db.commit()
+    for team in teams:
+        game_cache.put_team_score(team.game_id, team.id, team.score, version)
+    return teams
+
+
+def record_buzzes(db: Session, game_id: str, buzzes: list[dict]) -> models.GameState | None:
+    state = None
+    for item in buzzes:
+        db.add(
+            models.Buzz(
+                game_id=game_id,
+                team_id=item["team_id"],
+                player_id=item.get("player_id"),
+                question_text=item.get("question_text"),
+                was_first=item["was_first"],
+                delta_ms=item["delta_ms"],
+            )
         )
-        if player:
-            resolved_player_name = player.name
+        if not item["was_first"]:
+            continue
+        state = get_game_state(db, game_id)
+        if not state:
+            continue
+        merge_round_namespace(
+            state,
+            "trivia",
+            {"buzzed_player_id": item.get("player_id"), "buzzed_player_name": item.get("player_name")},
+        )
+        state.buzzed_team_id = item["team_id"]
+        state.can_buzz = False
+        state.updated_at = datetime.utcnow()
 
-    trivia_data["buzzed_player_id"] = player_id
-    trivia_data["buzzed_player_name"] = resolved_player_name
-    round_data["trivia"] = trivia_data
+    version = _bump_version(db, game_id) if state else None
+    db.commit()
+    if state:
+        db.refresh(state)
+        game_cache.put_state(state, version)
+    return state
 
-    state.buzzed_team_id = team_id
-    state.can_buzz = False
-    state.updated_at = datetime.utcnow()
-    state.round_data = round_data
 
-    buzz = models.Buzz(
-        game_id=game_id,
-        team_id=team_id,
-        player_id=player_id,
-        question_text=question_text,
-        was_first=True,
-    )
-    db.add(buzz)
-    db.commit()
-    return True, None
+def claim_buzz(db: Session, game_id: str, buzz: dict) -> models.GameState | None:
+    claimed = db.execute(
+        update(models.GameState)
+        .where(
+            models.GameState.game_id == game_id,
+            models.GameState.can_buzz.is_(True),
+            models.GameState.buzzed_team_id.is_(None),
+        )
+        .values(can_buzz=False, buzzed_team_id=buzz["team_id"])
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    if not claimed:
+        db.rollback()
+        return None
+    return record_buzzes(db, game_id, [buzz])
 
 
 def reset_buzz(db: Session, game_id: str, can_buzz: bool = True) -> models.GameState:
@@ -276,8 +351,10 @@ def reset_buzz(db: Session, game_id: str, can_buzz: bool = True) -> models.GameS
     state.buzzed_team_id = None
     state.can_buzz = can_buzz
     state.updated_at = datetime.utcnow()
+    version = _bump_version(db, game_id)
     db.commit()
     db.refresh(state)
+    game_cache.put_state(state, version)
     return state
 
 
@@ -290,6 +367,115 @@ def set_buzzing(db: Session, game_id: str, can_buzz: bool) -> models.GameState:
     if can_buzz:
         state.buzzed_team_id = None
     state.updated_at = datetime.utcnow()
+    version = _bump_version(db, game_id)
     db.commit()
     db.refresh(state)
+    game_cache.put_state(state, version)
     return state
+
+
+def _bank_fingerprint(payload: dict) -> str:
+    text = payload.get("text") or payload.get("question") or payload.get("word") or ""
+    normalized = " ".join(str(text).lower().split())
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def count_bank_questions(db: Session, round_type: str, difficulty: str, category: str) -> int:
+    return db.execute(
+        select(func.count())
+        .select_from(models.QuestionBankEntry)
+        .where(
+            models.QuestionBankEntry.round_type == round_type,
+            models.QuestionBankEntry.difficulty == difficulty,
+            models.QuestionBankEntry.category == category,
+            models.QuestionBankEntry.served_at.is_(None),
+        )
+    ).scalar_one()
+
+
+def take_bank_questions(
+    db: Session,
+    round_type: str,
+    difficulty: str,
+    category: str,
+    limit: int,
+) -> list[dict]:
+    entry = models.QuestionBankEntry
+    unserved = (
+        select(entry.id)
+        .where(
+            entry.round_type == round_type,
+            entry.difficulty == difficulty,
+            entry.category == category,
+            entry.served_at.is_(None),
+        )
+        .order_by(entry.created_at)
+        .limit(limit)
+    )
+    claimed = db.execute(
+        update(entry)
+        .where(entry.id.in_(unserved), entry.served_at.is_(None))
+        .values(served_at=datetime.utcnow())
+        .returning(entry.payload, entry.created_at)
+        .execution_options(synchronize_session=False)
+    ).all()
+    db.commit()
+    return [dict(payload) for payload, _ in sorted(claimed, key=lambda row: row.created_at)]
+
+
+def add_bank_questions(
+    db: Session,
+    round_type: str,
+    difficulty: str,
+    category: str,
+    items: list[dict],
+    served: bool = False,
+) -> int:
+    if not items:
+        return 0
+    by_fingerprint = {_bank_fingerprint(item): item for item in items}
+    existing = set(
+        db.execute(
+            select(models.QuestionBankEntry.fingerprint).where(
+                models.QuestionBankEntry.round_type == round_type,
+                models.QuestionBankEntry.difficulty == difficulty,
+                models.QuestionBankEntry.category == category,
+                models.QuestionBankEntry.fingerprint.in_(list(by_fingerprint)),
+            )
+        ).scalars()
+    )
+    served_at = datetime.utcnow() if served else None
+    added = 0
+    for fingerprint, item in by_fingerprint.items():
+        if fingerprint in existing:
+            continue
+        db.add(
+            models.QuestionBankEntry(
+                round_type=round_type,
+                difficulty=difficulty,
+                category=category,
+                fingerprint=fingerprint,
+                payload=item,
+                served_at=served_at,
+            )
+        )
+        added += 1
+    db.commit()
+    return added
+
+
+def get_bank_stock_levels(db: Session) -> dict[tuple[str, str, str], int]:
+    unserved = func.sum(case((models.QuestionBankEntry.served_at.is_(None), 1), else_=0))
+    rows = db.execute(
+        select(
+            models.QuestionBankEntry.round_type,
+            models.QuestionBankEntry.difficulty,
+            models.QuestionBankEntry.category,
+            unserved,
+        ).group_by(
+            models.QuestionBankEntry.round_type,
+            models.QuestionBankEntry.difficulty,
+            models.QuestionBankEntry.category,
+        )
+    ).all()
+    return {(round_type, difficulty, category): int(count or 0) for round_type, difficulty, category, count in rows}
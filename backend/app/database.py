@@ -1,7 +1,18 @@
+import asyncio
 import os
+from typing import Any, Callable, TypeVar
 
-from sqlalchemy import create_engine
+from sqlalchemy import Engine, create_engine, event
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
+from sqlalchemy.pool import QueuePool, StaticPool
+
+T = TypeVar("T")
+
+ASYNC_DRIVERS = {
+    "sqlite+aiosqlite": "sqlite",
+    "postgresql+asyncpg": "postgresql",
+}
 
 
 class Base(DeclarativeBase):
@@ -12,11 +23,106 @@ def _build_db_url() -> str:
     return os.getenv("DATABASE_URL", "sqlite:///./gameshow.db")
 
 
+def _sync_db_url(url: str) -> str:
+    override = os.getenv("SYNC_DATABASE_URL")
+    if override:
+        return override
+    parsed = make_url(url)
+    sync_driver = ASYNC_DRIVERS.get(parsed.drivername)
+    if sync_driver is None:
+        return url
+    return parsed.set(drivername=sync_driver).render_as_string(hide_password=False)
+
+
 DATABASE_URL = _build_db_url()
+SYNC_DATABASE_URL = _sync_db_url(DATABASE_URL)
+USE_ASYNC_ENGINE = make_url(DATABASE_URL).drivername in ASYNC_DRIVERS
+
+SQLITE_PROFILE = os.getenv("SQLITE_PROFILE", "default").strip().lower()
+SQLITE_PROFILES = {
+    "default": {},
+    "performance": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "busy_timeout": os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"),
+        "mmap_size": os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)),
+        "cache_size": os.getenv("SQLITE_CACHE_SIZE", "-32000"),
+        "temp_store": "MEMORY",
+    },
+}
+DATABASE_POOL_SIZE = int(os.getenv("DATABASE_POOL_SIZE", "10"))
+DATABASE_MAX_OVERFLOW = int(os.getenv("DATABASE_MAX_OVERFLOW", "20"))
+
+
+def _is_memory_sqlite(url: str) -> bool:
+    parsed = make_url(url)
+    return parsed.get_backend_name() == "sqlite" and parsed.database in (None, "", ":memory:")
+
+
+def _apply_sqlite_pragmas(engine: Engine, profile: str) -> None:
+    pragmas = SQLITE_PROFILES.get(profile)
+    if pragmas is None:
+        raise ValueError(f"Unknown SQLITE_PROFILE '{profile}'")
+    if not pragmas:
+        return
+
+    @event.listens_for(engine, "connect")
+    def set_pragmas(dbapi_connection, connection_record) -> None:
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
+
 
-connect_args = {}
-if DATABASE_URL.startswith("sqlite"):
-    connect_args = {"check_same_thread": False}
+def _engine_options(url: str, profile: str) -> dict[str, Any]:
+    if make_url(url).get_backend_name() != "sqlite":
+        return {"pool_size": DATABASE_POOL_SIZE, "max_overflow": DATABASE_MAX_OVERFLOW, "pool_pre_ping": True}
+    if _is_memory_sqlite(url):
+        return {"poolclass": StaticPool}
+    if profile == "default":
+        return {}
+    return {"poolclass": QueuePool, "pool_size": DATABASE_POOL_SIZE, "max_overflow": DATABASE_MAX_OVERFLOW}
 
-engine = create_engine(DATABASE_URL, connect_args=connect_args, future=True)
+
+def create_db_engine(url: str, profile: str = SQLITE_PROFILE) -> Engine:
+    connect_args = {}
+    if url.startswith("sqlite"):
+        connect_args = {"check_same_thread": False}
+    db_engine = create_engine(url, connect_args=connect_args, future=True, **_engine_options(url, profile))
+    if url.startswith("sqlite"):
+        _apply_sqlite_pragmas(db_engine, profile)
+    return db_engine
+
+
+engine = create_db_engine(SYNC_DATABASE_URL)
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+
+async_engine = None
+AsyncSessionLocal = None
+if USE_ASYNC_ENGINE:
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    async_options = _engine_options(DATABASE_URL, SQLITE_PROFILE)
+    async_options.pop("poolclass", None)
+    async_engine = create_async_engine(DATABASE_URL, **async_options)
+    if DATABASE_URL.startswith("sqlite"):
+        _apply_sqlite_pragmas(async_engine.sync_engine, SQLITE_PROFILE)
+    AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False)
+
+
+def _run_with_session(fn: Callable[..., T], *args: Any) -> T:
+    with SessionLocal() as db:
+        return fn(db, *args)
+
+
+async def run_db(fn: Callable[..., T], *args: Any) -> T:
+    if AsyncSessionLocal is not None:
+        async with AsyncSessionLocal() as session:
+            return await session.run_sync(fn, *args)
+    return await asyncio.to_thread(_run_with_session, fn, *args)
+
+
+async def dispose_engines() -> None:
+    if async_engine is not None:
+        await async_engine.dispose()
+    engine.dispose()
@@ -1,16 +1,30 @@
+import asyncio
+import importlib.util
 import json
 import logging
 import os
+import time
 import uuid
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator
 
 import httpx
+from sqlalchemy.orm import Session
 
-from . import schemas
+from . import crud, schemas
+from .database import run_db
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_MAX_CONCURRENCY = 4
+SETTINGS_RECHECK_SECONDS = 5.0
+
+_request_slots: ContextVar[asyncio.Semaphore | None] = ContextVar("llm_request_slots", default=None)
+
 
 def _resolve_config_path() -> Path:
     env_path = os.getenv("LLM_CONFIG_PATH")
@@ -33,10 +47,57 @@ def _load_config() -> dict[str, str]:
     return {}
 
 
-def _get_llm_config() -> tuple[str, str, str, str, str, bool]:
-    config = _load_config()
-    config_path = str(_resolve_config_path())
-    provider = (os.getenv("LLM_PROVIDER") or config.get("LLM_PROVIDER") or "openai").lower()
+def _setting(config: dict[str, str], key: str) -> str | None:
+    return os.getenv(key) or config.get(key)
+
+
+def _int_setting(config: dict[str, str], key: str, default: int) -> int:
+    raw = _setting(config, key)
+    try:
+        return int(raw) if raw else default
+    except ValueError:
+        return default
+
+
+def _list_setting(config: dict[str, str], key: str, default: str) -> tuple[str, ...]:
+    raw = _setting(config, key) or default
+    return tuple(item.strip() for item in raw.split(",") if item.strip())
+
+
+def _bool_setting(config: dict[str, str], key: str, default: bool) -> bool:
+    raw = _setting(config, key)
+    if not raw:
+        return default
+    return raw.strip().lower() in ("1", "true", "yes", "on")
+
+
+@dataclass(frozen=True)
+class LLMSettings:
+    provider: str
+    api_key: str | None
+    base_url: str
+    model: str
+    anthropic_version: str
+    config_path: str
+    using_env: bool
+    max_concurrency: int
+    max_connections: int
+    max_keepalive_connections: int
+    keepalive_expiry: float
+    timeout_seconds: float
+    http2: bool
+    bank_low_water: int
+    bank_batch_size: int
+    refill_interval: float
+    refill_min_interval: float
+    refill_concurrency: int
+    bank_seed_rounds: tuple[str, ...]
+    bank_seed_difficulties: tuple[str, ...]
+    bank_seed_categories: tuple[str, ...]
+
+
+def _resolve_settings(config: dict[str, str], config_path: Path) -> LLMSettings:
+    provider = (_setting(config, "LLM_PROVIDER") or "openai").lower()
     api_key = (
         os.getenv("LLM_API_KEY")
         or os.getenv("OPENAI_API_KEY")
@@ -44,15 +105,12 @@ def _get_llm_config() -> tuple[str, str, str, str, str, bool]:
         or config.get("OPENAI_API_KEY")
     )
     if not api_key and provider == "anthropic":
-        api_key = os.getenv("ANTHROPIC_API_KEY") or config.get("ANTHROPIC_API_KEY")
-    if not api_key:
-        raise ValueError("Missing LLM_API_KEY/OPENAI_API_KEY/ANTHROPIC_API_KEY")
-    base_url = (
-        os.getenv("LLM_BASE_URL")
-        or config.get("LLM_BASE_URL")
-        or "https://api.openai.com/v1"
-    ).rstrip("/")
-    model = os.getenv("LLM_MODEL") or config.get("LLM_MODEL") or "gpt-4o-mini"
+        api_key = _setting(config, "ANTHROPIC_API_KEY")
+    default_base_url = (
+        "https://api.anthropic.com" if provider == "anthropic" else "https://api.openai.com/v1"
+    )
+    base_url = (_setting(config, "LLM_BASE_URL") or default_base_url).rstrip("/")
+    model = _setting(config, "LLM_MODEL") or "gpt-4o-mini"
     using_env = any(
         os.getenv(key)
         for key in (
@@ -65,34 +123,181 @@ def _get_llm_config() -> tuple[str, str, str, str, str, bool]:
             "LLM_ANTHROPIC_VERSION",
         )
     )
-    return provider, api_key, base_url, model, config_path, using_env
-
-
-def _add_ids_to_questions(questions: list[schemas.QuestionOut]) -> list[schemas.QuestionOut]:
-    updated: list[schemas.QuestionOut] = []
-    for question in questions:
-        updated.append(
-            schemas.QuestionOut(
-                id=str(uuid.uuid4()),
-                text=question.text,
-                answer=question.answer,
-                difficulty=question.difficulty,
-                category=question.category,
-            )
+    return LLMSettings(
+        provider=provider,
+        api_key=api_key or None,
+        base_url=base_url,
+        model=model,
+        anthropic_version=_setting(config, "LLM_ANTHROPIC_VERSION") or "2023-06-01",
+        config_path=str(config_path),
+        using_env=using_env,
+        max_concurrency=max(1, _int_setting(config, "LLM_MAX_CONCURRENCY", DEFAULT_MAX_CONCURRENCY)),
+        max_connections=_int_setting(config, "LLM_MAX_CONNECTIONS", 20),
+        max_keepalive_connections=_int_setting(config, "LLM_MAX_KEEPALIVE_CONNECTIONS", 10),
+        keepalive_expiry=float(_int_setting(config, "LLM_KEEPALIVE_EXPIRY", 60)),
+        timeout_seconds=float(_int_setting(config, "LLM_TIMEOUT_SECONDS", 30)),
+        http2=_bool_setting(config, "LLM_HTTP2", False),
+        bank_low_water=max(0, _int_setting(config, "QUESTION_BANK_LOW_WATER", 10)),
+        bank_batch_size=max(1, _int_setting(config, "QUESTION_BANK_BATCH_SIZE", 20)),
+        refill_interval=float(max(1, _int_setting(config, "QUESTION_BANK_REFILL_INTERVAL", 30))),
+        refill_min_interval=float(max(0, _int_setting(config, "QUESTION_BANK_REFILL_MIN_INTERVAL", 2))),
+        refill_concurrency=max(1, _int_setting(config, "QUESTION_BANK_REFILL_CONCURRENCY", 2)),
+        bank_seed_rounds=_list_setting(
+            config,
+            "QUESTION_BANK_SEED_ROUNDS",
+            "trivia-buzz,lightning,guess-number,connect-4,blind-draw,dump-charades",
+        ),
+        bank_seed_difficulties=_list_setting(config, "QUESTION_BANK_SEED_DIFFICULTIES", "medium-hard"),
+        bank_seed_categories=_list_setting(config, "QUESTION_BANK_SEED_CATEGORIES", ""),
+    )
+
+
+_settings: LLMSettings | None = None
+_settings_mtime: float | None = None
+_settings_checked_at = 0.0
+
+
+def _config_mtime(config_path: Path) -> float | None:
+    try:
+        return config_path.stat().st_mtime
+    except OSError:
+        return None
+
+
+def load_llm_settings() -> LLMSettings:
+    global _settings, _settings_mtime, _settings_checked_at
+    config_path = _resolve_config_path()
+    mtime = _config_mtime(config_path)
+    settings = _resolve_settings(_load_config(), config_path)
+    _settings = settings
+    _settings_mtime = mtime
+    _settings_checked_at = time.monotonic()
+    return settings
+
+
+def get_llm_settings() -> LLMSettings:
+    global _settings_checked_at
+    if _settings is None:
+        return load_llm_settings()
+    now = time.monotonic()
+    if now - _settings_checked_at >= SETTINGS_RECHECK_SECONDS:
+        _settings_checked_at = now
+        if _config_mtime(Path(_settings.config_path)) != _settings_mtime:
+            logger.info("LLM config file changed, reloading path=%s", _settings.config_path)
+            return load_llm_settings()
+    return _settings
+
+
+_http_client: httpx.AsyncClient | None = None
+_pool_stats: dict[str, Any] = {"requests": 0, "connections_opened": 0, "http2": False}
+
+
+def _build_http_client() -> httpx.AsyncClient:
+    settings = get_llm_settings()
+    limits = httpx.Limits(
+        max_connections=settings.max_connections,
+        max_keepalive_connections=settings.max_keepalive_connections,
+        keepalive_expiry=settings.keepalive_expiry,
+    )
+    http2 = settings.http2
+    if http2 and importlib.util.find_spec("h2") is None:
+        logger.warning("LLM_HTTP2 is enabled but the 'h2' package is not installed; using HTTP/1.1")
+        http2 = False
+    _pool_stats["http2"] = http2
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(settings.timeout_seconds), limits=limits, http2=http2
+    )
+
+
+def init_http_client() -> httpx.AsyncClient:
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = _build_http_client()
+    return _http_client
+
+
+async def close_http_client() -> None:
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+async def _trace_connection(event_name: str, info: dict) -> None:
+    if event_name == "connection.connect_tcp.complete":
+        _pool_stats["connections_opened"] += 1
+
+
+def _pool_connection_stats(client: httpx.AsyncClient | None) -> dict[str, int]:
+    pool = getattr(getattr(client, "_transport", None), "_pool", None)
+    try:
+        connections = list(pool.connections)
+        return {
+            "open_connections": len(connections),
+            "idle_connections": sum(1 for conn in connections if conn.is_idle()),
+        }
+    except Exception:
+        return {}
+
+
+def get_http_pool_stats() -> dict[str, Any]:
+    client = _http_client
+    requests = _pool_stats["requests"]
+    opened = _pool_stats["connections_opened"]
+    return {
+        "active": client is not None and not client.is_closed,
+        "http2": _pool_stats["http2"],
+        "requests": requests,
+        "connections_opened": opened,
+        "connections_reused": max(0, requests - opened),
+        **_pool_connection_stats(client),
+    }
+
+
+async def _post_json(url: str, headers: dict[str, str], payload: dict[str, Any]) -> Any:
+    client = init_http_client()
+    _pool_stats["requests"] += 1
+    try:
+        response = await client.post(
+            url,
+            headers=headers,
+            json=payload,
+            extensions={"trace": _trace_connection},
         )
-    return updated
+        response.raise_for_status()
+    except httpx.HTTPError as exc:
+        error_response = getattr(exc, "response", None)
+        status = getattr(error_response, "status_code", None)
+        text = getattr(error_response, "text", "")
+        logger.exception("LLM request failed status=%s body=%s", status, text[:2000])
+        raise
+    return response.json()
 
 
 async def _call_llm(prompt: str) -> Any:
-    provider, api_key, base_url, model, _, _ = _get_llm_config()
+    slots = _request_slots.get()
+    if slots is None:
+        return await _request_llm(prompt)
+    async with slots:
+        return await _request_llm(prompt)
+
+
+async def _request_llm(prompt: str) -> Any:
+    settings = get_llm_settings()
+    provider, api_key, base_url, model = (
+        settings.provider,
+        settings.api_key,
+        settings.base_url,
+        settings.model,
+    )
+    if not api_key:
+        raise ValueError("Missing LLM_API_KEY/OPENAI_API_KEY/ANTHROPIC_API_KEY")
 
     if provider == "anthropic":
         url = f"{base_url}/v1/messages"
         headers = {
             "x-api-key": api_key,
-            "anthropic-version": os.getenv("LLM_ANTHROPIC_VERSION")
-            or _load_config().get("LLM_ANTHROPIC_VERSION")
-            or "2023-06-01",
+            "anthropic-version": settings.anthropic_version,
         }
         payload = {
             "model": model,
@@ -101,16 +306,7 @@ async def _call_llm(prompt: str) -> Any:
             "messages": [{"role": "user", "content": prompt}],
         }
         logger.info("LLM request provider=%s model=%s url=%s", provider, model, url)
-        async with httpx.AsyncClient(timeout=30) as client:
-            try:
-                response = await client.post(url, headers=headers, json=payload)
-                response.raise_for_status()
-            except httpx.HTTPError as exc:
-                status = getattr(exc.response, "status_code", None)
-                text = getattr(exc.response, "text", "")
-                logger.exception("LLM request failed status=%s body=%s", status, text[:2000])
-                raise
-        data = response.json()
+        data = await _post_json(url, headers, payload)
         content_blocks = data.get("content") or []
         text = content_blocks[0].get("text") if content_blocks else ""
         if not text:
@@ -137,16 +333,7 @@ async def _call_llm(prompt: str) -> Any:
         "response_format": {"type": "json_object"},
     }
     logger.info("LLM request provider=%s model=%s url=%s", provider, model, url)
-    async with httpx.AsyncClient(timeout=30) as client:
-        try:
-            response = await client.post(url, headers=headers, json=payload)
-            response.raise_for_status()
-        except httpx.HTTPError as exc:
-            status = getattr(exc.response, "status_code", None)
-            text = getattr(exc.response, "text", "")
-            logger.exception("LLM request failed status=%s body=%s", status, text[:2000])
-            raise
-    data = response.json()
+    data = await _post_json(url, headers, payload)
     content = data.get("choices", [{}])[0].get("message", {}).get("content", "")
     if not content:
         logger.error("LLM response missing content: %s", data)
@@ -196,235 +383,504 @@ def _coerce_guess_number_answer(value: object) -> int:
     return 0
 
 
-async def generate_questions(payload: schemas.GenerateQuestionsRequest) -> schemas.GeneratedQuestions:
-    rounds = payload.rounds
-    settings = payload.round_settings
-    generated = schemas.GeneratedQuestions()
+CONNECT4_DEFAULT_THEMES = ["general", "science", "history", "pop-culture"]
+CONNECT4_ROW_DIFFICULTIES = ["easy", "medium", "medium-hard", "hard"]
 
-    if "trivia-buzz" in rounds:
-        count = settings.trivia_buzz_questions or 10
-        difficulty = settings.trivia_buzz_difficulty or "medium-hard"
-        prompt = (
-            "Generate trivia questions as JSON with this schema: "
-            '{"questions":[{"text":"...", "answer":"...", "difficulty":"", "category":""}]}. '
-            f"Generate {count} questions. difficulty must be '{difficulty}'."
-        )
-        data = await _call_llm(prompt)
-        questions = [schemas.QuestionOut(id="tmp", **q) for q in data["questions"]]
-        generated.triviaBuzz = _add_ids_to_questions(questions)
 
-    if "lightning" in rounds:
-        count = 20
-        difficulty = settings.lightning_difficulty or "medium-hard"
+def _question_payload(item: dict) -> dict:
+    question = schemas.QuestionOut(id="tmp", **item)
+    return question.model_dump(exclude={"id"})
+
+
+def _to_question(payload: dict) -> schemas.QuestionOut:
+    return schemas.QuestionOut(id=str(uuid.uuid4()), **payload)
+
+
+def _to_guess_number(payload: dict) -> schemas.GuessNumberQuestion:
+    return schemas.GuessNumberQuestion(**payload)
+
+
+def _to_word(payload: dict) -> str:
+    return payload["word"]
+
+
+async def generate_bank_items(round_type: str, difficulty: str, category: str, count: int) -> list[dict]:
+    if round_type in ("trivia-buzz", "lightning"):
+        label = "trivia" if round_type == "trivia-buzz" else "lightning round"
         prompt = (
-            "Generate lightning round questions as JSON with this schema: "
+            f"Generate {label} questions as JSON with this schema: "
             '{"questions":[{"text":"...", "answer":"...", "difficulty":"", "category":""}]}. '
             f"Generate {count} questions. difficulty must be '{difficulty}'."
         )
+        if category:
+            prompt += f" category should be '{category}'."
         data = await _call_llm(prompt)
-        questions = [schemas.QuestionOut(id="tmp", **q) for q in data["questions"]]
-        generated.lightning = _add_ids_to_questions(questions)
+        return [_question_payload(q) for q in data["questions"]]
 
-    if "guess-number" in rounds:
-        count = settings.guess_number_questions or 10
+    if round_type == "guess-number":
         prompt = (
             "Generate estimation questions as JSON with this schema: "
             '{"questions":[{"question":"...", "answer":123}]}. '
             f"Generate {count} questions. Answers must be numbers."
         )
         data = await _call_llm(prompt)
-        generated.guessNumber = [
-            schemas.GuessNumberQuestion(
-                question=q.get("question", ""),
-                answer=_coerce_guess_number_answer(q.get("answer")),
-            )
+        return [
+            {
+                "question": q.get("question", ""),
+                "answer": _coerce_guess_number_answer(q.get("answer")),
+            }
             for q in data["questions"]
         ]
 
-    if "connect-4" in rounds:
-        themes = settings.connect4_themes or ["general", "science", "history", "pop-culture"]
-        base_prompt = (
-            "Generate Connect 4 trivia questions as JSON with this schema: "
-            '{"questions":[{"column":0,"row":0,'
-            '"question":{"text":"...","answer":"...","difficulty":"easy","category":"..."}'
-            "}]}. "
-            "Generate 16 questions for 4 columns (0-3) and 4 rows (0-3). "
-            "Difficulty by row: row0=easy,row1=medium,row2=medium-hard,row3=hard. "
-            f"Column themes by index: {themes}. "
-            "Do NOT ask about the game 'Connect 4' or its rules. "
-            "All questions must be standard trivia within the provided themes."
+    if round_type == "connect-4":
+        prompt = (
+            "Generate trivia questions as JSON with this schema: "
+            '{"questions":[{"text":"...", "answer":"...", "difficulty":"", "category":""}]}. '
+            f"Generate {count} questions. difficulty must be '{difficulty}'. "
+            f"category should be '{category or 'general'}'. "
+            "Do NOT ask about the game 'Connect 4' or its rules."
+        )
+        items: list[dict] = []
+        attempts = 0
+        while len(items) < count and attempts < 3:
+            data = await _call_llm(prompt)
+            for q in data.get("questions", []):
+                if _is_connect4_question(q.get("text", ""), q.get("answer"), q.get("category")):
+                    continue
+                items.append(_question_payload(q))
+            attempts += 1
+        return items
+
+    if round_type == "blind-draw":
+        prompt = (
+            "Generate drawing prompt words as JSON with this schema: "
+            '{"words":["word1","word2"]}. '
+            f"Generate {count} words. difficulty='{difficulty}'."
+        )
+        data = await _call_llm(prompt)
+        return [{"word": str(word)} for word in data["words"]]
+
+    if round_type == "dump-charades":
+        prompt = (
+            "Generate charades prompt words or short phrases as JSON with this schema: "
+            '{"words":["word1","word2"]}. '
+            f"Generate {count} items. difficulty='{difficulty}'. "
+            f"Category='{category or 'general'}'. Avoid explicit or offensive content."
         )
+        data = await _call_llm(prompt)
+        return [{"word": str(word)} for word in data["words"]]
+
+    raise ValueError("Unsupported round type")
+
+
+def _store_generated(
+    db: Session,
+    round_type: str,
+    difficulty: str,
+    category: str,
+    fresh: list[dict],
+    served: int,
+) -> None:
+    crud.add_bank_questions(db, round_type, difficulty, category, fresh[:served], served=True)
+    crud.add_bank_questions(db, round_type, difficulty, category, fresh[served:])
+
+
+async def _take_items(
+    use_bank: bool,
+    round_type: str,
+    difficulty: str,
+    category: str,
+    count: int,
+) -> list[dict]:
+    items: list[dict] = []
+    if use_bank:
+        items = await run_db(crud.take_bank_questions, round_type, difficulty, category, count)
+    if len(items) < count:
+        missing = count - len(items)
+        fresh = await generate_bank_items(round_type, difficulty, category, missing)
+        if use_bank:
+            await run_db(_store_generated, round_type, difficulty, category, fresh, missing)
+        items.extend(fresh[:missing])
+    return items
+
+
+async def _generate_trivia_buzz(use_bank: bool, settings: schemas.RoundSettingsIn) -> list[schemas.QuestionOut]:
+    count = settings.trivia_buzz_questions or 10
+    difficulty = settings.trivia_buzz_difficulty or "medium-hard"
+    items = await _take_items(use_bank, "trivia-buzz", difficulty, "", count)
+    return [_to_question(item) for item in items]
 
-        positions = {(col, row) for col in range(4) for row in range(4)}
-        connect4_map: dict[tuple[int, int], schemas.Connect4Question] = {}
 
-        def add_items(items: list[dict]) -> None:
-            for item in items:
-                column = int(item["column"])
+async def _generate_lightning(use_bank: bool, settings: schemas.RoundSettingsIn) -> list[schemas.QuestionOut]:
+    count = 20
+    difficulty = settings.lightning_difficulty or "medium-hard"
+    items = await _take_items(use_bank, "lightning", difficulty, "", count)
+    return [_to_question(item) for item in items]
+
+
+async def _generate_guess_number(
+    use_bank: bool, settings: schemas.RoundSettingsIn
+) -> list[schemas.GuessNumberQuestion]:
+    count = settings.guess_number_questions or 10
+    items = await _take_items(use_bank, "guess-number", "", "", count)
+    return [_to_guess_number(item) for item in items]
+
+
+CONNECT4_MAX_FILL_ROUNDS = 3
+
+_connect4_fill_stats: deque[dict[str, Any]] = deque(maxlen=50)
+
+
+def get_connect4_fill_stats() -> list[dict[str, Any]]:
+    return list(_connect4_fill_stats)
+
+
+async def _generate_connect4(use_bank: bool, settings: schemas.RoundSettingsIn) -> list[schemas.Connect4Question]:
+    themes = settings.connect4_themes or CONNECT4_DEFAULT_THEMES
+
+    def theme_for(column: int) -> str:
+        return themes[column] if column < len(themes) else "general"
+
+    started = time.perf_counter()
+    positions = {(col, row) for col in range(4) for row in range(4)}
+    connect4_map: dict[tuple[int, int], schemas.Connect4Question] = {}
+    fresh_positions: list[tuple[int, int]] = []
+    fill_stats: dict[str, Any] = {"from_bank": 0, "llm_calls": 0, "fill_rounds": [], "filled": 0}
+
+    if use_bank:
+        cells = [(col, row, CONNECT4_ROW_DIFFICULTIES[row], theme_for(col)) for col, row in sorted(positions)]
+        for (col, row), item in (await run_db(_take_connect4_cells, cells)).items():
+            connect4_map[(col, row)] = schemas.Connect4Question(column=col, row=row, question=_to_question(item))
+        fill_stats["from_bank"] = len(connect4_map)
+
+    def add_items(items: list[dict], column_override: int | None = None) -> None:
+        for item in items:
+            try:
+                column = int(item["column"]) if column_override is None else column_override
                 row = int(item["row"])
-                if (column, row) not in positions:
+                if (column, row) not in positions or (column, row) in connect4_map:
                     continue
                 question_text = item["question"]["text"]
                 answer = item["question"]["answer"]
                 category = item["question"].get("category")
                 if _is_connect4_question(question_text, answer, category):
                     continue
-                connect4_map[(column, row)] = schemas.Connect4Question(
-                    column=column,
-                    row=row,
-                    question=schemas.QuestionOut(
-                        id=str(uuid.uuid4()),
-                        text=question_text,
-                        answer=answer,
-                        difficulty=item["question"]["difficulty"],
-                        category=category,
-                    ),
+                question = schemas.QuestionOut(
+                    id=str(uuid.uuid4()),
+                    text=question_text,
+                    answer=answer,
+                    difficulty=item["question"]["difficulty"],
+                    category=category,
                 )
+            except (KeyError, TypeError, ValueError):
+                logger.warning("Skipping invalid Connect 4 item: %s", str(item)[:500])
+                continue
+            connect4_map[(column, row)] = schemas.Connect4Question(column=column, row=row, question=question)
+            fresh_positions.append((column, row))
 
+    if not connect4_map:
+        base_prompt = (
+            "Generate Connect 4 trivia questions as JSON with this schema: "
+            '{"questions":[{"column":0,"row":0,'
+            '"question":{"text":"...","answer":"...","difficulty":"easy","category":"..."}'
+            "}]}. "
+            "Generate 16 questions for 4 columns (0-3) and 4 rows (0-3). "
+            "Difficulty by row: row0=easy,row1=medium,row2=medium-hard,row3=hard. "
+            f"Column themes by index: {themes}. "
+            "Do NOT ask about the game 'Connect 4' or its rules. "
+            "All questions must be standard trivia within the provided themes."
+        )
+        base_started = time.perf_counter()
         data = await _call_llm(base_prompt)
+        fill_stats["llm_calls"] += 1
         add_items(data.get("questions", []))
+        fill_stats["base_ms"] = round((time.perf_counter() - base_started) * 1000)
 
-        retries = 0
-        while len(connect4_map) < 16 and retries < 3:
-            missing = sorted(list(positions - set(connect4_map.keys())))
-            retry_prompt = (
-                "Generate trivia questions as JSON with this schema: "
-                '{"questions":[{"column":0,"row":0,'
-                '"question":{"text":"...","answer":"...","difficulty":"easy","category":"..."}'
-                "}]}. "
-                f"Only generate questions for these positions: {missing}. "
-                "Do NOT ask about the game 'Connect 4' or its rules. "
-                f"Column themes by index: {themes}."
+    async def fill_column(column: int, rows: list[int]) -> None:
+        row_difficulties = {row: CONNECT4_ROW_DIFFICULTIES[row] for row in rows}
+        prompt = (
+            "Generate trivia questions as JSON with this schema: "
+            '{"questions":[{"row":0,'
+            '"question":{"text":"...","answer":"...","difficulty":"easy","category":"..."}'
+            "}]}. "
+            f"Generate exactly one question for each of these rows: {rows}. "
+            f"Difficulty by row: {row_difficulties}. "
+            f"Every question must be about the theme '{theme_for(column)}'. "
+            "Do NOT ask about the game 'Connect 4' or its rules."
+        )
+        data = await _call_llm(prompt)
+        add_items(data.get("questions", []), column_override=column)
+
+    fill_round = 0
+    while len(connect4_map) < 16 and fill_round < CONNECT4_MAX_FILL_ROUNDS:
+        missing_by_column: dict[int, list[int]] = {}
+        for col, row in sorted(positions - set(connect4_map.keys())):
+            missing_by_column.setdefault(col, []).append(row)
+        round_started = time.perf_counter()
+        results = await asyncio.gather(
+            *(fill_column(col, rows) for col, rows in missing_by_column.items()),
+            return_exceptions=True,
+        )
+        fill_round += 1
+        fill_stats["llm_calls"] += len(results)
+        errors = [result for result in results if isinstance(result, BaseException)]
+        fill_stats["fill_rounds"].append(
+            {
+                "missing": sum(len(rows) for rows in missing_by_column.values()),
+                "calls": len(results),
+                "errors": len(errors),
+                "ms": round((time.perf_counter() - round_started) * 1000),
+            }
+        )
+        for error in errors:
+            if not isinstance(error, Exception):
+                raise error
+            logger.warning("Connect 4 fill call failed: %r", error)
+        if errors and len(errors) == len(results):
+            _record_connect4_fill(fill_stats, started, len(connect4_map))
+            raise errors[0]
+
+    if use_bank and fresh_positions:
+        cells = [
+            (
+                CONNECT4_ROW_DIFFICULTIES[row],
+                theme_for(col),
+                connect4_map[(col, row)].question.model_dump(exclude={"id"}),
             )
-            data = await _call_llm(retry_prompt)
-            add_items(data.get("questions", []))
-            retries += 1
+            for col, row in fresh_positions
+        ]
+        await run_db(_store_connect4_cells, cells)
+
+    _record_connect4_fill(fill_stats, started, len(connect4_map))
+    if len(connect4_map) < 16:
+        raise ValueError("Unable to generate non-Connect-4 trivia for all positions")
+
+    return [connect4_map[(col, row)] for col in range(4) for row in range(4)]
+
+
+def _take_connect4_cells(
+    db: Session, cells: list[tuple[int, int, str, str]]
+) -> dict[tuple[int, int], dict]:
+    taken_cells: dict[tuple[int, int], dict] = {}
+    for col, row, difficulty, theme in cells:
+        taken = crud.take_bank_questions(db, "connect-4", difficulty, theme, 1)
+        if taken:
+            taken_cells[(col, row)] = taken[0]
+    return taken_cells
+
+
+def _store_connect4_cells(db: Session, cells: list[tuple[str, str, dict]]) -> None:
+    for difficulty, theme, item in cells:
+        crud.add_bank_questions(db, "connect-4", difficulty, theme, [item], served=True)
+
+
+def _record_connect4_fill(fill_stats: dict[str, Any], started: float, filled: int) -> None:
+    fill_stats["filled"] = filled
+    fill_stats["total_ms"] = round((time.perf_counter() - started) * 1000)
+    _connect4_fill_stats.append(fill_stats)
+    logger.info(
+        "Connect 4 fill filled=%s from_bank=%s llm_calls=%s fill_rounds=%s total_ms=%s",
+        filled,
+        fill_stats["from_bank"],
+        fill_stats["llm_calls"],
+        len(fill_stats["fill_rounds"]),
+        fill_stats["total_ms"],
+    )
 
-        if len(connect4_map) < 16:
-            raise ValueError("Unable to generate non-Connect-4 trivia for all positions")
 
-        generated.connect4 = [connect4_map[(col, row)] for col in range(4) for row in range(4)]
+async def _generate_blind_draw(use_bank: bool, settings: schemas.RoundSettingsIn) -> list[str]:
+    count = settings.blind_draw_word_count or 5
+    difficulty = settings.blind_draw_difficulty or "medium-hard"
+    items = await _take_items(use_bank, "blind-draw", difficulty, "", count)
+    return [_to_word(item) for item in items]
 
-    if "blind-draw" in rounds:
-        count = settings.blind_draw_word_count or 5
-        difficulty = settings.blind_draw_difficulty or "medium-hard"
-        prompt = (
-            "Generate drawing prompt words as JSON with this schema: "
-            '{"words":["word1","word2"]}. '
-            f"Generate {count} words. difficulty='{difficulty}'."
-        )
-        data = await _call_llm(prompt)
-        generated.blindDraw = list(data["words"])
 
-    if "dump-charades" in rounds:
-        count = settings.blind_draw_word_count or 5
-        difficulty = settings.dump_charades_difficulty or "medium-hard"
-        category = (settings.dump_charades_category or "general").strip()
-        prompt = (
-            "Generate charades prompt words or short phrases as JSON with this schema: "
-            '{"words":["word1","word2"]}. '
-            f"Generate {count} items. difficulty='{difficulty}'. "
-            f"Category='{category}'. Avoid explicit or offensive content."
-        )
-        data = await _call_llm(prompt)
-        generated.dumpCharades = list(data["words"])
+async def _generate_dump_charades(use_bank: bool, settings: schemas.RoundSettingsIn) -> list[str]:
+    count = settings.blind_draw_word_count or 5
+    difficulty = settings.dump_charades_difficulty or "medium-hard"
+    category = (settings.dump_charades_category or "general").strip()
+    items = await _take_items(use_bank, "dump-charades", difficulty, category, count)
+    return [_to_word(item) for item in items]
+
+
+RoundGenerator = Callable[[bool, schemas.RoundSettingsIn], Awaitable[list]]
 
+ROUND_GENERATORS: dict[str, tuple[str, RoundGenerator]] = {
+    "trivia-buzz": ("triviaBuzz", _generate_trivia_buzz),
+    "lightning": ("lightning", _generate_lightning),
+    "guess-number": ("guessNumber", _generate_guess_number),
+    "connect-4": ("connect4", _generate_connect4),
+    "blind-draw": ("blindDraw", _generate_blind_draw),
+    "dump-charades": ("dumpCharades", _generate_dump_charades),
+}
+
+
+def bank_seed_pools(settings: LLMSettings) -> set[tuple[str, str, str]]:
+    pools: set[tuple[str, str, str]] = set()
+    for round_type in settings.bank_seed_rounds:
+        if round_type == "guess-number":
+            pools.add((round_type, "", ""))
+        elif round_type == "connect-4":
+            themes = settings.bank_seed_categories or CONNECT4_DEFAULT_THEMES
+            pools.update(
+                (round_type, difficulty, theme) for difficulty in CONNECT4_ROW_DIFFICULTIES for theme in themes
+            )
+        elif round_type == "dump-charades":
+            categories = settings.bank_seed_categories or ("general",)
+            pools.update(
+                (round_type, difficulty, category)
+                for difficulty in settings.bank_seed_difficulties
+                for category in categories
+            )
+        elif round_type in ROUND_GENERATORS:
+            pools.update((round_type, difficulty, "") for difficulty in settings.bank_seed_difficulties)
+    return pools
+
+
+_live_requests = 0
+
+
+def live_request_count() -> int:
+    return _live_requests
+
+
+@contextmanager
+def _track_live_request() -> Iterator[None]:
+    global _live_requests
+    _live_requests += 1
+    try:
+        yield
+    finally:
+        _live_requests -= 1
+
+
+async def iter_generated_rounds(
+    payload: schemas.GenerateQuestionsRequest,
+    use_bank: bool = False,
+) -> AsyncIterator[tuple[str, list | Exception]]:
+    settings = payload.round_settings
+    round_types = [round_type for round_type in ROUND_GENERATORS if round_type in payload.rounds]
+
+    async def run_round(round_type: str) -> tuple[str, list | Exception]:
+        _, generator = ROUND_GENERATORS[round_type]
+        try:
+            return round_type, await generator(use_bank, settings)
+        except Exception as exc:
+            logger.error("Question generation failed round=%s error=%r", round_type, exc)
+            return round_type, exc
+
+    with _track_live_request():
+        token = _request_slots.set(asyncio.Semaphore(get_llm_settings().max_concurrency))
+        try:
+            tasks = [asyncio.create_task(run_round(round_type)) for round_type in round_types]
+        finally:
+            _request_slots.reset(token)
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+
+def round_section(round_type: str, questions: list) -> schemas.GeneratedQuestions:
+    field, _ = ROUND_GENERATORS[round_type]
+    return schemas.GeneratedQuestions(**{field: questions})
+
+
+async def generate_questions(
+    payload: schemas.GenerateQuestionsRequest,
+    use_bank: bool = False,
+) -> schemas.GeneratedQuestions:
+    results = {
+        round_type: result async for round_type, result in iter_generated_rounds(payload, use_bank)
+    }
+
+    generated = schemas.GeneratedQuestions()
+    errors: dict[str, str] = {}
+    failures: list[Exception] = []
+    for round_type in ROUND_GENERATORS:
+        if round_type not in results:
+            continue
+        result = results[round_type]
+        if isinstance(result, Exception):
+            errors[round_type] = str(result) or type(result).__name__
+            failures.append(result)
+            continue
+        field, _ = ROUND_GENERATORS[round_type]
+        setattr(generated, field, result)
+
+    if failures and len(failures) == len(results):
+        raise failures[0]
+    if errors:
+        generated.errors = errors
     return generated
 
 
 def get_llm_summary() -> tuple[str, str, str, str, bool, bool]:
-    provider, api_key, base_url, model, config_path, using_env = _get_llm_config()
-    key_present = bool(api_key)
-    return provider, base_url, model, config_path, using_env, key_present
+    settings = get_llm_settings()
+    return (
+        settings.provider,
+        settings.base_url,
+        settings.model,
+        settings.config_path,
+        settings.using_env,
+        bool(settings.api_key),
+    )
+
 
+async def regenerate_question(
+    payload: schemas.RegenerateQuestionRequest,
+    use_bank: bool = False,
+) -> schemas.RegenerateQuestionResponse:
+    with _track_live_request():
+        return await _regenerate_question(payload, use_bank)
 
-async def regenerate_question(payload: schemas.RegenerateQuestionRequest) -> schemas.RegenerateQuestionResponse:
+
+async def _regenerate_question(
+    payload: schemas.RegenerateQuestionRequest,
+    use_bank: bool,
+) -> schemas.RegenerateQuestionResponse:
     round_type = payload.round_type
+    difficulty = payload.difficulty or "medium-hard"
     if round_type in ("trivia-buzz", "lightning"):
-        difficulty = payload.difficulty or "medium-hard"
-        prompt = (
-            "Generate ONE trivia question as JSON with this schema: "
-            '{"question":{"text":"...", "answer":"...", "difficulty":"", "category":""}}. '
-            f"difficulty must be '{difficulty}'."
-        )
-        data = await _call_llm(prompt)
-        question = schemas.QuestionOut(
-            id=str(uuid.uuid4()),
-            text=data["question"]["text"],
-            answer=data["question"]["answer"],
-            difficulty=data["question"]["difficulty"],
-            category=data["question"].get("category"),
-        )
-        return schemas.RegenerateQuestionResponse(round_type=round_type, question=question)
+        items = await _take_items(use_bank, round_type, difficulty, payload.category or "", 1)
+        if not items:
+            raise ValueError("LLM returned no question")
+        return schemas.RegenerateQuestionResponse(round_type=round_type, question=_to_question(items[0]))
 
     if round_type == "guess-number":
-        prompt = (
-            "Generate ONE estimation question as JSON with this schema: "
-            '{"question":{"question":"...", "answer":123}}.'
-        )
-        data = await _call_llm(prompt)
+        items = await _take_items(use_bank, round_type, "", "", 1)
+        if not items:
+            raise ValueError("LLM returned no question")
         return schemas.RegenerateQuestionResponse(
             round_type=round_type,
-            guess_number=schemas.GuessNumberQuestion(
-                question=data["question"].get("question", ""),
-                answer=_coerce_guess_number_answer(data["question"].get("answer")),
-            ),
+            guess_number=_to_guess_number(items[0]),
         )
 
     if round_type == "connect-4":
-        difficulty = payload.difficulty or "medium-hard"
-        category = payload.category or "general"
-        prompt = (
-            "Generate ONE trivia question as JSON with this schema: "
-            '{"question":{"text":"...", "answer":"...", "difficulty":"", "category":""}}. '
-            f"difficulty must be '{difficulty}'. category should be '{category}'. "
-            "Do NOT ask about the game 'Connect 4' or its rules."
-        )
-        attempts = 0
-        question = None
-        while attempts < 3:
-            data = await _call_llm(prompt)
-            candidate = data["question"]
-            if not _is_connect4_question(candidate["text"], candidate["answer"], candidate.get("category")):
-                question = schemas.QuestionOut(
-                    id=str(uuid.uuid4()),
-                    text=candidate["text"],
-                    answer=candidate["answer"],
-                    difficulty=candidate["difficulty"],
-                    category=candidate.get("category"),
-                )
-                break
-            attempts += 1
-        if not question:
+        items = await _take_items(use_bank, round_type, difficulty, payload.category or "general", 1)
+        if not items:
             raise ValueError("LLM returned Connect-4-specific question")
         return schemas.RegenerateQuestionResponse(
             round_type=round_type,
             connect4=schemas.Connect4Question(
                 column=payload.column or 0,
                 row=payload.row or 0,
-                question=question,
+                question=_to_question(items[0]),
             ),
         )
 
     if round_type == "blind-draw":
-        difficulty = payload.difficulty or "medium-hard"
-        prompt = (
-            "Generate ONE drawing word as JSON with this schema: "
-            '{"word":"..."} '
-            f"difficulty='{difficulty}'."
-        )
-        data = await _call_llm(prompt)
-        return schemas.RegenerateQuestionResponse(round_type=round_type, word=data["word"])
+        items = await _take_items(use_bank, round_type, difficulty, "", 1)
+        if not items:
+            raise ValueError("LLM returned no word")
+        return schemas.RegenerateQuestionResponse(round_type=round_type, word=_to_word(items[0]))
 
     if round_type == "dump-charades":
-        difficulty = payload.difficulty or "medium-hard"
-        category = payload.category or "general"
-        prompt = (
-            "Generate ONE charades prompt as JSON with this schema: "
-            '{"word":"..."} '
-            f"difficulty='{difficulty}'. Category='{category}'."
-        )
-        data = await _call_llm(prompt)
-        return schemas.RegenerateQuestionResponse(round_type=round_type, word=data["word"])
+        items = await _take_items(use_bank, round_type, difficulty, payload.category or "general", 1)
+        if not items:
+            raise ValueError("LLM returned no word")
+        return schemas.RegenerateQuestionResponse(round_type=round_type, word=_to_word(items[0]))
 
     raise ValueError("Unsupported round type")
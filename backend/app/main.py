@@ -1,21 +1,47 @@
+import asyncio
 import os
-from typing import Generator
+import secrets
+import time
+from typing import Any, AsyncIterator, Generator
 
 import httpx
 import logging
 
-from fastapi import Depends, FastAPI, HTTPException, WebSocket, WebSocketDisconnect, status
+from fastapi import Depends, FastAPI, Header, HTTPException, Request, WebSocket, WebSocketDisconnect, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response, StreamingResponse
+from pydantic import ValidationError
 from sqlalchemy.orm import Session
 
-from . import crud, models, schemas
-from .database import Base, SessionLocal, engine
-from .llm import generate_questions, regenerate_question
-from .ws import manager
+from . import crud, schemas
+from .broadcaster import build_snapshot, snapshot_scheduler
+from .buzz import buzz_arbiter
+from .cache import GameView, game_cache
+from .database import SessionLocal, dispose_engines, engine, run_db
+from .llm import (
+    close_http_client,
+    generate_questions,
+    get_connect4_fill_stats,
+    get_http_pool_stats,
+    get_llm_summary,
+    init_http_client,
+    iter_generated_rounds,
+    load_llm_settings,
+    regenerate_question,
+    round_section,
+)
+from .migrations import run_migrations
+from .refill import refill_worker
+from .snapshots import ROLES, game_payload, player_payload, project_for_role, state_payload
+from .timers import timer_scheduler
+from .ws import ENCODERS, decode_msgpack, manager
 
 logger = logging.getLogger(__name__)
 uvicorn_logger = logging.getLogger("uvicorn.error")
 
+ADMIN_TOKEN = os.getenv("ADMIN_TOKEN", "").strip()
+HOST_AUTH_TIMEOUT_SECONDS = float(os.getenv("WS_HOST_AUTH_TIMEOUT_SECONDS", "5"))
+
 
 def get_db() -> Generator[Session, None, None]:
     db = SessionLocal()
@@ -25,6 +51,13 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+def require_admin(x_admin_token: str | None = Header(default=None)) -> None:
+    if not ADMIN_TOKEN:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    if not x_admin_token or not secrets.compare_digest(x_admin_token, ADMIN_TOKEN):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid admin token")
+
+
 def create_app() -> FastAPI:
     app = FastAPI(title="Game Show Backend", version="1.0.0")
 
@@ -41,10 +74,20 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
+    def apply_remote_change(game_id: str, message: dict[str, Any]) -> None:
+        if message["kind"] == "invalidate":
+            game_cache.invalidate(game_id)
+            buzz_arbiter.forget(game_id)
+        elif message["payload"].get("type") == "timer":
+            timer_scheduler.mirror(game_id, message["payload"])
+
+    buzz_arbiter.shared = manager.shared
+    manager.on_remote(apply_remote_change)
+
     @app.on_event("startup")
-    def on_startup() -> None:
-        Base.metadata.create_all(bind=engine)
-        from .llm import get_llm_summary
+    async def on_startup() -> None:
+        run_migrations(engine)
+        load_llm_settings()
         provider, base_url, model, config_path, using_env, key_present = get_llm_summary()
         source = "env" if using_env else "file"
         logger.info(
@@ -65,6 +108,41 @@ def create_app() -> FastAPI:
             config_path,
             key_present,
         )
+        init_http_client()
+        await manager.start()
+        refill_worker.start()
+        timer_scheduler.start()
+
+    @app.on_event("shutdown")
+    async def on_shutdown() -> None:
+        await refill_worker.stop()
+        await timer_scheduler.stop()
+        await buzz_arbiter.drain()
+        await snapshot_scheduler.drain()
+        await manager.stop()
+        await close_http_client()
+        await dispose_engines()
+
+    def conditional_response(
+        request: Request,
+        response: Response,
+        view: GameView,
+        content: Any,
+        suffix: str = "",
+    ) -> Any:
+        etag = game_cache.etag(view, suffix)
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        response.headers.update(headers)
+        return content
+
+    def etag_matches(header: str | None, etag: str) -> bool:
+        if not header:
+            return False
+        if header.strip() == "*":
+            return True
+        return etag.removeprefix("W/") in {tag.strip().removeprefix("W/") for tag in header.split(",")}
 
     def _normalize_code(raw: str) -> str:
         return "".join([c for c in raw.upper() if c.isalpha()])
@@ -73,267 +151,435 @@ def create_app() -> FastAPI:
     def health_check() -> dict:
         return {"status": "ok"}
 
+    @app.get("/api/admin/llm/pool", dependencies=[Depends(require_admin)])
+    def llm_pool_stats() -> dict:
+        return get_http_pool_stats()
+
+    @app.post("/api/admin/llm/reload", dependencies=[Depends(require_admin)])
+    def reload_llm_config() -> dict:
+        load_llm_settings()
+        provider, base_url, model, config_path, using_env, key_present = get_llm_summary()
+        logger.info("LLM config reloaded provider=%s base_url=%s model=%s", provider, base_url, model)
+        return {
+            "provider": provider,
+            "base_url": base_url,
+            "model": model,
+            "source": "env" if using_env else "file",
+            "config_path": config_path,
+            "key_present": key_present,
+        }
+
+    @app.get("/api/admin/ws", dependencies=[Depends(require_admin)])
+    def websocket_stats() -> dict:
+        return {
+            "connections": manager.connection_count(),
+            "lagging": manager.lagging_count(),
+            **manager.stats,
+            "broadcast": manager.backend_stats(),
+            "snapshots": snapshot_scheduler.metrics(),
+        }
+
+    @app.get("/api/admin/buzz", dependencies=[Depends(require_admin)])
+    def buzz_stats() -> dict:
+        return buzz_arbiter.metrics()
+
+    @app.get("/api/admin/timers", dependencies=[Depends(require_admin)])
+    def timer_stats() -> dict:
+        return timer_scheduler.metrics()
+
+    @app.get("/api/admin/cache", dependencies=[Depends(require_admin)])
+    def game_cache_stats() -> dict:
+        return game_cache.metrics()
+
+    @app.get("/api/admin/llm/connect4-fills", dependencies=[Depends(require_admin)])
+    def connect4_fill_stats() -> list[dict]:
+        return get_connect4_fill_stats()
+
+    @app.get("/api/admin/question-bank", dependencies=[Depends(require_admin)])
+    def question_bank_stats(db: Session = Depends(get_db)) -> dict:
+        levels = crud.get_bank_stock_levels(db)
+        return {
+            "pools": [
+                {
+                    "round_type": round_type,
+                    "difficulty": difficulty,
+                    "category": category,
+                    "available": available,
+                }
+                for (round_type, difficulty, category), available in sorted(levels.items())
+            ],
+            "refill": refill_worker.stats(),
+        }
+
     @app.post("/api/questions/generate", response_model=schemas.GeneratedQuestions)
     async def generate_questions_endpoint(
         payload: schemas.GenerateQuestionsRequest,
     ) -> schemas.GeneratedQuestions:
         try:
-            return await generate_questions(payload)
+            return await generate_questions(payload, use_bank=True)
         except ValueError as exc:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
         except httpx.HTTPError as exc:
             logger.exception("Question generation failed")
             raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail=str(exc)) from exc
+        finally:
+            refill_worker.wake()
+
+    @app.post("/api/questions/generate/stream")
+    async def generate_questions_stream_endpoint(
+        payload: schemas.GenerateQuestionsRequest,
+        request: Request,
+    ) -> StreamingResponse:
+        use_sse = "text/event-stream" in request.headers.get("accept", "")
+
+        def encode(event: schemas.GeneratedQuestionsEvent) -> str:
+            line = event.model_dump_json(exclude_none=True)
+            if use_sse:
+                return f"event: {event.type}\ndata: {line}\n\n"
+            return f"{line}\n"
+
+        async def events() -> AsyncIterator[str]:
+            errors: dict[str, str] = {}
+            try:
+                async for round_type, result in iter_generated_rounds(payload, use_bank=True):
+                    if isinstance(result, Exception):
+                        errors[round_type] = str(result) or type(result).__name__
+                        yield encode(
+                            schemas.GeneratedQuestionsEvent(
+                                type="error", round_type=round_type, detail=errors[round_type]
+                            )
+                        )
+                        continue
+                    yield encode(
+                        schemas.GeneratedQuestionsEvent(
+                            type="round",
+                            round_type=round_type,
+                            questions=round_section(round_type, result),
+                        )
+                    )
+                yield encode(schemas.GeneratedQuestionsEvent(type="done", errors=errors or None))
+            finally:
+                refill_worker.wake()
+
+        media_type = "text/event-stream" if use_sse else "application/x-ndjson"
+        return StreamingResponse(
+            events(),
+            media_type=media_type,
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
 
     @app.post("/api/questions/regenerate", response_model=schemas.RegenerateQuestionResponse)
     async def regenerate_question_endpoint(
         payload: schemas.RegenerateQuestionRequest,
     ) -> schemas.RegenerateQuestionResponse:
         try:
-            return await regenerate_question(payload)
+            return await regenerate_question(payload, use_bank=True)
         except ValueError as exc:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
         except httpx.HTTPError as exc:
             logger.exception("Question regeneration failed")
             raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail=str(exc)) from exc
+        finally:
+            refill_worker.wake()
+
+    async def broadcast_snapshot(game_id: str, immediate: bool = False) -> None:
+        await snapshot_scheduler.schedule(game_id, immediate=immediate)
 
-    async def broadcast_snapshot(db: Session, game_id: str) -> None:
-        game = crud.get_game(db, game_id)
-        state = crud.get_game_state(db, game_id)
-        if not game:
+    async def handle_ws_message(game_id: str, websocket: WebSocket, raw: str | bytes) -> None:
+        try:
+            if isinstance(raw, bytes):
+                message = schemas.ws_inbound_adapter.validate_python(decode_msgpack(raw))
+            else:
+                message = schemas.ws_inbound_adapter.validate_json(raw)
+        except ValidationError as exc:
+            manager.send(game_id, websocket, {"type": "error", "detail": exc.errors(include_url=False)[0]["msg"]})
             return
-        teams = crud.get_teams_for_game(db, game_id)
-        players = crud.get_players_for_game(db, game_id)
-        payload = {
-            "type": "snapshot",
-            "data": {
-                "game": schemas.GameOut.model_validate(game).model_dump(),
-                "teams": [
-                    schemas.TeamOut(
-                        id=team.id,
-                        name=team.name,
-                        color=team.color,
-                        score=team.score,
-                        players=[player.name for player in team.players],
-                    ).model_dump()
-                    for team in teams
-                ],
-                "game_state": schemas.GameStateOut.model_validate(state).model_dump()
-                if state
-                else None,
-                "players": [
-                    schemas.PlayerStatusOut.model_validate(player).model_dump()
-                    for player in players
-                ],
-            },
-        }
-        await manager.broadcast(game_id, payload)
+        except Exception:
+            manager.send(game_id, websocket, {"type": "error", "detail": "Invalid MessagePack frame"})
+            return
+        if isinstance(message, schemas.WsBuzzMessage):
+            await handle_ws_buzz(game_id, websocket, message)
+        elif isinstance(message, schemas.WsPingMessage):
+            manager.send(
+                game_id,
+                websocket,
+                {"type": "pong", "id": message.id, "sent_at": message.sent_at, "server_time": time.time()},
+            )
+        elif isinstance(message, schemas.WsAckMessage):
+            manager.ack(game_id, websocket, message.version)
+        else:
+            await resync(game_id, websocket)
+
+    async def handle_ws_buzz(game_id: str, websocket: WebSocket, message: schemas.WsBuzzMessage) -> None:
+        success, detail = await buzz_arbiter.submit(
+            game_id=game_id,
+            team_id=message.team_id,
+            player_id=message.player_id,
+            player_name=message.player_name,
+            question_text=message.question_text,
+        )
+        manager.send(
+            game_id,
+            websocket,
+            {"type": "buzz_result", "id": message.id, "success": success, "message": detail},
+        )
+        if success:
+            await broadcast_snapshot(game_id, immediate=True)
+
+    async def resync(game_id: str, websocket: WebSocket) -> None:
+        if await manager.resync(game_id, websocket):
+            return
+        await broadcast_snapshot(game_id, immediate=True)
+
+    async def is_host(game_id: str, host_pin: str | None) -> bool:
+        view = await game_cache.aget(game_id)
+        if view is None:
+            return False
+        round_data = (view.game_state or {}).get("round_data") or {}
+        host_pin_hash = (round_data.get("game_setup") or {}).get("host_pin_hash")
+        if not host_pin_hash or not host_pin:
+            return False
+        return secrets.compare_digest(crud._hash_host_pin(game_id, host_pin), host_pin_hash)
+
+    async def authenticate_host(game_id: str, websocket: WebSocket, encoding: str) -> bool:
+        try:
+            frame = await asyncio.wait_for(websocket.receive(), timeout=HOST_AUTH_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            return False
+        if frame["type"] == "websocket.disconnect":
+            raise WebSocketDisconnect(frame.get("code", 1000))
+        raw = frame.get("text")
+        if raw is None and encoding == "msgpack":
+            raw = frame.get("bytes")
+        try:
+            if isinstance(raw, bytes):
+                message = schemas.WsAuthMessage.model_validate(decode_msgpack(raw))
+            else:
+                message = schemas.WsAuthMessage.model_validate_json(raw or "")
+        except Exception:
+            return False
+        return await is_host(game_id, message.host_pin)
 
     @app.websocket("/ws/games/{game_id}")
-    async def game_ws(game_id: str, websocket: WebSocket) -> None:
-        await manager.connect(game_id, websocket)
+    async def game_ws(
+        game_id: str,
+        websocket: WebSocket,
+        protocol: str = "snapshot",
+        encoding: str = "json",
+        role: str = "player",
+    ) -> None:
+        if encoding not in ENCODERS:
+            await websocket.close(code=status.WS_1003_UNSUPPORTED_DATA, reason=f"Unsupported encoding '{encoding}'")
+            return
+        if role not in ROLES:
+            await websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason=f"Unknown role '{role}'")
+            return
+        if role == "host":
+            await websocket.accept()
+            try:
+                authorized = await authenticate_host(game_id, websocket, encoding)
+            except WebSocketDisconnect:
+                return
+            if not authorized:
+                await websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason="Invalid host pin")
+                return
+        delta = protocol == "delta"
+        await manager.connect(game_id, websocket, delta=delta, encoding=encoding, role=role, accepted=role == "host")
+        snapshot = await build_snapshot(game_id)
+        if snapshot is not None:
+            manager.send_snapshot(game_id, websocket, snapshot)
+        for timer in timer_scheduler.active(game_id):
+            manager.send(game_id, websocket, timer.event("started"))
         try:
             while True:
-                await websocket.receive_text()
+                frame = await websocket.receive()
+                if frame["type"] == "websocket.disconnect":
+                    raise WebSocketDisconnect(frame.get("code", 1000))
+                raw = frame.get("text")
+                if raw is None and encoding == "msgpack":
+                    raw = frame.get("bytes")
+                await handle_ws_message(game_id, websocket, raw or "")
         except WebSocketDisconnect:
             manager.disconnect(game_id, websocket)
 
     @app.post("/api/games", response_model=schemas.GameCreateResponse)
-    async def create_game(payload: schemas.GameCreate, db: Session = Depends(get_db)) -> schemas.GameCreateResponse:
+    async def create_game(payload: schemas.GameCreate) -> dict[str, Any]:
         try:
-            game, teams = crud.create_game(db, payload)
+            game, _ = await run_db(crud.create_game, payload)
         except ValueError as exc:
             raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc)) from exc
 
-        team_out = [
-            schemas.TeamOut(
-                id=team.id,
-                name=team.name,
-                color=team.color,
-                score=team.score,
-                players=[player.name for player in team.players],
-            )
-            for team in teams
-        ]
-        response = schemas.GameCreateResponse(
-            game=schemas.GameOut.model_validate(game),
-            teams=team_out,
-        )
-        await broadcast_snapshot(db, game.id)
+        view = await game_cache.aget(game.id)
+        response = {"game": view.game, "teams": view.teams}
+        await broadcast_snapshot(game.id)
         return response
 
     @app.post("/api/games/{code}/join", response_model=schemas.PlayerOut)
     async def join_game(
         code: str,
         payload: schemas.PlayerJoinRequest,
-        db: Session = Depends(get_db),
-    ) -> schemas.PlayerOut:
-        game = crud.get_game_by_code(db, _normalize_code(code))
-        if not game:
+    ) -> dict[str, Any]:
+        view = await game_cache.aget_by_code(_normalize_code(code))
+        if view is None:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Game not found")
 
-        team = db.get(models.Team, payload.team_id)
-        if not team or team.game_id != game.id:
+        if not any(team["id"] == payload.team_id for team in view.teams):
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid team")
 
-        player = crud.create_player(db, game.id, payload.team_id, payload.player_name)
-        await broadcast_snapshot(db, game.id)
-        return schemas.PlayerOut.model_validate(player)
+        game_id = view.game["id"]
+        player = await run_db(crud.create_player, game_id, payload.team_id, payload.player_name)
+        await broadcast_snapshot(game_id)
+        return player_payload(player)
 
     @app.get("/api/games/{game_id}", response_model=schemas.GameWithTeams)
-    def get_game(game_id: str, db: Session = Depends(get_db)) -> schemas.GameWithTeams:
-        game = crud.get_game(db, game_id)
-        if not game:
+    def get_game(game_id: str, request: Request, response: Response, db: Session = Depends(get_db)) -> Any:
+        view = game_cache.get(db, game_id)
+        if view is None:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Game not found")
+        return conditional_response(request, response, view, {"game": view.game, "teams": view.teams})
 
-        teams = crud.get_teams_for_game(db, game_id)
-        team_out = [
-            schemas.TeamOut(
-                id=team.id,
-                name=team.name,
-                color=team.color,
-                score=team.score,
-                players=[player.name for player in team.players],
-            )
-            for team in teams
-        ]
-        return schemas.GameWithTeams(game=schemas.GameOut.model_validate(game), teams=team_out)
+    @app.get("/api/games/{game_id}/bundle", response_model=schemas.GameBundle)
+    async def get_game_bundle(
+        game_id: str,
+        request: Request,
+        response: Response,
+        role: str = "player",
+        x_host_pin: str | None = Header(default=None),
+    ) -> Any:
+        view = await game_cache.aget(game_id)
+        if view is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Game not found")
+        if role not in ROLES:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Unknown role '{role}'")
+        if role == "host" and not await is_host(game_id, x_host_pin):
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Invalid host pin")
+        content = {"game": view.game, "teams": view.teams, "game_state": view.game_state, "players": view.players}
+        return conditional_response(request, response, view, project_for_role(content, role), suffix=f"-{role}")
 
     @app.patch("/api/games/{game_id}", response_model=schemas.GameOut)
     async def update_game(
         game_id: str,
         updates: schemas.GameUpdate,
-        db: Session = Depends(get_db),
-    ) -> schemas.GameOut:
+    ) -> dict[str, Any]:
         try:
-            game = crud.update_game(db, game_id, updates)
+            game = await run_db(crud.update_game, game_id, updates)
         except ValueError as exc:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
-        await broadcast_snapshot(db, game_id)
-        return schemas.GameOut.model_validate(game)
+        await broadcast_snapshot(game_id)
+        return game_payload(game)
 
     @app.get("/api/games/code/{code}", response_model=schemas.GameWithTeams)
-    def get_game_by_code(code: str, db: Session = Depends(get_db)) -> schemas.GameWithTeams:
-        game = crud.get_game_by_code(db, _normalize_code(code))
-        if not game:
+    def get_game_by_code(code: str, request: Request, response: Response, db: Session = Depends(get_db)) -> Any:
+        view = game_cache.get_by_code(db, _normalize_code(code))
+        if view is None:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Game not found")
-
-        teams = crud.get_teams_for_game(db, game.id)
-        team_out = [
-            schemas.TeamOut(
-                id=team.id,
-                name=team.name,
-                color=team.color,
-                score=team.score,
-                players=[player.name for player in team.players],
-            )
-            for team in teams
-        ]
-        return schemas.GameWithTeams(game=schemas.GameOut.model_validate(game), teams=team_out)
+        return conditional_response(request, response, view, {"game": view.game, "teams": view.teams})
 
     @app.post("/api/games/code/{code}/host", response_model=schemas.GameWithTeams)
     def get_game_by_code_host(
         code: str,
         payload: schemas.HostJoinRequest,
         db: Session = Depends(get_db),
-    ) -> schemas.GameWithTeams:
-        game = crud.get_game_by_code(db, _normalize_code(code))
-        if not game:
+    ) -> dict[str, Any]:
+        view = game_cache.get_by_code(db, _normalize_code(code))
+        if view is None:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Game not found")
 
-        state = crud.get_game_state(db, game.id)
-        round_data = (state.round_data or {}) if state else {}
+        round_data = (view.game_state or {}).get("round_data") or {}
         setup_data = dict(round_data.get("game_setup") or {})
         host_pin_hash = setup_data.get("host_pin_hash")
         if not host_pin_hash:
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Host pin not set")
 
-        incoming_hash = crud._hash_host_pin(game.id, payload.host_pin)
+        incoming_hash = crud._hash_host_pin(view.game["id"], payload.host_pin)
         if incoming_hash != host_pin_hash:
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Invalid host pin")
 
-        teams = crud.get_teams_for_game(db, game.id)
-        team_out = [
-            schemas.TeamOut(
-                id=team.id,
-                name=team.name,
-                color=team.color,
-                score=team.score,
-                players=[player.name for player in team.players],
-            )
-            for team in teams
-        ]
-        return schemas.GameWithTeams(game=schemas.GameOut.model_validate(game), teams=team_out)
+        return {"game": view.game, "teams": view.teams}
 
 
     @app.get("/api/games/{game_id}/teams", response_model=list[schemas.TeamOut])
-    def get_teams(game_id: str, db: Session = Depends(get_db)) -> list[schemas.TeamOut]:
-        teams = crud.get_teams_for_game(db, game_id)
-        if not teams:
+    def get_teams(game_id: str, request: Request, response: Response, db: Session = Depends(get_db)) -> Any:
+        view = game_cache.get(db, game_id)
+        if view is None or not view.teams:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Game or teams not found")
-        return [
-            schemas.TeamOut(
-                id=team.id,
-                name=team.name,
-                color=team.color,
-                score=team.score,
-                players=[player.name for player in team.players],
-            )
-            for team in teams
-        ]
+        return conditional_response(request, response, view, view.teams)
 
     @app.get("/api/games/{game_id}/players", response_model=list[schemas.PlayerStatusOut])
-    def get_players(game_id: str, db: Session = Depends(get_db)) -> list[schemas.PlayerStatusOut]:
-        players = crud.get_players_for_game(db, game_id)
-        return [schemas.PlayerStatusOut.model_validate(player) for player in players]
+    def get_players(game_id: str, request: Request, response: Response, db: Session = Depends(get_db)) -> Any:
+        view = game_cache.get(db, game_id)
+        if view is None:
+            return []
+        return conditional_response(request, response, view, view.players)
 
     @app.get("/api/games/{game_id}/state", response_model=schemas.GameStateOut)
-    def get_game_state(game_id: str, db: Session = Depends(get_db)) -> schemas.GameStateOut:
-        state = crud.get_game_state(db, game_id)
-        if not state:
+    async def get_game_state(
+        game_id: str,
+        request: Request,
+        response: Response,
+        x_host_pin: str | None = Header(default=None),
+    ) -> Any:
+        view = await game_cache.aget(game_id)
+        if view is None or view.game_state is None:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Game state not found")
-        return schemas.GameStateOut.model_validate(state)
+        role = "player"
+        if x_host_pin is not None:
+            if not await is_host(game_id, x_host_pin):
+                raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Invalid host pin")
+            role = "host"
+        content = project_for_role({"game_state": view.game_state}, role)["game_state"]
+        return conditional_response(request, response, view, content, suffix=f"-{role}")
 
     @app.patch("/api/games/{game_id}/state", response_model=schemas.GameStateOut)
     async def update_game_state(
         game_id: str,
         updates: schemas.GameStateUpdate,
-        db: Session = Depends(get_db),
-    ) -> schemas.GameStateOut:
+    ) -> dict[str, Any]:
         try:
-            state = crud.update_game_state(db, game_id, updates)
+            async with buzz_arbiter.host_write(game_id):
+                state = await run_db(crud.update_game_state, game_id, updates)
         except ValueError as exc:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
-        await broadcast_snapshot(db, game_id)
-        return schemas.GameStateOut.model_validate(state)
+        await broadcast_snapshot(game_id)
+        return state_payload(state)
 
     @app.post("/api/teams/{team_id}/score", response_model=schemas.TeamOut)
     async def update_score(
         team_id: str,
         payload: schemas.TeamScoreUpdate,
-        db: Session = Depends(get_db),
-    ) -> schemas.TeamOut:
+    ) -> dict[str, Any]:
         try:
-            team = crud.update_team_score(db, team_id, payload.points)
+            team = await run_db(crud.update_team_score, team_id, payload.points)
         except ValueError as exc:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
-        await broadcast_snapshot(db, team.game_id)
-        return schemas.TeamOut(
-            id=team.id,
-            name=team.name,
-            color=team.color,
-            score=team.score,
-            players=[player.name for player in team.players],
-        )
+        await broadcast_snapshot(team.game_id)
+        view = await game_cache.aget(team.game_id)
+        cached = next((entry for entry in view.teams if entry["id"] == team.id), None) if view else None
+        if cached is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Team not found")
+        return cached
+
+    @app.post("/api/games/{game_id}/scores", response_model=list[schemas.TeamOut])
+    async def update_scores(
+        game_id: str,
+        payload: schemas.TeamScoreBatch,
+    ) -> list[dict[str, Any]]:
+        try:
+            await run_db(crud.update_team_scores, game_id, payload.scores)
+        except ValueError as exc:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+        await broadcast_snapshot(game_id)
+        view = await game_cache.aget(game_id)
+        if view is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Game not found")
+        return view.teams
 
     @app.post("/api/games/{game_id}/buzz", response_model=schemas.BuzzResponse)
     async def send_buzz(
         game_id: str,
         payload: schemas.BuzzRequest,
-        db: Session = Depends(get_db),
     ) -> schemas.BuzzResponse:
-        success, message = crud.send_buzz(
-            db,
+        success, message = await buzz_arbiter.submit(
             game_id=game_id,
             team_id=payload.team_id,
             player_id=payload.player_id,
@@ -342,47 +588,67 @@ def create_app() -> FastAPI:
         )
         if not success:
             return schemas.BuzzResponse(success=False, message=message)
-        await broadcast_snapshot(db, game_id)
+        await broadcast_snapshot(game_id, immediate=True)
         return schemas.BuzzResponse(success=True)
 
     @app.post("/api/games/{game_id}/buzz/reset", response_model=schemas.GameStateOut)
-    async def reset_buzz(game_id: str, db: Session = Depends(get_db)) -> schemas.GameStateOut:
+    async def reset_buzz(game_id: str) -> dict[str, Any]:
         try:
-            state = crud.reset_buzz(db, game_id, can_buzz=True)
+            async with buzz_arbiter.host_write(game_id):
+                state = await run_db(crud.reset_buzz, game_id, True)
         except ValueError as exc:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
-        await broadcast_snapshot(db, game_id)
-        return schemas.GameStateOut.model_validate(state)
+        await broadcast_snapshot(game_id, immediate=True)
+        return state_payload(state)
 
     @app.post("/api/games/{game_id}/buzz/enable", response_model=schemas.GameStateOut)
-    async def enable_buzzing(game_id: str, db: Session = Depends(get_db)) -> schemas.GameStateOut:
+    async def enable_buzzing(game_id: str) -> dict[str, Any]:
         try:
-            state = crud.set_buzzing(db, game_id, can_buzz=True)
+            async with buzz_arbiter.host_write(game_id):
+                state = await run_db(crud.set_buzzing, game_id, True)
         except ValueError as exc:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
-        await broadcast_snapshot(db, game_id)
-        return schemas.GameStateOut.model_validate(state)
+        await broadcast_snapshot(game_id, immediate=True)
+        return state_payload(state)
 
     @app.post("/api/games/{game_id}/buzz/disable", response_model=schemas.GameStateOut)
-    async def disable_buzzing(game_id: str, db: Session = Depends(get_db)) -> schemas.GameStateOut:
+    async def disable_buzzing(game_id: str) -> dict[str, Any]:
         try:
-            state = crud.set_buzzing(db, game_id, can_buzz=False)
+            async with buzz_arbiter.host_write(game_id):
+                state = await run_db(crud.set_buzzing, game_id, False)
         except ValueError as exc:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
-        await broadcast_snapshot(db, game_id)
-        return schemas.GameStateOut.model_validate(state)
+        await broadcast_snapshot(game_id, immediate=True)
+        return state_payload(state)
+
+    @app.get("/api/games/{game_id}/timers", response_model=list[schemas.TimerOut])
+    def list_timers(game_id: str) -> list[schemas.TimerOut]:
+        return [schemas.TimerOut.model_validate(timer) for timer in timer_scheduler.active(game_id)]
+
+    @app.post("/api/games/{game_id}/timers", response_model=schemas.TimerOut)
+    async def start_timer(game_id: str, payload: schemas.TimerStart) -> schemas.TimerOut:
+        if await game_cache.aget(game_id) is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Game not found")
+        timer = await timer_scheduler.start_timer(game_id, payload.name, payload.seconds, payload.on_expire)
+        return schemas.TimerOut.model_validate(timer)
+
+    @app.delete("/api/games/{game_id}/timers/{name}", response_model=schemas.TimerOut)
+    async def cancel_timer(game_id: str, name: str) -> schemas.TimerOut:
+        timer = await timer_scheduler.cancel_timer(game_id, name)
+        if timer is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Timer not found")
+        return schemas.TimerOut.model_validate(timer)
 
     @app.post("/api/players/{player_id}/disconnect", response_model=schemas.PlayerStatusOut)
     async def disconnect_player(
         player_id: str,
-        db: Session = Depends(get_db),
-    ) -> schemas.PlayerStatusOut:
+    ) -> dict[str, Any]:
         try:
-            player = crud.set_player_connected(db, player_id, connected=False)
+            player = await run_db(crud.set_player_connected, player_id, False)
         except ValueError as exc:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
-        await broadcast_snapshot(db, player.game_id)
-        return schemas.PlayerStatusOut.model_validate(player)
+        await broadcast_snapshot(player.game_id)
+        return player_payload(player)
 
     return app
 
@@ -0,0 +1,237 @@
+import logging
+import uuid
+from datetime import datetime
+from typing import Callable
+
+from sqlalchemy import (
+    JSON,
+    Boolean,
+    Column,
+    Connection,
+    DateTime,
+    Engine,
+    ForeignKey,
+    Index,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    Text,
+    UniqueConstraint,
+    inspect,
+    null,
+    select,
+    text,
+    update,
+)
+from sqlalchemy.exc import DBAPIError
+
+logger = logging.getLogger(__name__)
+
+VERSION_TABLE = "schema_version"
+LOCK_KEY = 0x67616D65
+
+schema = MetaData()
+
+games = Table(
+    "games",
+    schema,
+    Column("id", String(36), primary_key=True),
+    Column("code", String(8), unique=True, nullable=False),
+    Column("status", String(20), nullable=False),
+    Column("current_round", Integer, nullable=False),
+    Column("current_round_type", String(50)),
+    Column("difficulty", String(20)),
+    Column("created_at", DateTime, nullable=False),
+    Column("updated_at", DateTime, nullable=False),
+)
+
+teams = Table(
+    "teams",
+    schema,
+    Column("id", String(36), primary_key=True),
+    Column("game_id", ForeignKey("games.id"), nullable=False),
+    Column("name", String(100), nullable=False),
+    Column("color", String(20), nullable=False),
+    Column("score", Integer, nullable=False),
+    Column("created_at", DateTime, nullable=False),
+)
+
+players = Table(
+    "players",
+    schema,
+    Column("id", String(36), primary_key=True),
+    Column("game_id", ForeignKey("games.id"), nullable=False),
+    Column("team_id", ForeignKey("teams.id"), nullable=False),
+    Column("name", String(100), nullable=False),
+    Column("connected", Boolean, nullable=False),
+    Column("last_seen", DateTime, nullable=False),
+    Column("created_at", DateTime, nullable=False),
+)
+
+game_state = Table(
+    "game_state",
+    schema,
+    Column("id", String(36), primary_key=True),
+    Column("game_id", ForeignKey("games.id"), nullable=False, unique=True),
+    Column("current_question", Text),
+    Column("current_category", String(100)),
+    Column("current_points", Integer),
+    Column("time_remaining", Integer),
+    Column("can_buzz", Boolean, nullable=False),
+    Column("buzzed_team_id", ForeignKey("teams.id")),
+    Column("current_turn_team_id", ForeignKey("teams.id")),
+    Column("round_data", JSON),
+    Column("updated_at", DateTime, nullable=False),
+)
+
+buzzes = Table(
+    "buzzes",
+    schema,
+    Column("id", String(36), primary_key=True),
+    Column("game_id", ForeignKey("games.id"), nullable=False),
+    Column("team_id", ForeignKey("teams.id")),
+    Column("player_id", ForeignKey("players.id")),
+    Column("question_text", Text),
+    Column("was_first", Boolean),
+    Column("created_at", DateTime, nullable=False),
+)
+
+question_bank = Table(
+    "question_bank",
+    schema,
+    Column("id", String(36), primary_key=True),
+    Column("round_type", String(50), nullable=False),
+    Column("difficulty", String(20), nullable=False),
+    Column("category", String(100), nullable=False),
+    Column("fingerprint", String(64), nullable=False),
+    Column("payload", JSON, nullable=False),
+    Column("served_at", DateTime),
+    Column("created_at", DateTime, nullable=False),
+    Index("ix_question_bank_pool", "round_type", "difficulty", "category", "served_at"),
+    UniqueConstraint("round_type", "difficulty", "category", "fingerprint", name="uq_question_bank_fingerprint"),
+)
+
+round_state = Table(
+    "round_state",
+    schema,
+    Column("id", String(36), primary_key=True),
+    Column("game_id", ForeignKey("game_state.game_id"), nullable=False),
+    Column("namespace", String(50), nullable=False),
+    Column("data", JSON, nullable=False),
+    Column("version", Integer, nullable=False),
+    Column("updated_at", DateTime, nullable=False),
+    UniqueConstraint("game_id", "namespace", name="uq_round_state_namespace"),
+)
+
+BASELINE_TABLES = [games, teams, players, game_state, buzzes, question_bank]
+
+
+def _create_tables(conn: Connection) -> None:
+    schema.create_all(bind=conn, tables=BASELINE_TABLES)
+
+
+def _add_buzz_delta_ms(conn: Connection) -> None:
+    columns = {column["name"] for column in inspect(conn).get_columns("buzzes")}
+    if "delta_ms" not in columns:
+        conn.execute(text("ALTER TABLE buzzes ADD COLUMN delta_ms FLOAT"))
+
+
+def _add_game_indexes(conn: Connection) -> None:
+    for name, table, column in (
+        ("ix_teams_game_id", "teams", "game_id"),
+        ("ix_players_game_id", "players", "game_id"),
+        ("ix_players_team_id", "players", "team_id"),
+        ("ix_buzzes_game_id", "buzzes", "game_id"),
+    ):
+        conn.execute(text(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({column})"))
+
+
+def _add_game_version(conn: Connection) -> None:
+    columns = {column["name"] for column in inspect(conn).get_columns("games")}
+    if "version" not in columns:
+        conn.execute(text("ALTER TABLE games ADD COLUMN version INTEGER NOT NULL DEFAULT 1"))
+
+
+def _split_round_data(conn: Connection) -> None:
+    round_state.create(bind=conn)
+    rows = conn.execute(
+        select(game_state.c.game_id, game_state.c.round_data).where(game_state.c.round_data.is_not(None))
+    ).all()
+    now = datetime.utcnow()
+    namespaces = [
+        {
+            "id": str(uuid.uuid4()),
+            "game_id": game_id,
+            "namespace": namespace,
+            "data": data,
+            "version": 1,
+            "updated_at": now,
+        }
+        for game_id, round_data in rows
+        if isinstance(round_data, dict)
+        for namespace, data in round_data.items()
+    ]
+    if namespaces:
+        conn.execute(round_state.insert(), namespaces)
+    conn.execute(update(game_state).values(round_data=null()))
+
+
+MIGRATIONS: list[tuple[int, str, Callable[[Connection], None]]] = [
+    (1, "create tables", _create_tables),
+    (2, "add buzzes.delta_ms", _add_buzz_delta_ms),
+    (3, "index per-game foreign keys", _add_game_indexes),
+    (4, "split game_state.round_data into round_state rows", _split_round_data),
+    (5, "add games.version", _add_game_version),
+]
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+
+def _read_version(conn: Connection) -> int:
+    return conn.execute(text(f"SELECT MAX(version) FROM {VERSION_TABLE}")).scalar() or 0
+
+
+def _lock(conn: Connection) -> None:
+    if conn.dialect.name == "sqlite":
+        conn.exec_driver_sql("BEGIN IMMEDIATE")
+    elif conn.dialect.name == "postgresql":
+        conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": LOCK_KEY})
+
+
+def current_version(engine: Engine) -> int:
+    try:
+        with engine.connect() as conn:
+            return _read_version(conn)
+    except DBAPIError:
+        return 0
+
+
+def _apply(engine: Engine, number: int, name: str, migrate: Callable[[Connection], None]) -> None:
+    with engine.connect() as conn:
+        _lock(conn)
+        conn.execute(text(f"CREATE TABLE IF NOT EXISTS {VERSION_TABLE} (version INTEGER NOT NULL)"))
+        if _read_version(conn) >= number:
+            conn.rollback()
+            return
+        logger.info("Applying schema migration %s: %s", number, name)
+        migrate(conn)
+        conn.execute(text(f"DELETE FROM {VERSION_TABLE}"))
+        conn.execute(text(f"INSERT INTO {VERSION_TABLE} (version) VALUES (:version)"), {"version": number})
+        conn.commit()
+
+
+def run_migrations(engine: Engine) -> int:
+    version = current_version(engine)
+    if version >= LATEST_VERSION:
+        return version
+    for number, name, migrate in MIGRATIONS:
+        if number > version:
+            _apply(engine, number, name, migrate)
+    return current_version(engine)
+
+
+if __name__ == "__main__":
+    from .database import engine
+
+    logging.basicConfig(level=logging.INFO)
+    logger.info("Schema version %s", run_migrations(engine))
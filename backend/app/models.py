@@ -1,7 +1,19 @@
 import uuid
 from datetime import datetime
-
-from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, JSON, String, Text
+from typing import Any
+
+from sqlalchemy import (
+    Boolean,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    JSON,
+    String,
+    Text,
+    UniqueConstraint,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
@@ -21,6 +33,7 @@ class Game(Base):
     current_round: Mapped[int] = mapped_column(Integer, default=0)
     current_round_type: Mapped[str | None] = mapped_column(String(50))
     difficulty: Mapped[str | None] = mapped_column(String(20))
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=func.now())
     updated_at: Mapped[datetime] = mapped_column(
         DateTime, default=func.now(), onupdate=func.now()
@@ -44,7 +57,7 @@ class Team(Base):
     __tablename__ = "teams"
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=_uuid_str)
-    game_id: Mapped[str] = mapped_column(ForeignKey("games.id"), nullable=False)
+    game_id: Mapped[str] = mapped_column(ForeignKey("games.id"), nullable=False, index=True)
     name: Mapped[str] = mapped_column(String(100), nullable=False)
     color: Mapped[str] = mapped_column(String(20), nullable=False)
     score: Mapped[int] = mapped_column(Integer, default=0)
@@ -61,8 +74,8 @@ class Player(Base):
     __tablename__ = "players"
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=_uuid_str)
-    game_id: Mapped[str] = mapped_column(ForeignKey("games.id"), nullable=False)
-    team_id: Mapped[str] = mapped_column(ForeignKey("teams.id"), nullable=False)
+    game_id: Mapped[str] = mapped_column(ForeignKey("games.id"), nullable=False, index=True)
+    team_id: Mapped[str] = mapped_column(ForeignKey("teams.id"), nullable=False, index=True)
     name: Mapped[str] = mapped_column(String(100), nullable=False)
     connected: Mapped[bool] = mapped_column(Boolean, default=True)
     last_seen: Mapped[datetime] = mapped_column(DateTime, default=func.now())
@@ -87,25 +100,73 @@ class GameState(Base):
     can_buzz: Mapped[bool] = mapped_column(Boolean, default=False)
     buzzed_team_id: Mapped[str | None] = mapped_column(ForeignKey("teams.id"))
     current_turn_team_id: Mapped[str | None] = mapped_column(ForeignKey("teams.id"))
-    round_data: Mapped[dict | None] = mapped_column(JSON)
+    legacy_round_data: Mapped[dict | None] = mapped_column("round_data", JSON)
     updated_at: Mapped[datetime] = mapped_column(
         DateTime, default=func.now(), onupdate=func.now()
     )
 
     game: Mapped["Game"] = relationship(back_populates="game_state")
+    rounds: Mapped[list["RoundState"]] = relationship(
+        back_populates="state", cascade="all, delete-orphan", order_by="RoundState.namespace"
+    )
+
+    @property
+    def round_data(self) -> dict | None:
+        if not self.rounds:
+            return None
+        return {round_state.namespace: round_state.data for round_state in self.rounds}
+
+    def round_namespace(self, namespace: str) -> "RoundState | None":
+        return next((round_state for round_state in self.rounds if round_state.namespace == namespace), None)
+
+
+class RoundState(Base):
+    __tablename__ = "round_state"
+    __table_args__ = (UniqueConstraint("game_id", "namespace", name="uq_round_state_namespace"),)
+
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=_uuid_str)
+    game_id: Mapped[str] = mapped_column(ForeignKey("game_state.game_id"), nullable=False)
+    namespace: Mapped[str] = mapped_column(String(50), nullable=False)
+    data: Mapped[Any] = mapped_column(JSON)
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, default=func.now(), onupdate=func.now()
+    )
+
+    state: Mapped["GameState"] = relationship(back_populates="rounds")
 
 
 class Buzz(Base):
     __tablename__ = "buzzes"
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=_uuid_str)
-    game_id: Mapped[str] = mapped_column(ForeignKey("games.id"), nullable=False)
+    game_id: Mapped[str] = mapped_column(ForeignKey("games.id"), nullable=False, index=True)
     team_id: Mapped[str | None] = mapped_column(ForeignKey("teams.id"))
     player_id: Mapped[str | None] = mapped_column(ForeignKey("players.id"))
     question_text: Mapped[str | None] = mapped_column(Text)
     was_first: Mapped[bool | None] = mapped_column(Boolean)
+    delta_ms: Mapped[float | None] = mapped_column(Float)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=func.now())
 
     game: Mapped["Game"] = relationship(back_populates="buzzes")
     team: Mapped["Team"] = relationship(back_populates="buzzes")
     player: Mapped["Player"] = relationship(back_populates="buzzes")
+
+
+class QuestionBankEntry(Base):
+    __tablename__ = "question_bank"
+    __table_args__ = (
+        Index("ix_question_bank_pool", "round_type", "difficulty", "category", "served_at"),
+        UniqueConstraint(
+            "round_type", "difficulty", "category", "fingerprint", name="uq_question_bank_fingerprint"
+        ),
+    )
+
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=_uuid_str)
+    round_type: Mapped[str] = mapped_column(String(50), nullable=False)
+    difficulty: Mapped[str] = mapped_column(String(20), nullable=False, default="")
+    category: Mapped[str] = mapped_column(String(100), nullable=False, default="")
+    fingerprint: Mapped[str] = mapped_column(String(64), nullable=False)
+    payload: Mapped[dict] = mapped_column(JSON, nullable=False)
+    served_at: Mapped[datetime | None] = mapped_column(DateTime)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=func.now())
@@ -0,0 +1,213 @@
+import asyncio
+import importlib.util
+import json
+import logging
+import os
+from typing import Any, Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+CHANNEL_PREFIX = os.getenv("BROADCAST_CHANNEL_PREFIX", "gameshow:game:")
+CONTROL_CHANNEL = os.getenv("BROADCAST_CONTROL_CHANNEL", "gameshow:control")
+RECONNECT_INITIAL_SECONDS = 0.5
+RECONNECT_MAX_SECONDS = 30.0
+
+Handler = Callable[[str, dict[str, Any]], Awaitable[None]]
+
+
+class InProcessBackend:
+    shared = False
+
+    def __init__(self) -> None:
+        self._handler: Handler | None = None
+
+    async def start(self, handler: Handler) -> None:
+        self._handler = handler
+
+    async def stop(self) -> None:
+        self._handler = None
+
+    async def subscribe(self, game_id: str) -> None:
+        pass
+
+    async def unsubscribe(self, game_id: str) -> None:
+        pass
+
+    async def publish(self, game_id: str, message: dict[str, Any], control: bool = False) -> None:
+        if self._handler is not None:
+            await self._handler(game_id, message)
+
+    def stats(self) -> dict[str, Any]:
+        return {"backend": "memory"}
+
+
+class LocalPubSub:
+    def __init__(self, broker: "LocalBroker") -> None:
+        self._broker = broker
+        self._queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+        self.channels: set[str] = set()
+
+    async def subscribe(self, *channels: str) -> None:
+        self.channels.update(channels)
+        self._broker.subscribers.add(self)
+
+    async def unsubscribe(self, *channels: str) -> None:
+        self.channels.difference_update(channels)
+
+    async def get_message(self, ignore_subscribe_messages: bool = True, timeout: float = 1.0) -> dict[str, Any] | None:
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def aclose(self) -> None:
+        self._broker.subscribers.discard(self)
+
+
+class LocalBroker:
+    def __init__(self) -> None:
+        self.subscribers: set[LocalPubSub] = set()
+
+    def pubsub(self) -> LocalPubSub:
+        return LocalPubSub(self)
+
+    async def publish(self, channel: str, data: str) -> int:
+        receivers = [pubsub for pubsub in self.subscribers if channel in pubsub.channels]
+        for pubsub in receivers:
+            pubsub._queue.put_nowait({"type": "message", "channel": channel, "data": data})
+        return len(receivers)
+
+    async def aclose(self) -> None:
+        self.subscribers.clear()
+
+
+class BrokerBackend:
+    shared = True
+
+    def __init__(self, client_factory: Callable[[], Any], name: str, poll_seconds: float = 1.0) -> None:
+        self._client_factory = client_factory
+        self._name = name
+        self._poll_seconds = poll_seconds
+        self._client: Any = None
+        self._pubsub: Any = None
+        self._handler: Handler | None = None
+        self._channels: set[str] = set()
+        self._reader: asyncio.Task | None = None
+        self._stats = {"published": 0, "received": 0, "reconnects": 0}
+
+    def _channel(self, game_id: str) -> str:
+        return f"{CHANNEL_PREFIX}{game_id}"
+
+    async def start(self, handler: Handler) -> None:
+        self._handler = handler
+        self._client = self._client_factory()
+        self._reader = asyncio.create_task(self._read_loop())
+
+    async def stop(self) -> None:
+        if self._reader is not None:
+            self._reader.cancel()
+            try:
+                await self._reader
+            except asyncio.CancelledError:
+                pass
+            self._reader = None
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def subscribe(self, game_id: str) -> None:
+        channel = self._channel(game_id)
+        if channel in self._channels:
+            return
+        self._channels.add(channel)
+        if self._pubsub is not None:
+            await self._pubsub.subscribe(channel)
+
+    async def unsubscribe(self, game_id: str) -> None:
+        channel = self._channel(game_id)
+        if channel not in self._channels:
+            return
+        self._channels.discard(channel)
+        if self._pubsub is not None:
+            await self._pubsub.unsubscribe(channel)
+
+    async def publish(self, game_id: str, message: dict[str, Any], control: bool = False) -> None:
+        if control:
+            await self._client.publish(CONTROL_CHANNEL, json.dumps({**message, "game_id": game_id}))
+        else:
+            await self._client.publish(self._channel(game_id), json.dumps(message))
+        self._stats["published"] += 1
+
+    async def _read_loop(self) -> None:
+        delay = RECONNECT_INITIAL_SECONDS
+        while True:
+            pubsub = self._client.pubsub()
+            try:
+                await pubsub.subscribe(CONTROL_CHANNEL, *self._channels)
+                self._pubsub = pubsub
+                while True:
+                    message = await pubsub.get_message(
+                        ignore_subscribe_messages=True, timeout=self._poll_seconds
+                    )
+                    delay = RECONNECT_INITIAL_SECONDS
+                    if message is not None and message.get("type") == "message":
+                        await self._dispatch(message)
+            except asyncio.CancelledError:
+                self._pubsub = None
+                await pubsub.aclose()
+                raise
+            except Exception:
+                logger.exception("Broadcast %s subscription failed; reconnecting in %.1fs", self._name, delay)
+                self._pubsub = None
+                self._stats["reconnects"] += 1
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, RECONNECT_MAX_SECONDS)
+
+    async def _dispatch(self, message: dict[str, Any]) -> None:
+        channel = message["channel"]
+        data = message["data"]
+        if isinstance(channel, bytes):
+            channel = channel.decode()
+        if self._handler is None or (channel != CONTROL_CHANNEL and channel not in self._channels):
+            return
+        self._stats["received"] += 1
+        try:
+            payload = json.loads(data)
+            if channel == CONTROL_CHANNEL:
+                game_id = payload.pop("game_id")
+            else:
+                game_id = channel[len(CHANNEL_PREFIX):]
+            await self._handler(game_id, payload)
+        except Exception:
+            logger.exception("Failed to deliver broadcast on %s", channel)
+
+    def stats(self) -> dict[str, Any]:
+        return {"backend": self._name, "channels": len(self._channels), **self._stats}
+
+
+def _redis_client_factory(url: str) -> Callable[[], Any]:
+    def factory() -> Any:
+        import redis.asyncio
+
+        return redis.asyncio.from_url(url)
+
+    return factory
+
+
+def create_broadcast_backend() -> InProcessBackend | BrokerBackend:
+    name = os.getenv("BROADCAST_BACKEND", "memory").strip().lower()
+    if name == "redis":
+        if importlib.util.find_spec("redis") is None:
+            raise RuntimeError("BROADCAST_BACKEND=redis requires the 'redis' package")
+        url = os.getenv("BROADCAST_REDIS_URL", "redis://localhost:6379/0")
+        return BrokerBackend(_redis_client_factory(url), "redis")
+    if name == "local":
+        broker = LocalBroker()
+        return BrokerBackend(lambda: broker, "local")
+    if name != "memory":
+        logger.warning("Unknown BROADCAST_BACKEND=%s; using in-process broadcasts", name)
+    return InProcessBackend()
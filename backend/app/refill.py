@@ -0,0 +1,153 @@
+import asyncio
+import logging
+import time
+from typing import Any
+
+import httpx
+
+from . import crud, llm
+from .database import run_db
+
+logger = logging.getLogger(__name__)
+
+PoolKey = tuple[str, str, str]
+
+BACKOFF_INITIAL_SECONDS = 5.0
+BACKOFF_MAX_SECONDS = 300.0
+IDLE_POLL_SECONDS = 0.5
+
+
+class QuestionRefillWorker:
+    def __init__(self) -> None:
+        self._task: asyncio.Task | None = None
+        self._wake: asyncio.Event | None = None
+        self._throttle_lock: asyncio.Lock | None = None
+        self._last_call_at = 0.0
+        self._backoff = 0.0
+        self._backoff_until = 0.0
+        self._in_flight: set[PoolKey] = set()
+        self._stats = {"cycles": 0, "batches": 0, "added": 0, "failures": 0}
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._wake = asyncio.Event()
+            self._throttle_lock = asyncio.Lock()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def wake(self) -> None:
+        if self._wake is not None:
+            self._wake.set()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            **self._stats,
+            "running": self._task is not None and not self._task.done(),
+            "in_flight": len(self._in_flight),
+            "backoff_seconds": max(0.0, self._backoff_until - time.monotonic()),
+        }
+
+    async def _run(self) -> None:
+        while True:
+            settings = llm.get_llm_settings()
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=settings.refill_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            try:
+                await self._refill_once()
+            except Exception:
+                logger.exception("Question bank refill cycle failed")
+
+    async def _wait_for_idle(self) -> None:
+        while llm.live_request_count() > 0 or time.monotonic() < self._backoff_until:
+            await asyncio.sleep(IDLE_POLL_SECONDS)
+
+    async def _refill_once(self) -> None:
+        settings = llm.get_llm_settings()
+        if not settings.api_key:
+            return
+        levels = await run_db(crud.get_bank_stock_levels)
+        for key in llm.bank_seed_pools(settings):
+            levels.setdefault(key, 0)
+        low = sorted(
+            (count, key)
+            for key, count in levels.items()
+            if count < settings.bank_low_water and key not in self._in_flight
+        )
+        if not low:
+            return
+        self._stats["cycles"] += 1
+        semaphore = asyncio.Semaphore(settings.refill_concurrency)
+        await asyncio.gather(*(self._refill_pool(key, semaphore) for _, key in low))
+
+    async def _throttle(self, min_interval: float) -> None:
+        async with self._throttle_lock:
+            delay = self._last_call_at + min_interval - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._last_call_at = time.monotonic()
+
+    def _back_off(self) -> None:
+        self._stats["failures"] += 1
+        self._backoff = min(BACKOFF_MAX_SECONDS, max(BACKOFF_INITIAL_SECONDS, self._backoff * 2))
+        self._backoff_until = time.monotonic() + self._backoff
+
+    async def _refill_pool(self, key: PoolKey, semaphore: asyncio.Semaphore) -> None:
+        round_type, difficulty, category = key
+        async with semaphore:
+            settings = llm.get_llm_settings()
+            await self._wait_for_idle()
+            await self._throttle(settings.refill_min_interval)
+            self._in_flight.add(key)
+            try:
+                items = await llm.generate_bank_items(
+                    round_type, difficulty, category, settings.bank_batch_size
+                )
+            except httpx.HTTPError as exc:
+                self._back_off()
+                logger.warning(
+                    "Question bank refill failed round=%s difficulty=%s category=%s backoff=%.0fs error=%r",
+                    round_type,
+                    difficulty,
+                    category,
+                    self._backoff,
+                    exc,
+                )
+                return
+            except Exception:
+                self._back_off()
+                logger.exception(
+                    "Question bank refill failed round=%s difficulty=%s category=%s backoff=%.0fs",
+                    round_type,
+                    difficulty,
+                    category,
+                    self._backoff,
+                )
+                return
+            finally:
+                self._in_flight.discard(key)
+            self._backoff = 0.0
+            added = await run_db(crud.add_bank_questions, round_type, difficulty, category, items)
+            self._stats["batches"] += 1
+            self._stats["added"] += added
+            logger.info(
+                "Question bank refilled round=%s difficulty=%s category=%s added=%s",
+                round_type,
+                difficulty,
+                category,
+                added,
+            )
+
+
+refill_worker = QuestionRefillWorker()
@@ -1,7 +1,7 @@
 from datetime import datetime
-from typing import Literal
+from typing import Annotated, Literal, Union
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 Difficulty = Literal["easy", "medium", "medium-hard", "hard"]
 RoundType = Literal[
@@ -116,6 +116,30 @@ class TeamScoreUpdate(BaseModel):
     points: int
 
 
+class TeamScoreDelta(TeamScoreUpdate):
+    team_id: str
+
+
+class TeamScoreBatch(BaseModel):
+    scores: list[TeamScoreDelta] = Field(..., min_length=1)
+
+
+class TimerStart(BaseModel):
+    name: str = Field(..., min_length=1, max_length=50)
+    seconds: float = Field(..., gt=0, le=3600)
+    on_expire: Literal["disable_buzzing"] | None = None
+
+
+class TimerOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    name: str
+    duration_seconds: float
+    deadline_ms: int
+    on_expire: str | None
+    server_time_ms: int
+
+
 class BuzzRequest(BaseModel):
     team_id: str
     player_id: str | None = None
@@ -138,6 +162,13 @@ class PlayerStatusOut(BaseModel):
     connected: bool
 
 
+class GameBundle(BaseModel):
+    game: GameOut
+    teams: list[TeamOut]
+    game_state: GameStateOut | None
+    players: list[PlayerStatusOut]
+
+
 class RoundSettingsIn(BaseModel):
     trivia_buzz_questions: int | None = Field(default=None, alias="triviaBuzzQuestions")
     trivia_buzz_difficulty: Difficulty | None = Field(default=None, alias="triviaBuzzDifficulty")
@@ -183,6 +214,15 @@ class GeneratedQuestions(BaseModel):
     connect4: list[Connect4Question] | None = None
     blindDraw: list[str] | None = None
     dumpCharades: list[str] | None = None
+    errors: dict[RoundType, str] | None = None
+
+
+class GeneratedQuestionsEvent(BaseModel):
+    type: Literal["round", "error", "done"]
+    round_type: RoundType | None = None
+    questions: GeneratedQuestions | None = None
+    detail: str | None = None
+    errors: dict[RoundType, str] | None = None
 
 
 class GenerateQuestionsRequest(BaseModel):
@@ -204,3 +244,35 @@ class RegenerateQuestionResponse(BaseModel):
     guess_number: GuessNumberQuestion | None = None
     connect4: Connect4Question | None = None
     word: str | None = None
+
+
+class WsBuzzMessage(BuzzRequest):
+    type: Literal["buzz"]
+    id: str | None = None
+
+
+class WsPingMessage(BaseModel):
+    type: Literal["ping"]
+    id: str | None = None
+    sent_at: float | None = None
+
+
+class WsAckMessage(BaseModel):
+    type: Literal["ack"]
+    version: int
+
+
+class WsResyncMessage(BaseModel):
+    type: Literal["resync"]
+
+
+class WsAuthMessage(BaseModel):
+    type: Literal["auth"]
+    host_pin: str
+
+
+WsInboundMessage = Annotated[
+    Union[WsBuzzMessage, WsPingMessage, WsAckMessage, WsResyncMessage],
+    Field(discriminator="type"),
+]
+ws_inbound_adapter = TypeAdapter(WsInboundMessage)
@@ -0,0 +1,98 @@
+from datetime import datetime
+from typing import Any
+
+from . import models
+
+ROLES = ("host", "player")
+HOST_ONLY_ROUND_KEYS = ("generated_questions",)
+
+
+def _iso(value: datetime | None) -> str | None:
+    return value.isoformat() if value is not None else None
+
+
+def game_payload(game: models.Game) -> dict[str, Any]:
+    return {
+        "id": game.id,
+        "code": game.code,
+        "status": game.status,
+        "current_round": game.current_round,
+        "current_round_type": game.current_round_type,
+        "difficulty": game.difficulty,
+        "created_at": _iso(game.created_at),
+        "updated_at": _iso(game.updated_at),
+    }
+
+
+def team_payload(team: models.Team, player_names: list[str]) -> dict[str, Any]:
+    return {
+        "id": team.id,
+        "name": team.name,
+        "color": team.color,
+        "score": team.score,
+        "players": player_names,
+    }
+
+
+def player_payload(player: models.Player) -> dict[str, Any]:
+    return {
+        "id": player.id,
+        "name": player.name,
+        "team_id": player.team_id,
+        "game_id": player.game_id,
+        "connected": player.connected,
+    }
+
+
+def state_payload(state: models.GameState | None) -> dict[str, Any] | None:
+    if state is None:
+        return None
+    return {
+        "game_id": state.game_id,
+        "current_question": state.current_question,
+        "current_category": state.current_category,
+        "current_points": state.current_points,
+        "time_remaining": state.time_remaining,
+        "can_buzz": state.can_buzz,
+        "buzzed_team_id": state.buzzed_team_id,
+        "current_turn_team_id": state.current_turn_team_id,
+        "round_data": state.round_data,
+        "updated_at": _iso(state.updated_at),
+    }
+
+
+def bundle_payload(game: models.Game) -> dict[str, Any]:
+    teams = []
+    players = []
+    for team in game.teams:
+        names = []
+        for player in team.players:
+            names.append(player.name)
+            players.append(player_payload(player))
+        teams.append(team_payload(team, names))
+    return {
+        "game": game_payload(game),
+        "teams": teams,
+        "game_state": state_payload(game.game_state),
+        "players": players,
+    }
+
+
+def project_for_role(data: dict[str, Any], role: str) -> dict[str, Any]:
+    if role == "host":
+        return data
+    state = data.get("game_state")
+    if not state or not state.get("round_data"):
+        return data
+    return {**data, "game_state": {**state, "round_data": player_round_data(state["round_data"])}}
+
+
+def player_round_data(round_data: dict[str, Any]) -> dict[str, Any]:
+    projected = {key: value for key, value in round_data.items() if key not in HOST_ONLY_ROUND_KEYS}
+    setup = projected.get("game_setup")
+    if isinstance(setup, dict) and "host_pin_hash" in setup:
+        projected["game_setup"] = {key: value for key, value in setup.items() if key != "host_pin_hash"}
+    trivia = projected.get("trivia")
+    if isinstance(trivia, dict) and "answer" in trivia and not trivia.get("show_answer"):
+        projected["trivia"] = {key: value for key, value in trivia.items() if key != "answer"}
+    return projected
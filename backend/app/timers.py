@@ -0,0 +1,172 @@
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from . import crud
+from .broadcaster import snapshot_scheduler
+from .buzz import buzz_arbiter
+from .database import run_db
+from .ws import manager
+
+logger = logging.getLogger(__name__)
+
+TimerKey = tuple[str, str]
+
+
+@dataclass
+class RoundTimer:
+    game_id: str
+    name: str
+    duration_seconds: float
+    on_expire: str | None
+    deadline: float
+    deadline_ms: int
+    token: int
+    remote: bool = False
+
+    @property
+    def server_time_ms(self) -> int:
+        return int(time.time() * 1000)
+
+    def event(self, kind: str) -> dict[str, Any]:
+        return {
+            "type": "timer",
+            "event": kind,
+            "name": self.name,
+            "duration_seconds": self.duration_seconds,
+            "deadline_ms": self.deadline_ms,
+            "on_expire": self.on_expire,
+            "server_time_ms": self.server_time_ms,
+        }
+
+
+class TimerScheduler:
+    def __init__(self) -> None:
+        self._timers: dict[TimerKey, RoundTimer] = {}
+        self._heap: list[tuple[float, int, TimerKey]] = []
+        self._tokens = itertools.count(1)
+        self._wake: asyncio.Event | None = None
+        self._task: asyncio.Task | None = None
+        self._expiring: set[asyncio.Task] = set()
+        self.stats = {"started": 0, "cancelled": 0, "expired": 0, "action_failures": 0}
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._wake = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._expiring:
+            await asyncio.gather(*self._expiring, return_exceptions=True)
+
+    async def start_timer(
+        self,
+        game_id: str,
+        name: str,
+        duration_seconds: float,
+        on_expire: str | None = None,
+    ) -> RoundTimer:
+        token = next(self._tokens)
+        deadline = time.monotonic() + duration_seconds
+        timer = RoundTimer(
+            game_id=game_id,
+            name=name,
+            duration_seconds=duration_seconds,
+            on_expire=on_expire,
+            deadline=deadline,
+            deadline_ms=int((time.time() + duration_seconds) * 1000),
+            token=token,
+        )
+        self._timers[(game_id, name)] = timer
+        heapq.heappush(self._heap, (deadline, token, (game_id, name)))
+        self.stats["started"] += 1
+        if self._wake is not None:
+            self._wake.set()
+        await manager.broadcast(game_id, timer.event("started"), control=True)
+        return timer
+
+    async def cancel_timer(self, game_id: str, name: str) -> RoundTimer | None:
+        timer = self._timers.pop((game_id, name), None)
+        if timer is None:
+            return None
+        self.stats["cancelled"] += 1
+        await manager.broadcast(game_id, timer.event("cancelled"), control=True)
+        return timer
+
+    def mirror(self, game_id: str, event: dict[str, Any]) -> None:
+        key = (game_id, event["name"])
+        if event["event"] != "started":
+            self._timers.pop(key, None)
+            return
+        timer = RoundTimer(
+            game_id=game_id,
+            name=event["name"],
+            duration_seconds=event["duration_seconds"],
+            on_expire=event["on_expire"],
+            deadline=time.monotonic() + event["deadline_ms"] / 1000 - time.time(),
+            deadline_ms=event["deadline_ms"],
+            token=next(self._tokens),
+            remote=True,
+        )
+        self._timers[key] = timer
+        heapq.heappush(self._heap, (timer.deadline, timer.token, key))
+        if self._wake is not None:
+            self._wake.set()
+
+    def active(self, game_id: str) -> list[RoundTimer]:
+        return [timer for (timer_game_id, _), timer in self._timers.items() if timer_game_id == game_id]
+
+    async def _run(self) -> None:
+        while True:
+            now = time.monotonic()
+            while self._heap and self._heap[0][0] <= now:
+                _, token, key = heapq.heappop(self._heap)
+                timer = self._timers.get(key)
+                if timer is None or timer.token != token:
+                    continue
+                del self._timers[key]
+                if timer.remote:
+                    continue
+                task = asyncio.create_task(self._expire(timer))
+                self._expiring.add(task)
+                task.add_done_callback(self._expiring.discard)
+            timeout = self._heap[0][0] - now if self._heap else None
+            self._wake.clear()
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _expire(self, timer: RoundTimer) -> None:
+        self.stats["expired"] += 1
+        try:
+            if timer.on_expire == "disable_buzzing":
+                async with buzz_arbiter.host_write(timer.game_id):
+                    await run_db(crud.set_buzzing, timer.game_id, False)
+                await snapshot_scheduler.schedule(timer.game_id, immediate=True)
+        except Exception:
+            self.stats["action_failures"] += 1
+            logger.exception("Timer %s expiry action failed for game %s", timer.name, timer.game_id)
+        await manager.broadcast(timer.game_id, timer.event("expired"), control=True)
+
+    def metrics(self) -> dict[str, Any]:
+        return {
+            **self.stats,
+            "active": len(self._timers),
+            "heap": len(self._heap),
+            "running": self._task is not None and not self._task.done(),
+        }
+
+
+timer_scheduler = TimerScheduler()
@@ -1,35 +1,331 @@
+import asyncio
+import importlib.util
 import json
-from typing import Any
+import logging
+import os
+import uuid
+from typing import Any, Callable
 
 from fastapi import WebSocket
 
+from .pubsub import BrokerBackend, InProcessBackend, create_broadcast_backend
+from .snapshots import project_for_role
+
+logger = logging.getLogger(__name__)
+
+SEND_TIMEOUT_SECONDS = float(os.getenv("WS_SEND_TIMEOUT_SECONDS", "5"))
+QUEUE_SIZE = int(os.getenv("WS_QUEUE_SIZE", "32"))
+
+_MISSING = object()
+
+ChannelKey = tuple[str, str]
+RemoteHandler = Callable[[str, dict[str, Any]], None]
+
+if importlib.util.find_spec("orjson") is not None:
+    import orjson
+
+    def encode_json(payload: Any) -> str:
+        return orjson.dumps(payload).decode()
+
+else:
+
+    def encode_json(payload: Any) -> str:
+        return json.dumps(payload, separators=(",", ":"))
+
+
+def encode_msgpack(payload: Any) -> bytes:
+    import msgpack
+
+    return msgpack.packb(payload)
+
+
+def decode_msgpack(data: bytes) -> Any:
+    import msgpack
+
+    return msgpack.unpackb(data)
+
+
+ENCODERS: dict[str, Callable[[Any], str | bytes]] = {"json": encode_json}
+if importlib.util.find_spec("msgpack") is not None:
+    ENCODERS["msgpack"] = encode_msgpack
+
+
+class Frame:
+    def __init__(self, payload: dict[str, Any]) -> None:
+        self.payload = payload
+        self._encoded: dict[str, str | bytes] = {}
+
+    def encode(self, encoding: str) -> str | bytes:
+        data = self._encoded.get(encoding)
+        if data is None:
+            data = self._encoded[encoding] = ENCODERS[encoding](self.payload)
+        return data
+
+
+def diff_state(previous: Any, current: Any, path: list[str] | None = None) -> list[dict[str, Any]]:
+    path = path or []
+    if isinstance(previous, dict) and isinstance(current, dict):
+        ops: list[dict[str, Any]] = []
+        for key, value in current.items():
+            old = previous.get(key, _MISSING)
+            if old is _MISSING:
+                ops.append({"op": "set", "path": path + [key], "value": value})
+            else:
+                ops.extend(diff_state(old, value, path + [key]))
+        for key in previous:
+            if key not in current:
+                ops.append({"op": "remove", "path": path + [key]})
+        return ops
+    if previous == current:
+        return []
+    return [{"op": "set", "path": path, "value": current}]
+
+
+class ClientConnection:
+    def __init__(
+        self,
+        manager: "ConnectionManager",
+        game_id: str,
+        websocket: WebSocket,
+        delta: bool,
+        encoding: str = "json",
+        role: str = "player",
+    ) -> None:
+        self.manager = manager
+        self.game_id = game_id
+        self.websocket = websocket
+        self.delta = delta
+        self.encoding = encoding
+        self.role = role
+        self.queue: asyncio.Queue[str | bytes] = asyncio.Queue(maxsize=QUEUE_SIZE)
+        self.writer: asyncio.Task | None = None
+        self.acked_version = 0
+
+    def start(self) -> None:
+        self.writer = asyncio.create_task(self._write_loop())
+
+    def stop(self) -> None:
+        if self.writer is not None and self.writer is not asyncio.current_task():
+            self.writer.cancel()
+
+    def enqueue(self, message: Frame, resync_message: Frame | None = None) -> None:
+        if self.queue.full():
+            self.manager.stats["coalesced"] += 1
+            if resync_message is not None:
+                while not self.queue.empty():
+                    self.queue.get_nowait()
+                message = resync_message
+            else:
+                self.queue.get_nowait()
+        self.queue.put_nowait(message.encode(self.encoding))
+
+    async def _write_loop(self) -> None:
+        while True:
+            message = await self.queue.get()
+            if isinstance(message, bytes):
+                send = self.websocket.send_bytes(message)
+            else:
+                send = self.websocket.send_text(message)
+            try:
+                await asyncio.wait_for(send, timeout=SEND_TIMEOUT_SECONDS)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                await self.manager.evict(self, exc)
+                return
+
 
 class ConnectionManager:
-    def __init__(self) -> None:
-        self._connections: dict[str, set[WebSocket]] = {}
+    def __init__(self, backend: InProcessBackend | BrokerBackend | None = None) -> None:
+        self._backend = backend or InProcessBackend()
+        self._pending_unsubscribes: set[asyncio.Task] = set()
+        self._connections: dict[str, dict[WebSocket, ClientConnection]] = {}
+        self._versions: dict[ChannelKey, int] = {}
+        self._snapshots: dict[ChannelKey, dict[str, Any]] = {}
+        self._remote_handlers: list[RemoteHandler] = []
+        self.instance = uuid.uuid4().hex
+        self.stats = {"coalesced": 0, "evicted": 0}
+
+    @property
+    def shared(self) -> bool:
+        return self._backend.shared
 
-    async def connect(self, game_id: str, websocket: WebSocket) -> None:
-        await websocket.accept()
-        self._connections.setdefault(game_id, set()).add(websocket)
+    def on_remote(self, handler: RemoteHandler) -> None:
+        self._remote_handlers.append(handler)
+
+    async def start(self) -> None:
+        await self._backend.start(self._deliver)
+
+    async def stop(self) -> None:
+        await self._backend.stop()
+
+    def backend_stats(self) -> dict[str, Any]:
+        return self._backend.stats()
+
+    async def connect(
+        self,
+        game_id: str,
+        websocket: WebSocket,
+        delta: bool = False,
+        encoding: str = "json",
+        role: str = "player",
+        accepted: bool = False,
+    ) -> None:
+        client = ClientConnection(self, game_id, websocket, delta, encoding, role)
+        first = game_id not in self._connections
+        self._connections.setdefault(game_id, {})[websocket] = client
+        if first:
+            await self._backend.subscribe(game_id)
+        if not accepted:
+            try:
+                await websocket.accept()
+            except Exception:
+                self.disconnect(game_id, websocket)
+                raise
+        client.start()
 
     def disconnect(self, game_id: str, websocket: WebSocket) -> None:
-        if game_id in self._connections:
-            self._connections[game_id].discard(websocket)
-            if not self._connections[game_id]:
-                del self._connections[game_id]
+        if game_id not in self._connections:
+            return
+        client = self._connections[game_id].pop(websocket, None)
+        if client is not None:
+            client.stop()
+            if not any(other.role == client.role for other in self._connections[game_id].values()):
+                self._snapshots.pop((game_id, client.role), None)
+        if not self._connections[game_id]:
+            del self._connections[game_id]
+            task = asyncio.create_task(self._unsubscribe_if_idle(game_id))
+            self._pending_unsubscribes.add(task)
+            task.add_done_callback(self._pending_unsubscribes.discard)
 
-    async def broadcast(self, game_id: str, payload: dict[str, Any]) -> None:
+    async def _unsubscribe_if_idle(self, game_id: str) -> None:
         if game_id not in self._connections:
+            await self._backend.unsubscribe(game_id)
+
+    async def evict(self, client: ClientConnection, reason: Exception) -> None:
+        self.stats["evicted"] += 1
+        logger.warning("Evicting slow or closed WebSocket game=%s reason=%r", client.game_id, reason)
+        self.disconnect(client.game_id, client.websocket)
+        try:
+            await asyncio.wait_for(client.websocket.close(code=1011), timeout=SEND_TIMEOUT_SECONDS)
+        except Exception:
+            pass
+
+    def connection_count(self) -> int:
+        return sum(len(clients) for clients in self._connections.values())
+
+    def version(self, game_id: str, role: str = "host") -> int:
+        return self._versions.get((game_id, role), 0)
+
+    def _snapshot_message(self, game_id: str, role: str) -> Frame | None:
+        snapshot = self._snapshots.get((game_id, role))
+        if snapshot is None:
+            return None
+        return Frame({"type": "snapshot", "version": self.version(game_id, role), "data": snapshot})
+
+    async def resync(self, game_id: str, websocket: WebSocket) -> bool:
+        client = self._connections.get(game_id, {}).get(websocket)
+        if client is None:
+            return False
+        message = self._snapshot_message(game_id, client.role)
+        if message is None:
+            return False
+        client.enqueue(message, resync_message=message)
+        return True
+
+    def send_snapshot(self, game_id: str, websocket: WebSocket, data: dict[str, Any]) -> None:
+        client = self._connections.get(game_id, {}).get(websocket)
+        if client is None:
             return
-        message = json.dumps(payload)
-        stale: list[WebSocket] = []
-        for websocket in self._connections[game_id]:
-            try:
-                await websocket.send_text(message)
-            except Exception:
-                stale.append(websocket)
-        for websocket in stale:
-            self.disconnect(game_id, websocket)
+        if (game_id, client.role) not in self._snapshots:
+            clients = [other for other in self._connections[game_id].values() if other.role == client.role]
+            self._deliver_role_state(game_id, client.role, project_for_role(data, client.role), clients)
+            return
+        message = self._snapshot_message(game_id, client.role)
+        client.enqueue(message, resync_message=message)
+
+    def send(self, game_id: str, websocket: WebSocket, payload: dict[str, Any]) -> bool:
+        client = self._connections.get(game_id, {}).get(websocket)
+        if client is None:
+            return False
+        client.enqueue(Frame(payload))
+        return True
+
+    def ack(self, game_id: str, websocket: WebSocket, version: int) -> None:
+        client = self._connections.get(game_id, {}).get(websocket)
+        if client is not None and client.acked_version < version <= self.version(game_id, client.role):
+            client.acked_version = version
+
+    def lagging_count(self) -> int:
+        return sum(
+            1
+            for game_id, clients in self._connections.items()
+            for client in clients.values()
+            if client.acked_version and client.acked_version < self.version(game_id, client.role)
+        )
+
+    async def broadcast_state(self, game_id: str, data: dict[str, Any]) -> None:
+        await self._backend.publish(game_id, {"kind": "state", "data": data})
+        if self.shared:
+            await self._backend.publish(game_id, {"kind": "invalidate", "origin": self.instance}, control=True)
+
+    async def broadcast(self, game_id: str, payload: dict[str, Any], control: bool = False) -> None:
+        message = {"kind": "message", "payload": payload, "origin": self.instance}
+        await self._backend.publish(game_id, message, control=control)
+
+    async def _deliver(self, game_id: str, message: dict[str, Any]) -> None:
+        kind = message.get("kind")
+        if kind == "state":
+            self._deliver_state(game_id, message["data"])
+        elif kind == "message":
+            self._deliver_message(game_id, message["payload"])
+        origin = message.get("origin")
+        if origin is not None and origin != self.instance:
+            for handler in self._remote_handlers:
+                handler(game_id, message)
+
+    def _deliver_state(self, game_id: str, data: dict[str, Any]) -> None:
+        clients = list(self._connections.get(game_id, {}).values())
+        for role in {client.role for client in clients}:
+            self._deliver_role_state(
+                game_id,
+                role,
+                project_for_role(data, role),
+                [client for client in clients if client.role == role],
+            )
+
+    def _deliver_role_state(
+        self,
+        game_id: str,
+        role: str,
+        data: dict[str, Any],
+        clients: list[ClientConnection],
+    ) -> None:
+        key = (game_id, role)
+        previous = self._snapshots.get(key)
+        ops = diff_state(previous, data) if previous is not None else None
+        if ops == []:
+            return
+        version = self.version(game_id, role) + 1
+        self._versions[key] = version
+        self._snapshots[key] = data
+
+        snapshot_message = Frame({"type": "snapshot", "version": version, "data": data})
+        patch_message = None
+        if ops is not None:
+            patch_message = Frame({"type": "patch", "version": version, "base_version": version - 1, "ops": ops})
+        for client in clients:
+            if client.delta and patch_message is not None:
+                client.enqueue(patch_message, resync_message=snapshot_message)
+            else:
+                client.enqueue(snapshot_message, resync_message=snapshot_message)
+
+    def _deliver_message(self, game_id: str, payload: dict[str, Any]) -> None:
+        if game_id not in self._connections:
+            return
+        message = Frame(payload)
+        for client in list(self._connections[game_id].values()):
+            client.enqueue(message)
 
 
-manager = ConnectionManager()
+manager = ConnectionManager(create_broadcast_backend())
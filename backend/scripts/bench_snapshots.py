@@ -0,0 +1,100 @@
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app import models, schemas
+from app.cache import _game_bundle
+from app.database import Base
+from app.snapshots import bundle_payload, project_for_role
+from app.ws import encode_json
+
+
+def _seed(session_factory, teams: int, players: int, questions: int) -> str:
+    with session_factory() as db:
+        game = models.Game(code="BENCH1", current_round_type="trivia-buzz")
+        db.add(game)
+        db.flush()
+        generated = [
+            {"question": f"Question {index} about a moderately long topic?", "answer": f"Answer {index}"}
+            for index in range(questions)
+        ]
+        db.add(
+            models.GameState(
+                game_id=game.id,
+                rounds=[
+                    models.RoundState(namespace="game_setup", data={"rounds": ["trivia-buzz"], "host_pin_hash": "x"}),
+                    models.RoundState(namespace="generated_questions", data={"triviaBuzz": generated}),
+                    models.RoundState(namespace="trivia", data={"answer": "Answer 0", "show_answer": False}),
+                ],
+            )
+        )
+        for team_index in range(teams):
+            team = models.Team(game_id=game.id, name=f"Team {team_index}", color="#000000")
+            db.add(team)
+            db.flush()
+            for player_index in range(players):
+                db.add(models.Player(game_id=game.id, team_id=team.id, name=f"Player {team_index}-{player_index}"))
+        db.commit()
+        return game.id
+
+
+def pydantic_payload(game: models.Game) -> dict:
+    players = [player for team in game.teams for player in team.players]
+    return {
+        "game": schemas.GameOut.model_validate(game).model_dump(mode="json"),
+        "teams": [
+            schemas.TeamOut(
+                id=team.id,
+                name=team.name,
+                color=team.color,
+                score=team.score,
+                players=[player.name for player in team.players],
+            ).model_dump(mode="json")
+            for team in game.teams
+        ],
+        "game_state": schemas.GameStateOut.model_validate(game.game_state).model_dump(mode="json"),
+        "players": [schemas.PlayerStatusOut.model_validate(player).model_dump(mode="json") for player in players],
+    }
+
+
+def _time(label: str, fn, iterations: int) -> None:
+    fn()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    elapsed = time.perf_counter() - started
+    print(f"{label:<28} {elapsed / iterations * 1_000_000:9.1f} us/snapshot")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure per-snapshot projection and serialization cost")
+    parser.add_argument("--teams", type=int, default=6)
+    parser.add_argument("--players", type=int, default=8, help="players per team")
+    parser.add_argument("--questions", type=int, default=60)
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(bind=engine, autoflush=False)
+    game_id = _seed(session_factory, args.teams, args.players, args.questions)
+
+    with session_factory() as db:
+        game = _game_bundle(db, game_id)
+        data = bundle_payload(game)
+        print(f"{args.teams} teams x {args.players} players, {args.questions} generated questions")
+        _time("pydantic model_dump", lambda: pydantic_payload(game), args.iterations)
+        _time("direct projection", lambda: bundle_payload(game), args.iterations)
+        _time("player role projection", lambda: project_for_role(data, "player"), args.iterations)
+        _time("json encode (host)", lambda: encode_json({"type": "snapshot", "data": data}), args.iterations)
+
+
+if __name__ == "__main__":
+    main()
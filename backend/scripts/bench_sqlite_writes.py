@@ -0,0 +1,65 @@
+import argparse
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from sqlalchemy import update
+from sqlalchemy.orm import sessionmaker
+
+from app import models
+from app.database import Base, SQLITE_PROFILES, create_db_engine
+
+
+def _seed(session_factory, teams: int) -> list[tuple[str, str]]:
+    with session_factory() as db:
+        game = models.Game(code="BENCH1")
+        db.add(game)
+        db.flush()
+        rows = [models.Team(game_id=game.id, name=f"Team {index}", color="#000000") for index in range(teams)]
+        db.add_all(rows)
+        db.commit()
+        return [(game.id, team.id) for team in rows]
+
+
+def _worker(session_factory, team: tuple[str, str], writes: int) -> int:
+    game_id, team_id = team
+    with session_factory() as db:
+        for _ in range(writes):
+            db.execute(update(models.Team).where(models.Team.id == team_id).values(score=models.Team.score + 1))
+            db.add(models.Buzz(game_id=game_id, team_id=team_id, was_first=False))
+            db.commit()
+    return writes
+
+
+def run(profile: str, threads: int, writes: int) -> float:
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_db_engine(f"sqlite:///{tmp}/bench.db", profile)
+        Base.metadata.create_all(bind=engine)
+        session_factory = sessionmaker(bind=engine, autoflush=False)
+        teams = _seed(session_factory, threads)
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            total = sum(pool.map(lambda team: _worker(session_factory, team, writes), teams))
+        elapsed = time.perf_counter() - started
+        engine.dispose()
+    return total / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare SQLite write throughput per SQLITE_PROFILE")
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--writes", type=int, default=200, help="transactions per thread")
+    parser.add_argument("--profile", action="append", choices=sorted(SQLITE_PROFILES))
+    args = parser.parse_args()
+
+    for profile in args.profile or sorted(SQLITE_PROFILES):
+        rate = run(profile, args.threads, args.writes)
+        print(f"{profile:<12} {args.threads} threads x {args.writes} writes: {rate:,.0f} writes/s")
+
+
+if __name__ == "__main__":
+    main()
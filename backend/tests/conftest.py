@@ -0,0 +1,32 @@
+import os
+import sys
+import tempfile
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{Path(tempfile.mkdtemp()) / 'test.db'}")
+os.environ.setdefault("LLM_CONFIG_PATH", os.devnull)
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+
+@pytest.fixture(scope="session")
+def client() -> Iterator[TestClient]:
+    from app.main import app
+
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture
+def create_game(client: TestClient) -> Callable[[str | None], dict]:
+    def create(host_pin: str | None = None) -> dict:
+        payload = {"teams": [{"name": "A", "color": "red"}], "rounds": ["trivia-buzz"], "difficulty": "easy"}
+        if host_pin:
+            payload["host_pin"] = host_pin
+        return client.post("/api/games", json=payload).json()
+
+    return create
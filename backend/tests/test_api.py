@@ -0,0 +1,42 @@
+from collections.abc import Callable
+
+from fastapi.testclient import TestClient
+
+from app.cache import GameStateCache, game_cache
+from app.database import SessionLocal
+
+
+def test_game_state_hides_host_data_without_pin(client: TestClient, create_game: Callable[..., dict]) -> None:
+    game_id = create_game("1234")["game"]["id"]
+
+    response = client.get(f"/api/games/{game_id}/state")
+
+    assert response.status_code == 200
+    assert "host_pin_hash" not in response.json()["round_data"]["game_setup"]
+
+
+def test_game_state_returns_host_view_with_pin(client: TestClient, create_game: Callable[..., dict]) -> None:
+    game_id = create_game("1234")["game"]["id"]
+    player = client.get(f"/api/games/{game_id}/state")
+
+    host = client.get(f"/api/games/{game_id}/state", headers={"X-Host-Pin": "1234"})
+
+    assert host.json()["round_data"]["game_setup"]["host_pin_hash"]
+    assert host.headers["etag"] != player.headers["etag"]
+    assert client.get(f"/api/games/{game_id}/state", headers={"X-Host-Pin": "0000"}).status_code == 403
+
+
+def test_etag_survives_reloads_and_other_workers(client: TestClient, create_game: Callable[..., dict]) -> None:
+    game_id = create_game()["game"]["id"]
+    etag = client.get(f"/api/games/{game_id}/bundle").headers["etag"]
+
+    game_cache.invalidate(game_id)
+    with SessionLocal() as db:
+        other_worker = GameStateCache().get(db, game_id)
+
+    assert client.get(f"/api/games/{game_id}/bundle", headers={"If-None-Match": etag}).status_code == 304
+    assert GameStateCache().etag(other_worker, "-player") == etag
+    client.patch(f"/api/games/{game_id}/state", json={"current_question": "Q1"})
+    changed = client.get(f"/api/games/{game_id}/bundle", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
@@ -0,0 +1,159 @@
+import asyncio
+
+import pytest
+from sqlalchemy import select
+
+from app import crud, models, schemas
+from app.buzz import BuzzArbiter
+from app.database import SessionLocal, engine
+from app.migrations import run_migrations
+
+
+@pytest.fixture(scope="module", autouse=True)
+def database() -> None:
+    run_migrations(engine)
+
+
+@pytest.fixture
+def game() -> tuple[str, list[str]]:
+    payload = schemas.GameCreate.model_validate(
+        {
+            "teams": [{"name": name, "color": "red"} for name in ("A", "B", "C")],
+            "rounds": ["trivia-buzz"],
+            "difficulty": "easy",
+        }
+    )
+    with SessionLocal() as db:
+        game, teams = crud.create_game(db, payload)
+        crud.set_buzzing(db, game.id, True)
+        return game.id, [team.id for team in teams]
+
+
+def _buzzes(game_id: str) -> list[models.Buzz]:
+    with SessionLocal() as db:
+        return list(
+            db.execute(select(models.Buzz).where(models.Buzz.game_id == game_id).order_by(models.Buzz.delta_ms)).scalars()
+        )
+
+
+def _state(game_id: str) -> models.GameState:
+    with SessionLocal() as db:
+        state = crud.get_game_state(db, game_id)
+        db.expunge(state)
+        return state
+
+
+async def _submit_all(arbiter: BuzzArbiter, game_id: str, team_ids: list[str]) -> list[tuple[bool, str | None]]:
+    results = await asyncio.gather(
+        *(arbiter.submit(game_id, team_id, None, f"player {index}", None) for index, team_id in enumerate(team_ids))
+    )
+    await arbiter.drain()
+    return results
+
+
+def test_first_arrival_wins_and_losers_are_recorded(game: tuple[str, list[str]]) -> None:
+    game_id, team_ids = game
+    arbiter = BuzzArbiter()
+
+    results = asyncio.run(_submit_all(arbiter, game_id, team_ids))
+
+    assert results == [(True, None), (False, "Cannot buzz right now"), (False, "Cannot buzz right now")]
+    buzzes = _buzzes(game_id)
+    assert [(buzz.team_id, buzz.was_first) for buzz in buzzes] == [
+        (team_ids[0], True),
+        (team_ids[1], False),
+        (team_ids[2], False),
+    ]
+    assert buzzes[0].delta_ms == 0
+    assert 0 <= buzzes[1].delta_ms <= buzzes[2].delta_ms
+    state = _state(game_id)
+    assert state.buzzed_team_id == team_ids[0]
+    assert not state.can_buzz
+    assert state.round_data["trivia"]["buzzed_player_name"] == "player 0"
+    assert arbiter.stats["accepted"] == 1 and arbiter.stats["late"] == 2
+
+
+def test_closed_window_rejects_without_recording(game: tuple[str, list[str]]) -> None:
+    game_id, team_ids = game
+    with SessionLocal() as db:
+        crud.set_buzzing(db, game_id, False)
+    arbiter = BuzzArbiter()
+
+    results = asyncio.run(_submit_all(arbiter, game_id, team_ids[:1]))
+
+    assert results == [(False, "Cannot buzz right now")]
+    assert _buzzes(game_id) == []
+    assert arbiter.stats["rejected"] == 1
+
+
+def test_team_that_answered_wrong_cannot_steal(game: tuple[str, list[str]]) -> None:
+    game_id, team_ids = game
+    with SessionLocal() as db:
+        crud.update_game_state(
+            db,
+            game_id,
+            schemas.GameStateUpdate(round_data={"trivia": {"incorrect_team_id": team_ids[0]}}),
+        )
+    arbiter = BuzzArbiter()
+
+    results = asyncio.run(_submit_all(arbiter, game_id, team_ids[:2]))
+
+    assert results == [(False, "Only the opposing team can steal"), (True, None)]
+    assert _state(game_id).buzzed_team_id == team_ids[1]
+
+
+def test_buzzes_during_host_write_wait_for_it(game: tuple[str, list[str]]) -> None:
+    game_id, team_ids = game
+    arbiter = BuzzArbiter()
+
+    async def scenario() -> list[tuple[bool, str | None]]:
+        async with arbiter.host_write(game_id):
+            pending = [
+                asyncio.create_task(arbiter.submit(game_id, team_id, None, None, None)) for team_id in team_ids[:2]
+            ]
+            await asyncio.sleep(0.01)
+            assert not any(task.done() for task in pending)
+        results = await asyncio.gather(*pending)
+        await arbiter.drain()
+        return results
+
+    assert asyncio.run(scenario()) == [(True, None), (False, "Cannot buzz right now")]
+    assert _state(game_id).buzzed_team_id == team_ids[0]
+
+
+def test_queued_buzzes_see_the_host_write(game: tuple[str, list[str]]) -> None:
+    game_id, team_ids = game
+    arbiter = BuzzArbiter()
+
+    async def scenario() -> tuple[bool, str | None]:
+        async with arbiter.host_write(game_id):
+            pending = asyncio.create_task(arbiter.submit(game_id, team_ids[0], None, None, None))
+            await asyncio.sleep(0)
+            with SessionLocal() as db:
+                crud.set_buzzing(db, game_id, False)
+        return await pending
+
+    assert asyncio.run(scenario()) == (False, "Cannot buzz right now")
+    assert arbiter.stats["queued"] == 1
+
+
+def test_shared_arbiters_accept_one_winner(game: tuple[str, list[str]]) -> None:
+    game_id, team_ids = game
+    first, second = BuzzArbiter(), BuzzArbiter()
+    first.shared = second.shared = True
+
+    async def scenario() -> list[tuple[bool, str | None]]:
+        results = await asyncio.gather(
+            first.submit(game_id, team_ids[0], None, None, None),
+            second.submit(game_id, team_ids[1], None, None, None),
+        )
+        await first.drain()
+        await second.drain()
+        return results
+
+    results = asyncio.run(scenario())
+
+    assert sorted(success for success, _ in results) == [False, True]
+    winner = team_ids[0] if results[0][0] else team_ids[1]
+    assert _state(game_id).buzzed_team_id == winner
+    assert [buzz.team_id for buzz in _buzzes(game_id) if buzz.was_first] == [winner]
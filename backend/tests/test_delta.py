@@ -0,0 +1,41 @@
+from app.ws import diff_state
+
+
+def test_diff_state_identical_is_empty() -> None:
+    state = {"game": {"status": "playing"}, "teams": [{"id": "t1", "score": 3}]}
+    assert diff_state(state, {"game": {"status": "playing"}, "teams": [{"id": "t1", "score": 3}]}) == []
+
+
+def test_diff_state_sets_changed_and_added_keys() -> None:
+    previous = {"game": {"status": "waiting", "current_round": 0}}
+    current = {"game": {"status": "playing", "current_round": 0}, "players": []}
+    assert diff_state(previous, current) == [
+        {"op": "set", "path": ["game", "status"], "value": "playing"},
+        {"op": "set", "path": ["players"], "value": []},
+    ]
+
+
+def test_diff_state_removes_missing_keys() -> None:
+    previous = {"game_state": {"round_data": {"trivia": {"show_answer": True}, "lightning": {"index": 2}}}}
+    current = {"game_state": {"round_data": {"trivia": {"show_answer": True}}}}
+    assert diff_state(previous, current) == [
+        {"op": "remove", "path": ["game_state", "round_data", "lightning"]},
+    ]
+
+
+def test_diff_state_recurses_into_nested_dicts() -> None:
+    previous = {"game_state": {"round_data": {"trivia": {"index": 1, "show_answer": False}}}}
+    current = {"game_state": {"round_data": {"trivia": {"index": 2, "show_answer": False, "buzzed": "t1"}}}}
+    assert diff_state(previous, current) == [
+        {"op": "set", "path": ["game_state", "round_data", "trivia", "index"], "value": 2},
+        {"op": "set", "path": ["game_state", "round_data", "trivia", "buzzed"], "value": "t1"},
+    ]
+
+
+def test_diff_state_replaces_lists_and_type_changes_whole() -> None:
+    previous = {"teams": [{"id": "t1", "score": 1}], "game_state": {"buzzed_team_id": None}}
+    current = {"teams": [{"id": "t1", "score": 2}], "game_state": {"buzzed_team_id": {"id": "t1"}}}
+    assert diff_state(previous, current) == [
+        {"op": "set", "path": ["teams"], "value": [{"id": "t1", "score": 2}]},
+        {"op": "set", "path": ["game_state", "buzzed_team_id"], "value": {"id": "t1"}},
+    ]
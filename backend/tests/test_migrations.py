@@ -0,0 +1,175 @@
+import json
+import threading
+from pathlib import Path
+
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.orm import Session
+
+from app import models
+from app.database import Base
+from app.migrations import LATEST_VERSION, current_version, run_migrations
+
+BASELINE_DDL = [
+    """
+    CREATE TABLE games (
+        id VARCHAR(36) NOT NULL PRIMARY KEY,
+        code VARCHAR(8) NOT NULL UNIQUE,
+        status VARCHAR(20) NOT NULL,
+        current_round INTEGER NOT NULL,
+        current_round_type VARCHAR(50),
+        difficulty VARCHAR(20),
+        created_at DATETIME NOT NULL,
+        updated_at DATETIME NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE teams (
+        id VARCHAR(36) NOT NULL PRIMARY KEY,
+        game_id VARCHAR(36) NOT NULL REFERENCES games (id),
+        name VARCHAR(100) NOT NULL,
+        color VARCHAR(20) NOT NULL,
+        score INTEGER NOT NULL,
+        created_at DATETIME NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE players (
+        id VARCHAR(36) NOT NULL PRIMARY KEY,
+        game_id VARCHAR(36) NOT NULL REFERENCES games (id),
+        team_id VARCHAR(36) NOT NULL REFERENCES teams (id),
+        name VARCHAR(100) NOT NULL,
+        connected BOOLEAN NOT NULL,
+        last_seen DATETIME NOT NULL,
+        created_at DATETIME NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE game_state (
+        id VARCHAR(36) NOT NULL PRIMARY KEY,
+        game_id VARCHAR(36) NOT NULL UNIQUE REFERENCES games (id),
+        current_question TEXT,
+        current_category VARCHAR(100),
+        current_points INTEGER,
+        time_remaining INTEGER,
+        can_buzz BOOLEAN NOT NULL,
+        buzzed_team_id VARCHAR(36) REFERENCES teams (id),
+        current_turn_team_id VARCHAR(36) REFERENCES teams (id),
+        round_data JSON,
+        updated_at DATETIME NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE buzzes (
+        id VARCHAR(36) NOT NULL PRIMARY KEY,
+        game_id VARCHAR(36) NOT NULL REFERENCES games (id),
+        team_id VARCHAR(36) REFERENCES teams (id),
+        player_id VARCHAR(36) REFERENCES players (id),
+        question_text TEXT,
+        was_first BOOLEAN,
+        created_at DATETIME NOT NULL
+    )
+    """,
+]
+
+ROUND_DATA = {"game_setup": {"rounds": ["trivia-buzz"], "host_pin_hash": None}, "trivia": {"index": 2}}
+
+
+def _baseline_engine(path: Path):
+    engine = create_engine(f"sqlite:///{path}")
+    with engine.begin() as conn:
+        for ddl in BASELINE_DDL:
+            conn.execute(text(ddl))
+        conn.execute(
+            text("INSERT INTO games VALUES ('g1', 'PINKSAND', 'waiting', 0, NULL, NULL, :now, :now)"),
+            {"now": "2024-01-01 00:00:00"},
+        )
+        conn.execute(
+            text(
+                "INSERT INTO game_state (id, game_id, can_buzz, round_data, updated_at)"
+                " VALUES ('s1', 'g1', 0, :round_data, :now)"
+            ),
+            {"round_data": json.dumps(ROUND_DATA), "now": "2024-01-01 00:00:00"},
+        )
+    return engine
+
+
+def _schema(engine) -> dict[str, set[str]]:
+    inspector = inspect(engine)
+    return {
+        table: {column["name"] for column in inspector.get_columns(table)}
+        for table in inspector.get_table_names()
+        if table != "schema_version"
+    }
+
+
+def test_fresh_database_matches_models(tmp_path: Path) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'fresh.db'}")
+    assert run_migrations(engine) == LATEST_VERSION
+
+    expected = {table.name: {column.name for column in table.columns} for table in Base.metadata.sorted_tables}
+    assert _schema(engine) == expected
+    indexes = {index["name"] for table in ("teams", "players", "buzzes") for index in inspect(engine).get_indexes(table)}
+    assert {"ix_teams_game_id", "ix_players_game_id", "ix_players_team_id", "ix_buzzes_game_id"} <= indexes
+
+
+def test_upgrades_baseline_database(tmp_path: Path) -> None:
+    engine = _baseline_engine(tmp_path / "baseline.db")
+    assert current_version(engine) == 0
+
+    assert run_migrations(engine) == LATEST_VERSION
+
+    assert "delta_ms" in _schema(engine)["buzzes"]
+    assert "question_bank" in _schema(engine)
+    with engine.connect() as conn:
+        rows = conn.execute(text("SELECT namespace, data, version FROM round_state WHERE game_id = 'g1'")).all()
+        legacy = conn.execute(text("SELECT round_data FROM game_state WHERE game_id = 'g1'")).scalar()
+    assert {namespace: (json.loads(data), version) for namespace, data, version in rows} == {
+        namespace: (data, 1) for namespace, data in ROUND_DATA.items()
+    }
+    assert legacy is None
+
+
+def test_rerun_is_a_no_op(tmp_path: Path) -> None:
+    engine = _baseline_engine(tmp_path / "rerun.db")
+    run_migrations(engine)
+
+    assert run_migrations(engine) == LATEST_VERSION
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT COUNT(*) FROM round_state")).scalar() == len(ROUND_DATA)
+        assert conn.execute(text("SELECT COUNT(*) FROM schema_version")).scalar() == 1
+
+
+def test_concurrent_runs_apply_each_step_once(tmp_path: Path) -> None:
+    path = tmp_path / "concurrent.db"
+    _baseline_engine(path).dispose()
+    barrier = threading.Barrier(4)
+    results: list[object] = []
+
+    def migrate() -> None:
+        engine = create_engine(f"sqlite:///{path}")
+        barrier.wait()
+        try:
+            results.append(run_migrations(engine))
+        except Exception as exc:
+            results.append(exc)
+        finally:
+            engine.dispose()
+
+    threads = [threading.Thread(target=migrate) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [LATEST_VERSION] * 4
+    with create_engine(f"sqlite:///{path}").connect() as conn:
+        assert conn.execute(text("SELECT COUNT(*) FROM round_state")).scalar() == len(ROUND_DATA)
+
+
+def test_models_load_migrated_round_state(tmp_path: Path) -> None:
+    engine = _baseline_engine(tmp_path / "models.db")
+    run_migrations(engine)
+    with Session(engine) as db:
+        state = db.get(models.GameState, "s1")
+        assert state.round_data == ROUND_DATA
+        assert state.round_namespace("trivia").data == {"index": 2}
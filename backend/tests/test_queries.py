@@ -0,0 +1,38 @@
+from collections.abc import Callable
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event, text
+
+from app.cache import game_cache
+from app.database import SessionLocal, engine
+
+
+def test_startup_creates_per_game_indexes(client: TestClient) -> None:
+    with engine.connect() as conn:
+        names = set(conn.execute(text("SELECT name FROM sqlite_master WHERE type = 'index'")).scalars())
+    assert {"ix_teams_game_id", "ix_players_game_id", "ix_players_team_id", "ix_buzzes_game_id"} <= names
+
+
+def test_cache_miss_loads_game_in_one_statement(client: TestClient, create_game: Callable[..., dict]) -> None:
+    game = create_game("1234")
+    game_id = game["game"]["id"]
+    team_id = game["teams"][0]["id"]
+    for name in ("Alex", "Sam"):
+        client.post(f"/api/games/{game['game']['code']}/join", json={"team_id": team_id, "player_name": name})
+    game_cache.invalidate(game_id)
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        with SessionLocal() as db:
+            view = game_cache.get(db, game_id)
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert len(statements) == 1
+    assert sorted(player["name"] for player in view.players) == ["Alex", "Sam"]
+    assert sorted(view.teams[0]["players"]) == ["Alex", "Sam"]
+    assert "game_setup" in view.game_state["round_data"]
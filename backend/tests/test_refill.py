@@ -0,0 +1,73 @@
+import asyncio
+from dataclasses import replace
+
+import pytest
+
+from app import crud, llm
+from app.database import SessionLocal, engine
+from app.migrations import run_migrations
+from app.refill import QuestionRefillWorker
+
+
+@pytest.fixture(scope="module", autouse=True)
+def database() -> None:
+    run_migrations(engine)
+
+
+@pytest.fixture
+def settings(monkeypatch: pytest.MonkeyPatch) -> llm.LLMSettings:
+    configured = replace(
+        llm.get_llm_settings(),
+        api_key="test",
+        bank_low_water=2,
+        bank_batch_size=3,
+        refill_min_interval=0.0,
+        bank_seed_rounds=("blind-draw", "guess-number"),
+        bank_seed_difficulties=("easy",),
+    )
+    monkeypatch.setattr(llm, "get_llm_settings", lambda: configured)
+    return configured
+
+
+async def _run_cycles(worker: QuestionRefillWorker, cycles: int) -> dict:
+    worker.start()
+    for _ in range(cycles):
+        worker.wake()
+        await asyncio.sleep(0.05)
+    stats = worker.stats()
+    await worker.stop()
+    return stats
+
+
+def test_empty_configured_pools_are_seeded(settings: llm.LLMSettings, monkeypatch: pytest.MonkeyPatch) -> None:
+    async def generate(round_type: str, difficulty: str, category: str, count: int) -> list[dict]:
+        if round_type == "guess-number":
+            return [{"question": f"{difficulty} {index}?", "answer": index} for index in range(count)]
+        return [{"word": f"{round_type} {index}"} for index in range(count)]
+
+    monkeypatch.setattr(llm, "generate_bank_items", generate)
+
+    asyncio.run(_run_cycles(QuestionRefillWorker(), 1))
+
+    with SessionLocal() as db:
+        levels = crud.get_bank_stock_levels(db)
+    assert levels[("blind-draw", "easy", "")] == 3
+    assert levels[("guess-number", "", "")] == 3
+
+
+def test_malformed_generation_backs_off(settings: llm.LLMSettings, monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[str] = []
+
+    async def generate(round_type: str, difficulty: str, category: str, count: int) -> list[dict]:
+        calls.append(round_type)
+        raise ValueError("malformed JSON")
+
+    monkeypatch.setattr(llm, "generate_bank_items", generate)
+    unseeded = replace(settings, bank_seed_rounds=("blind-draw",), bank_seed_difficulties=("hard",))
+    monkeypatch.setattr(llm, "get_llm_settings", lambda: unseeded)
+
+    stats = asyncio.run(_run_cycles(QuestionRefillWorker(), 3))
+
+    assert len(calls) == 1
+    assert stats["failures"] == 1
+    assert stats["backoff_seconds"] > 0
@@ -0,0 +1,44 @@
+from collections.abc import Callable
+
+import pytest
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+
+def test_host_socket_authenticates_with_first_frame(client: TestClient, create_game: Callable[..., dict]) -> None:
+    game_id = create_game("1234")["game"]["id"]
+    with client.websocket_connect(f"/ws/games/{game_id}?role=host") as websocket:
+        websocket.send_json({"type": "auth", "host_pin": "1234"})
+        snapshot = websocket.receive_json()
+    assert snapshot["type"] == "snapshot"
+    assert snapshot["version"] == 1
+    assert snapshot["data"]["game_state"]["round_data"]["game_setup"]["host_pin_hash"]
+
+
+@pytest.mark.parametrize("protocol", ["snapshot", "delta"])
+def test_player_socket_receives_snapshot_on_connect(
+    client: TestClient,
+    create_game: Callable[..., dict],
+    protocol: str,
+) -> None:
+    game_id = create_game("1234")["game"]["id"]
+    with client.websocket_connect(f"/ws/games/{game_id}?protocol={protocol}") as websocket:
+        snapshot = websocket.receive_json()
+    assert snapshot["type"] == "snapshot"
+    assert snapshot["data"]["game"]["id"] == game_id
+    assert "host_pin_hash" not in snapshot["data"]["game_state"]["round_data"]["game_setup"]
+
+
+@pytest.mark.parametrize("host_pin, auth_pin", [("1234", "9999"), (None, "")])
+def test_host_socket_rejects_bad_or_missing_pin(
+    client: TestClient,
+    create_game: Callable[..., dict],
+    host_pin: str | None,
+    auth_pin: str,
+) -> None:
+    game_id = create_game(host_pin)["game"]["id"]
+    with pytest.raises(WebSocketDisconnect) as exc:
+        with client.websocket_connect(f"/ws/games/{game_id}?role=host") as websocket:
+            websocket.send_json({"type": "auth", "host_pin": auth_pin})
+            websocket.receive_json()
+    assert exc.value.code == 1008
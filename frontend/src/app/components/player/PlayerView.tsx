@@ -14,6 +14,7 @@ import { PlayerBlindDraw } from './rounds/PlayerBlindDraw';
 import { PlayerDumpCharades } from './rounds/PlayerDumpCharades';
 import { sendBuzz } from '@/services/buzzService';
 import { useGameSync } from '@/hooks/useGameSync';
+import { useCountdowns } from '@/hooks/useRoundTimer';
 import { formatGameCode } from '@/app/utils/gameCode';
 import { disconnectPlayer, updateGameState } from '@/services/gameService';
 import { Scoreboard } from '@/app/components/Scoreboard';
@@ -31,7 +32,8 @@ interface PlayerViewProps {
 type RoundData = Record<string, any>;
 
 export function PlayerView({ gameId, gameCode, playerId, playerName, teamId, teamName, teamColor }: PlayerViewProps) {
-  const { game, teams, gameState, players, loading, error } = useGameSync(gameId, 1000);
+  const { game, teams, gameState, players, timers, loading, error } = useGameSync(gameId, 1000);
+  const countdowns = useCountdowns(timers);
   const [showRules, setShowRules] = useState(true);
   const lastRoundIndexRef = useRef<number | null>(null);
 
@@ -147,7 +149,7 @@ export function PlayerView({ gameId, gameCode, playerId, playerName, teamId, tea
             incorrectTeamId={incorrectTeamId}
             teamId={teamId}
             teamColor={teamColor}
-            timeRemaining={gameState?.time_remaining || undefined}
+            timeRemaining={gameState?.buzzed_team_id ? countdowns.trivia_answer : undefined}
             answer={roundData.trivia?.answer}
             showAnswer={roundData.trivia?.show_answer}
             onBuzz={async () => {
@@ -187,7 +189,7 @@ export function PlayerView({ gameId, gameCode, playerId, playerName, teamId, tea
             question={roundData.lightning?.question || null}
             questionNumber={roundData.lightning?.question_number ?? 0}
             totalQuestions={roundData.lightning?.total_questions || 10}
-            timeRemaining={roundData.lightning?.time_remaining ?? 60}
+            timeRemaining={countdowns.lightning ?? 60}
             yourTurn={yourTurn}
             teamColor={teamColor}
             correctCount={roundData.lightning?.correct_count}
@@ -205,8 +207,8 @@ export function PlayerView({ gameId, gameCode, playerId, playerName, teamId, tea
         return (
           <PlayerQuickBuild
             challenge={roundData.quick_build?.challenge || 'Build the tallest tower'}
-            timeRemaining={roundData.quick_build?.time_remaining ?? roundData.quick_build?.total_time ?? 60}
-            totalTime={roundData.quick_build?.total_time ?? roundData.quick_build?.time_remaining ?? 60}
+            timeRemaining={countdowns.quick_build ?? roundData.quick_build?.total_time ?? 60}
+            totalTime={roundData.quick_build?.total_time ?? 60}
             phase={roundData.quick_build?.phase || 'building'}
             teamColor={teamColor}
             winnerName={winnerTeamName}
@@ -275,12 +277,12 @@ export function PlayerView({ gameId, gameCode, playerId, playerName, teamId, tea
         return (
           <PlayerGuessNumber
             prompt={guessNumberData.prompt || 'Guess the number'}
-            timeRemaining={guessNumberData.time_remaining}
+            timeRemaining={countdowns.guess_number}
             questionId={questionId}
             questionIndex={guessNumberData.question_index ?? 1}
             totalQuestions={guessNumberData.total_questions ?? 1}
             submittedGuess={submittedGuess}
-            canSubmit={!!guessNumberData.prompt && !revealed && (guessNumberData.time_remaining ?? 0) > 0}
+            canSubmit={!!guessNumberData.prompt && !revealed && (countdowns.guess_number ?? 0) > 0}
             onDraftGuess={async (guess) => {
               await updateGameState(gameId, {
                 round_data: {
@@ -336,7 +338,7 @@ export function PlayerView({ gameId, gameCode, playerId, playerName, teamId, tea
             word={isDrawer || blindDrawPhase === 'complete' ? blindDrawWord : null}
             isDrawer={isDrawer}
             isGuessingTeam={isGuessingTeam}
-            timeRemaining={roundData.blind_draw?.time_remaining ?? 60}
+            timeRemaining={countdowns.blind_draw ?? roundData.blind_draw?.total_time ?? 60}
             teamColor={teamColor}
             isActive={!!roundData.blind_draw?.is_active}
             drawingData={roundData.blind_draw?.drawing_data || null}
@@ -358,7 +360,7 @@ export function PlayerView({ gameId, gameCode, playerId, playerName, teamId, tea
             word={isActor || dumpCharadesPhase === 'complete' ? dumpCharadesWord : null}
             isActor={isActor}
             isGuessingTeam={isActingTeam}
-            timeRemaining={roundData.dump_charades?.time_remaining ?? 60}
+            timeRemaining={countdowns.dump_charades ?? roundData.dump_charades?.total_time ?? 60}
             isActive={!!roundData.dump_charades?.is_active}
             phase={dumpCharadesPhase}
             result={roundData.dump_charades?.result || null}
@@ -8,6 +8,7 @@ import { Pencil, Trophy } from 'lucide-react';
 import { motion } from 'motion/react';
 import { updateGameState } from '@/services/gameService';
 import { useGameSync } from '@/hooks/useGameSync';
+import { useRoundTimer } from '@/hooks/useRoundTimer';
 
 interface BlindDrawProps {
   teams: Team[];
@@ -30,10 +31,10 @@ export function BlindDraw({
 }: BlindDrawProps) {
   const { gameState, players } = useGameSync(gameId);
   const roundSeconds = Math.max(durationSeconds || 60, 1);
+  const { remaining, start, cancel } = useRoundTimer(gameId, 'blind_draw');
   const [state, setState] = useState<BlindDrawState>({
     currentWord: null,
     drawingTeam: null,
-    timeRemaining: roundSeconds,
     isActive: false,
     guessedCorrectly: false,
   });
@@ -45,22 +46,11 @@ export function BlindDraw({
   const usedWordsRef = useRef<Set<string>>(new Set());
 
   useEffect(() => {
-    if (!state.isActive) return;
-    const interval = window.setInterval(() => {
-      setState(prev => {
-        if (!prev.isActive) return prev;
-        const next = Math.max(prev.timeRemaining - 1, 0);
-        return next === 0 ? { ...prev, timeRemaining: 0, isActive: false } : { ...prev, timeRemaining: next };
-      });
-    }, 1000);
-    return () => window.clearInterval(interval);
-  }, [state.isActive]);
-
-  useEffect(() => {
-    if (!state.isActive && phase === 'drawing' && state.timeRemaining === 0) {
+    if (state.isActive && phase === 'drawing' && remaining === 0) {
+      setState(prev => ({ ...prev, isActive: false }));
       setPhase('judging');
     }
-  }, [state.isActive, state.timeRemaining, phase]);
+  }, [state.isActive, remaining, phase]);
 
   useEffect(() => {
     if (!gameId) return;
@@ -70,7 +60,6 @@ export function BlindDraw({
         word: state.currentWord,
         drawer_team_id: state.drawingTeam,
         drawer_player_id: drawerPlayerId,
-        time_remaining: state.timeRemaining,
         total_time: roundSeconds,
         is_active: state.isActive,
         phase: phase,
@@ -81,7 +70,7 @@ export function BlindDraw({
       current_turn_team_id: state.drawingTeam,
       round_data: roundData,
     }).catch(() => undefined);
-  }, [gameId, gameState, state.currentWord, state.timeRemaining, state.isActive, state.guessedCorrectly, state.drawingTeam, drawerPlayerId, phase, result, roundSeconds]);
+  }, [gameId, gameState, state.currentWord, state.isActive, state.guessedCorrectly, state.drawingTeam, drawerPlayerId, phase, result, roundSeconds]);
 
   const getWordPool = () => {
     if (words && words.length) return words;
@@ -109,10 +98,10 @@ export function BlindDraw({
   const startDrawing = () => {
     const word = pickUnusedWord();
     if (!word) return;
+    cancel();
     setState({
       currentWord: word,
       drawingTeam: teams[currentTeamIndex].id,
-      timeRemaining: roundSeconds,
       isActive: false,
       guessedCorrectly: false,
     });
@@ -141,6 +130,7 @@ export function BlindDraw({
 
   const startTimer = () => {
     setState(prev => ({ ...prev, isActive: true }));
+    start(roundSeconds);
   };
 
   const handleGuessed = () => {
@@ -148,12 +138,14 @@ export function BlindDraw({
     onUpdateScore(state.drawingTeam, 200);
     setResult('guessed');
     setState(prev => ({ ...prev, isActive: false }));
+    cancel();
     setPhase('complete');
   };
 
   const handleMissed = () => {
     setResult('missed');
     setState(prev => ({ ...prev, isActive: false }));
+    cancel();
     setPhase('complete');
   };
 
@@ -165,10 +157,10 @@ export function BlindDraw({
       setRoundsCompleted(prev => prev + 1);
     }
     
+    cancel();
     setState({
       currentWord: null,
       drawingTeam: null,
-      timeRemaining: roundSeconds,
       isActive: false,
       guessedCorrectly: false,
     });
@@ -370,7 +362,7 @@ export function BlindDraw({
                 <CardContent className="pt-6 flex flex-col items-center">
                   <Timer
                     seconds={roundSeconds}
-                    value={state.timeRemaining}
+                    value={remaining ?? roundSeconds}
                     running={state.isActive}
                     size="lg"
                   />
@@ -7,6 +7,7 @@ import { Trophy, Theater } from 'lucide-react';
 import { motion } from 'motion/react';
 import { updateGameState } from '@/services/gameService';
 import { useGameSync } from '@/hooks/useGameSync';
+import { useRoundTimer } from '@/hooks/useRoundTimer';
 
 interface DumpCharadesProps {
   teams: Team[];
@@ -33,7 +34,7 @@ export function DumpCharades({
   const [phase, setPhase] = useState<'prep' | 'acting' | 'judging' | 'complete'>('prep');
   const [currentWord, setCurrentWord] = useState<string | null>(null);
   const [actorPlayerId, setActorPlayerId] = useState<string | null>(null);
-  const [timeRemaining, setTimeRemaining] = useState(roundSeconds);
+  const { remaining, start, cancel } = useRoundTimer(gameId, 'dump_charades');
   const [isActive, setIsActive] = useState(false);
   const [result, setResult] = useState<'guessed' | 'missed' | null>(null);
   const usedWordsRef = useRef<Set<string>>(new Set());
@@ -52,17 +53,6 @@ export function DumpCharades({
     }));
   }, [players, currentTeam]);
 
-  useEffect(() => {
-    if (!isActive) return;
-    const interval = window.setInterval(() => {
-      setTimeRemaining(prev => {
-        const next = Math.max(prev - 1, 0);
-        return next;
-      });
-    }, 1000);
-    return () => window.clearInterval(interval);
-  }, [isActive]);
-
   useEffect(() => {
     if (!gameId) return;
     const roundData = {
@@ -71,7 +61,6 @@ export function DumpCharades({
         word: currentWord,
         actor_team_id: currentTeam?.id || null,
         actor_player_id: actorPlayerId,
-        time_remaining: timeRemaining,
         total_time: roundSeconds,
         is_active: isActive,
         phase,
@@ -88,18 +77,18 @@ export function DumpCharades({
     currentWord,
     currentTeam,
     actorPlayerId,
-    timeRemaining,
+    isActive,
     roundSeconds,
     phase,
     result,
   ]);
 
   useEffect(() => {
-    if (isActive && timeRemaining === 0) {
+    if (isActive && remaining === 0) {
       setIsActive(false);
       setPhase('judging');
     }
-  }, [isActive, timeRemaining]);
+  }, [isActive, remaining]);
 
   const getWordPool = () => {
     return words && words.length ? words : ['charades', 'acting', 'mime'];
@@ -121,7 +110,7 @@ export function DumpCharades({
     setCurrentWord(word);
     setPhase('acting');
     setIsActive(false);
-    setTimeRemaining(roundSeconds);
+    cancel();
     setResult(null);
   };
 
@@ -134,6 +123,7 @@ export function DumpCharades({
 
   const startTimer = () => {
     setIsActive(true);
+    start(roundSeconds);
   };
 
   const handleGuessed = () => {
@@ -141,12 +131,14 @@ export function DumpCharades({
     onUpdateScore(currentTeam.id, 200);
     setResult('guessed');
     setIsActive(false);
+    cancel();
     setPhase('complete');
   };
 
   const handleMissed = () => {
     setResult('missed');
     setIsActive(false);
+    cancel();
     setPhase('complete');
   };
 
@@ -160,7 +152,7 @@ export function DumpCharades({
     setCurrentWord(null);
     setActorPlayerId(null);
     setIsActive(false);
-    setTimeRemaining(roundSeconds);
+    cancel();
     setResult(null);
   };
 
@@ -315,7 +307,7 @@ export function DumpCharades({
                 <CardContent className="pt-6 flex flex-col items-center">
                   <Timer
                     seconds={roundSeconds}
-                    value={timeRemaining}
+                    value={remaining ?? roundSeconds}
                     running={isActive}
                     size="lg"
                   />
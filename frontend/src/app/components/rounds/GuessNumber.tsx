@@ -8,6 +8,7 @@ import { Target, Trophy } from 'lucide-react';
 import { motion } from 'motion/react';
 import { updateGameState } from '@/services/gameService';
 import { useGameSync } from '@/hooks/useGameSync';
+import { useRoundTimer } from '@/hooks/useRoundTimer';
 
 interface GuessNumberProps {
   teams: Team[];
@@ -28,11 +29,11 @@ export function GuessNumber({
 }: GuessNumberProps) {
   const { gameState } = useGameSync(gameId);
   const roundSeconds = Math.max(durationSeconds || 30, 1);
+  const { remaining, start, cancel } = useRoundTimer(gameId, 'guess_number');
   const [state, setState] = useState<GuessNumberState>({
     question: null,
     correctAnswer: null,
     isActive: false,
-    timeRemaining: roundSeconds,
   });
   const [revealed, setRevealed] = useState(false);
   const [manualWinnerTeamId, setManualWinnerTeamId] = useState<string | null>(null);
@@ -123,26 +124,19 @@ export function GuessNumber({
         })) : [],
         winner_team_id: revealed && !isTie ? results[0]?.teamId || null : null,
         tie: isTie,
-        time_remaining: state.timeRemaining,
         total_time: roundSeconds,
       },
     };
     updateGameState(gameId, {
       round_data: roundData,
     }).catch(() => undefined);
-  }, [gameId, gameState, state.question, state.correctAnswer, state.timeRemaining, roundSeconds, questionId, revealed, results]);
+  }, [gameId, gameState, state.question, state.correctAnswer, roundSeconds, questionId, revealed, results]);
 
   useEffect(() => {
-    if (!state.isActive) return;
-    const interval = window.setInterval(() => {
-      setState(prev => {
-        if (!prev.isActive) return prev;
-        const next = Math.max(prev.timeRemaining - 1, 0);
-        return next === 0 ? { ...prev, timeRemaining: 0, isActive: false } : { ...prev, timeRemaining: next };
-      });
-    }, 1000);
-    return () => window.clearInterval(interval);
-  }, [state.isActive]);
+    if (state.isActive && remaining === 0) {
+      setState(prev => ({ ...prev, isActive: false }));
+    }
+  }, [state.isActive, remaining]);
 
   const revealAnswer = useCallback(() => {
     if (!state.correctAnswer) return;
@@ -198,10 +192,10 @@ export function GuessNumber({
     setState(prev => ({
       ...prev,
       isActive: false,
-      timeRemaining: 0,
     }));
+    cancel();
     revealAnswer();
-  }, [revealed, state.isActive, teams, submittedByTeam, revealAnswer]);
+  }, [revealed, state.isActive, teams, submittedByTeam, revealAnswer, cancel]);
 
   const startRound = () => {
     const nextQuestion =
@@ -214,8 +208,8 @@ export function GuessNumber({
       question: nextQuestion.question,
       correctAnswer: nextQuestion.answer,
       isActive: true,
-      timeRemaining: roundSeconds,
     });
+    start(roundSeconds);
     setRevealed(false);
     setResults([]);
     setManualWinnerTeamId(null);
@@ -223,19 +217,11 @@ export function GuessNumber({
     startedRef.current = true;
   };
 
-  const handleTimeUp = () => {
-    setState(prev => ({
-      ...prev,
-      isActive: false,
-      timeRemaining: 0,
-    }));
-  };
-
   useEffect(() => {
-    if (!revealed && state.timeRemaining === 0) {
+    if (!revealed && remaining === 0) {
       revealAnswer();
     }
-  }, [revealed, state.timeRemaining, revealAnswer]);
+  }, [revealed, remaining, revealAnswer]);
 
   useEffect(() => {
     startRound();
@@ -254,8 +240,8 @@ export function GuessNumber({
     setState(prev => ({
       ...prev,
       isActive: false,
-      timeRemaining: 0,
     }));
+    cancel();
     setRevealed(true);
     setQuestionsAsked(prev => prev + 1);
   };
@@ -298,8 +284,7 @@ export function GuessNumber({
                 <div className="flex justify-center mb-6">
                   <Timer
                     seconds={roundSeconds}
-                    value={state.timeRemaining}
-                    onComplete={handleTimeUp}
+                    value={remaining ?? roundSeconds}
                     running={true}
                     size="md"
                   />
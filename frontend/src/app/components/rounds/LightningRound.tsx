@@ -8,6 +8,7 @@ import { Zap, Check, X, SkipForward } from 'lucide-react';
 import { motion } from 'motion/react';
 import { updateGameState } from '@/services/gameService';
 import { useGameSync } from '@/hooks/useGameSync';
+import { useRoundTimer } from '@/hooks/useRoundTimer';
 
 interface LightningRoundProps {
   teams: Team[];
@@ -34,11 +35,21 @@ export function LightningRound({
   const [state, setState] = useState<LightningState>({
     currentTeam: teams[0].id,
     questionsAnswered: 0,
-    timeRemaining: roundSeconds,
     currentQuestion: null,
     isActive: false,
     questionIndex: 0,
   });
+
+  const handleTimeUp = () => {
+    setState(prev => ({
+      ...prev,
+      isActive: false,
+      currentQuestion: null,
+    }));
+  };
+
+  const { remaining, start, cancel } = useRoundTimer(gameId, 'lightning', handleTimeUp);
+  const timeUp = remaining === 0;
   const [teamScores, setTeamScores] = useState<Record<string, number>>({});
   const [allTeamsComplete, setAllTeamsComplete] = useState(false);
   const [correctCount, setCorrectCount] = useState(0);
@@ -47,31 +58,6 @@ export function LightningRound({
   const [questionQueue, setQuestionQueue] = useState<Question[]>([]);
   const autoAdvanceRef = useRef(false);
 
-  useEffect(() => {
-    if (
-      !state.isActive &&
-      state.questionsAnswered === 0 &&
-      state.timeRemaining > 0 &&
-      state.timeRemaining !== roundSeconds
-    ) {
-      setState(prev => ({ ...prev, timeRemaining: roundSeconds }));
-    }
-  }, [roundSeconds, state.isActive, state.questionsAnswered, state.timeRemaining]);
-
-  useEffect(() => {
-    if (!state.isActive) return;
-    const interval = window.setInterval(() => {
-      setState(prev => {
-        if (!prev.isActive) return prev;
-        const next = Math.max(prev.timeRemaining - 1, 0);
-        return next === 0
-          ? { ...prev, timeRemaining: 0, isActive: false, currentQuestion: null }
-          : { ...prev, timeRemaining: next };
-      });
-    }, 1000);
-    return () => window.clearInterval(interval);
-  }, [state.isActive]);
-
   const buildQuestionQueue = (teamIndex: number) => {
     if (questions && questions.length) {
       const start = teamIndex * totalQuestions;
@@ -99,9 +85,9 @@ export function LightningRound({
     setState(prev => ({
       ...prev,
       isActive: true,
-      timeRemaining: roundSeconds,
       questionsAnswered: 0,
     }));
+    start(roundSeconds);
     setCorrectCount(0);
     setIncorrectCount(0);
     loadQuestionFromQueue(queue);
@@ -129,7 +115,7 @@ export function LightningRound({
     if (nextCount < totalQuestions) {
       loadQuestionFromQueue(nextQueue);
     } else {
-      handleTimeUp();
+      finishQuestions();
     }
   };
 
@@ -146,7 +132,7 @@ export function LightningRound({
     if (nextCount < totalQuestions) {
       loadQuestionFromQueue(nextQueue);
     } else {
-      handleTimeUp();
+      finishQuestions();
     }
   };
 
@@ -158,11 +144,9 @@ export function LightningRound({
     }
   };
 
-  const handleTimeUp = () => {
-    setState(prev => ({
-      ...prev,
-      isActive: false,
-    }));
+  const finishQuestions = () => {
+    cancel();
+    handleTimeUp();
   };
 
   const nextTeam = () => {
@@ -170,10 +154,10 @@ export function LightningRound({
       const nextIndex = currentTeamIndex + 1;
       autoAdvanceRef.current = false;
       setCurrentTeamIndex(nextIndex);
+      cancel();
       setState({
         currentTeam: teams[nextIndex].id,
         questionsAnswered: 0,
-        timeRemaining: roundSeconds,
         currentQuestion: null,
         isActive: false,
         questionIndex: 0,
@@ -187,7 +171,7 @@ export function LightningRound({
   };
 
   useEffect(() => {
-    const roundEnded = state.timeRemaining === 0 || state.questionsAnswered >= totalQuestions;
+    const roundEnded = timeUp || state.questionsAnswered >= totalQuestions;
     if (state.isActive || !roundEnded || allTeamsComplete) return;
     if (autoAdvanceRef.current) return;
     autoAdvanceRef.current = true;
@@ -195,7 +179,7 @@ export function LightningRound({
       nextTeam();
     }, 1200);
     return () => window.clearTimeout(timer);
-  }, [state.isActive, state.timeRemaining, state.questionsAnswered, allTeamsComplete, totalQuestions]);
+  }, [state.isActive, timeUp, state.questionsAnswered, allTeamsComplete, totalQuestions]);
 
   useEffect(() => {
     if (!allTeamsComplete) return;
@@ -210,7 +194,7 @@ export function LightningRound({
   useEffect(() => {
     if (!gameId) return;
     const roundComplete =
-      !state.isActive && (state.questionsAnswered >= totalQuestions || state.timeRemaining === 0);
+      !state.isActive && (state.questionsAnswered >= totalQuestions || timeUp);
     const questionNumber = roundComplete
       ? totalQuestions
       : Math.min(state.questionsAnswered + 1, totalQuestions);
@@ -220,7 +204,6 @@ export function LightningRound({
         question: roundComplete ? null : state.currentQuestion?.text || null,
         question_number: questionNumber,
         total_questions: totalQuestions,
-        time_remaining: state.timeRemaining,
         correct_count: correctCount,
         incorrect_count: incorrectCount,
         points_this_round: correctCount * 50,
@@ -238,7 +221,7 @@ export function LightningRound({
     state.questionsAnswered,
     state.currentTeam,
     state.isActive,
-    state.timeRemaining,
+    timeUp,
     correctCount,
     incorrectCount,
     questionQueue,
@@ -361,8 +344,7 @@ export function LightningRound({
               <CardContent className="pt-6 flex flex-col items-center">
                 <Timer
                   seconds={roundSeconds}
-                  value={state.timeRemaining}
-                  onComplete={handleTimeUp}
+                  value={remaining ?? roundSeconds}
                   running={state.isActive}
                   size="lg"
                 />
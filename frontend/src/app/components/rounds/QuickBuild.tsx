@@ -7,6 +7,7 @@ import { Select, SelectContent, SelectItem, SelectTrigger, SelectValue } from '@
 import { Blocks, Trophy } from 'lucide-react';
 import { updateGameState } from '@/services/gameService';
 import { useGameSync } from '@/hooks/useGameSync';
+import { useRoundTimer } from '@/hooks/useRoundTimer';
 
 interface QuickBuildProps {
   teams: Team[];
@@ -19,8 +20,8 @@ interface QuickBuildProps {
 export function QuickBuild({ teams, onUpdateScore, onComplete, gameId, durationSeconds }: QuickBuildProps) {
   const { gameState } = useGameSync(gameId);
   const roundSeconds = Math.min(Math.max(durationSeconds || 60, 30), 300);
+  const { remaining, start } = useRoundTimer(gameId, 'quick_build');
   const [state, setState] = useState<QuickBuildState>({
-    timeRemaining: roundSeconds,
     isActive: false,
     buildingTeam: null,
     winCriteria: 'tallest',
@@ -30,22 +31,10 @@ export function QuickBuild({ teams, onUpdateScore, onComplete, gameId, durationS
   const [roundStarted, setRoundStarted] = useState(false);
 
   useEffect(() => {
-    if (!state.isActive && !roundStarted && state.timeRemaining !== roundSeconds) {
-      setState(prev => ({ ...prev, timeRemaining: roundSeconds }));
+    if (state.isActive && remaining === 0) {
+      setState(prev => ({ ...prev, isActive: false }));
     }
-  }, [roundSeconds, state.isActive, roundStarted, state.timeRemaining]);
-
-  useEffect(() => {
-    if (!state.isActive) return;
-    const interval = window.setInterval(() => {
-      setState(prev => {
-        if (!prev.isActive) return prev;
-        const next = Math.max(prev.timeRemaining - 1, 0);
-        return next === 0 ? { ...prev, timeRemaining: 0, isActive: false } : { ...prev, timeRemaining: next };
-      });
-    }, 1000);
-    return () => window.clearInterval(interval);
-  }, [state.isActive]);
+  }, [state.isActive, remaining]);
 
   useEffect(() => {
     if (!gameId) return;
@@ -53,14 +42,13 @@ export function QuickBuild({ teams, onUpdateScore, onComplete, gameId, durationS
       ? 'building'
       : winner || tie
       ? 'complete'
-      : roundStarted && state.timeRemaining < roundSeconds
+      : roundStarted
       ? 'judging'
       : 'building';
     const roundData = {
       ...(gameState?.round_data || {}),
       quick_build: {
         challenge: getCriteriaDescription(),
-        time_remaining: state.timeRemaining,
         total_time: roundSeconds,
         phase,
         winner_team_id: winner,
@@ -70,23 +58,15 @@ export function QuickBuild({ teams, onUpdateScore, onComplete, gameId, durationS
     updateGameState(gameId, {
       round_data: roundData,
     }).catch(() => undefined);
-  }, [gameId, gameState, state.timeRemaining, state.isActive, winner, tie, roundStarted]);
+  }, [gameId, gameState, state.isActive, winner, tie, roundStarted]);
 
   const startBuild = () => {
     setState(prev => ({
       ...prev,
       isActive: true,
-      timeRemaining: roundSeconds,
     }));
     setRoundStarted(true);
-  };
-
-  const handleTimeUp = () => {
-    setState(prev => ({
-      ...prev,
-      isActive: false,
-      timeRemaining: 0,
-    }));
+    start(roundSeconds);
   };
 
   const selectWinner = (teamId: string) => {
@@ -208,8 +188,7 @@ export function QuickBuild({ teams, onUpdateScore, onComplete, gameId, durationS
                 </div>
                 <Timer
                   seconds={roundSeconds}
-                  value={state.timeRemaining}
-                  onComplete={handleTimeUp}
+                  value={remaining ?? roundSeconds}
                   running={true}
                   size="lg"
                 />
@@ -231,7 +210,7 @@ export function QuickBuild({ teams, onUpdateScore, onComplete, gameId, durationS
         </div>
       )}
 
-      {!state.isActive && state.timeRemaining < roundSeconds && !winner && !tie && (
+      {!state.isActive && roundStarted && !winner && !tie && (
         <div className="max-w-2xl mx-auto space-y-6">
           <h3 className="text-2xl font-bold text-white text-center">Time's Up! Select Winner</h3>
           
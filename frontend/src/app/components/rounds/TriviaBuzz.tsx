@@ -8,6 +8,7 @@ import { Zap, Check, X } from 'lucide-react';
 import { motion, AnimatePresence } from 'motion/react';
 import { updateGameState } from '@/services/gameService';
 import { useGameSync } from '@/hooks/useGameSync';
+import { useRoundTimer } from '@/hooks/useRoundTimer';
 
 interface TriviaBuzzProps {
   teams: Team[];
@@ -27,13 +28,14 @@ export function TriviaBuzz({
   questions,
 }: TriviaBuzzProps) {
   const { gameState, players } = useGameSync(gameId);
+  const answerSeconds = 5;
+  const { remaining, start, cancel } = useRoundTimer(gameId, 'trivia_answer');
   const [state, setState] = useState<TriviaBuzzState>({
     currentQuestion: null,
     buzzedTeam: null,
     buzzLockoutUntil: null,
     questionActive: false,
     stealAvailable: false,
-    answerTimer: null,
   });
   const [questionsAsked, setQuestionsAsked] = useState(0);
   const [showAnswer, setShowAnswer] = useState(false);
@@ -46,13 +48,13 @@ export function TriviaBuzz({
       questions && questions.length > nextIndex
         ? questions[nextIndex]
         : getRandomQuestion(triviaQuestions, difficulty);
+    cancel();
     setState({
       currentQuestion: nextQuestion,
       buzzedTeam: null,
       buzzLockoutUntil: null,
       questionActive: true,
       stealAvailable: false,
-      answerTimer: null,
     });
     setShowAnswer(false);
     setIncorrectTeam(null);
@@ -73,7 +75,6 @@ export function TriviaBuzz({
         current_points: 100,
         can_buzz: true,
         buzzed_team_id: null,
-        time_remaining: null,
         round_data: roundData,
       }).catch(() => undefined);
     }
@@ -82,11 +83,11 @@ export function TriviaBuzz({
   const handleBuzz = (teamId: string) => {
     if (!state.questionActive || state.buzzedTeam) return;
     if (state.buzzLockoutUntil && Date.now() < state.buzzLockoutUntil) return;
+    start(answerSeconds);
 
     setState(prev => ({
       ...prev,
       buzzedTeam: teamId,
-      answerTimer: 5,
     }));
     if (gameId) {
       const roundData = {
@@ -101,7 +102,6 @@ export function TriviaBuzz({
       updateGameState(gameId, {
         can_buzz: false,
         buzzed_team_id: teamId,
-        time_remaining: 5,
         round_data: roundData,
       }).catch(() => undefined);
     }
@@ -109,13 +109,13 @@ export function TriviaBuzz({
 
   const handleCorrect = () => {
     if (!state.buzzedTeam) return;
+    cancel();
     
     onUpdateScore(state.buzzedTeam, 100);
     setShowAnswer(true);
     setState(prev => ({
       ...prev,
       questionActive: false,
-      answerTimer: null,
     }));
     setQuestionsAsked(prev => prev + 1);
     if (gameId) {
@@ -129,7 +129,6 @@ export function TriviaBuzz({
       };
       updateGameState(gameId, {
         can_buzz: false,
-        time_remaining: null,
         round_data: roundData,
       }).catch(() => undefined);
     }
@@ -137,6 +136,7 @@ export function TriviaBuzz({
 
   const handleIncorrect = () => {
     if (!state.buzzedTeam) return;
+    cancel();
     
     onUpdateScore(state.buzzedTeam, -50);
     setIncorrectTeam(state.buzzedTeam);
@@ -147,7 +147,6 @@ export function TriviaBuzz({
       stealAvailable: true,
       buzzedTeam: null,
       buzzLockoutUntil: Date.now() + 2000, // 2 second lockout
-      answerTimer: null,
     }));
     if (gameId) {
       const roundData = {
@@ -160,7 +159,6 @@ export function TriviaBuzz({
       updateGameState(gameId, {
         can_buzz: true,
         buzzed_team_id: null,
-        time_remaining: null,
         round_data: roundData,
       }).catch(() => undefined);
     }
@@ -169,12 +167,12 @@ export function TriviaBuzz({
   const handleSteal = (teamId: string) => {
     if (!state.stealAvailable) return;
     if (!incorrectTeam || teamId === incorrectTeam) return;
+    start(answerSeconds);
     
     setState(prev => ({
       ...prev,
       buzzedTeam: teamId,
       stealAvailable: false,
-      answerTimer: 5,
     }));
     if (gameId) {
       const roundData = {
@@ -188,7 +186,6 @@ export function TriviaBuzz({
       updateGameState(gameId, {
         can_buzz: false,
         buzzed_team_id: teamId,
-        time_remaining: 5,
         round_data: roundData,
       }).catch(() => undefined);
     }
@@ -196,13 +193,13 @@ export function TriviaBuzz({
 
   const handleStealCorrect = () => {
     if (!state.buzzedTeam) return;
+    cancel();
     
     onUpdateScore(state.buzzedTeam, 100);
     setShowAnswer(true);
     setState(prev => ({
       ...prev,
       questionActive: false,
-      answerTimer: null,
     }));
     setQuestionsAsked(prev => prev + 1);
     if (gameId) {
@@ -216,7 +213,6 @@ export function TriviaBuzz({
       };
       updateGameState(gameId, {
         can_buzz: false,
-        time_remaining: null,
         round_data: roundData,
       }).catch(() => undefined);
     }
@@ -224,6 +220,7 @@ export function TriviaBuzz({
 
   const handleStealIncorrect = () => {
     if (!state.buzzedTeam) return;
+    cancel();
     
     // Penalty for incorrect steal
     onUpdateScore(state.buzzedTeam, -50);
@@ -232,7 +229,6 @@ export function TriviaBuzz({
       ...prev,
       questionActive: false,
       stealAvailable: false,
-      answerTimer: null,
     }));
     setQuestionsAsked(prev => prev + 1);
     if (gameId) {
@@ -246,7 +242,6 @@ export function TriviaBuzz({
       };
       updateGameState(gameId, {
         can_buzz: false,
-        time_remaining: null,
         round_data: roundData,
       }).catch(() => undefined);
     }
@@ -258,30 +253,6 @@ export function TriviaBuzz({
     loadNextQuestion(nextIndex);
   };
 
-  useEffect(() => {
-    if (state.answerTimer === null || state.answerTimer === 0) return;
-    const interval = window.setInterval(() => {
-      setState(prev => {
-        if (prev.answerTimer === null || prev.answerTimer === 0) return prev;
-        const next = Math.max(prev.answerTimer - 1, 0);
-        return { ...prev, answerTimer: next };
-      });
-    }, 1000);
-    return () => window.clearInterval(interval);
-  }, [state.answerTimer]);
-
-  useEffect(() => {
-    if (!gameId) return;
-    updateGameState(gameId, {
-      time_remaining: state.answerTimer ?? null,
-      round_data: {
-        trivia: {
-          answer_timer: state.answerTimer ?? null,
-        },
-      },
-    }).catch(() => undefined);
-  }, [gameId, state.answerTimer]);
-
   useEffect(() => {
     loadNextQuestion();
   }, []);
@@ -299,10 +270,10 @@ export function TriviaBuzz({
       setState(prev => ({
         ...prev,
         buzzedTeam: gameState.buzzed_team_id,
-        answerTimer: 5,
       }));
+      start(answerSeconds);
     }
-  }, [gameState, state.buzzedTeam, state.currentQuestion]);
+  }, [gameState, state.buzzedTeam, state.currentQuestion, start]);
 
   const buzzedPlayerId = (gameState?.round_data as any)?.trivia?.buzzed_player_id || null;
   const teamPlayers = state.buzzedTeam
@@ -350,7 +321,7 @@ export function TriviaBuzz({
             </div>
 
             <AnimatePresence>
-              {state.buzzedTeam && state.answerTimer && (
+              {state.buzzedTeam && !!remaining && (
                 <motion.div
                   initial={{ opacity: 0, scale: 0.8 }}
                   animate={{ opacity: 1, scale: 1 }}
@@ -364,7 +335,7 @@ export function TriviaBuzz({
                     {buzzedTeamData?.name}
                     {buzzedPlayerName ? ` (${buzzedPlayerName})` : ''} buzzed in!
                   </div>
-                  <Timer seconds={state.answerTimer} size="sm" running={true} />
+                  <Timer seconds={answerSeconds} value={remaining} size="sm" running={true} />
                 </motion.div>
               )}
             </AnimatePresence>
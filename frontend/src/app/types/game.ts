@@ -40,19 +40,16 @@ export interface TriviaBuzzState {
   buzzLockoutUntil: number | null;
   questionActive: boolean;
   stealAvailable: boolean;
-  answerTimer: number | null;
 }
 
 export interface LightningState {
   currentTeam: string | null;
   questionsAnswered: number;
-  timeRemaining: number;
   currentQuestion: Question | null;
   isActive: boolean;
 }
 
 export interface QuickBuildState {
-  timeRemaining: number;
   isActive: boolean;
   buildingTeam: string | null;
   winCriteria: 'tallest' | 'most-blocks' | 'stability';
@@ -71,13 +68,11 @@ export interface GuessNumberState {
   question: string | null;
   correctAnswer: number | null;
   isActive: boolean;
-  timeRemaining: number;
 }
 
 export interface BlindDrawState {
   currentWord: string | null;
   drawingTeam: string | null;
-  timeRemaining: number;
   isActive: boolean;
   guessedCorrectly: boolean;
 }
@@ -3,9 +3,12 @@ import {
   GameStateDto,
   GameWithTeamsDto,
   PlayerStatusDto,
-  getGame,
-  getGameState,
-  getPlayersForGame,
+  ServerTimer,
+  TimerDto,
+  getGameBundle,
+  getStoredHostPin,
+  listTimers,
+  mapTimerDto,
 } from '@/services/gameService';
 
 interface UseGameSyncResult {
@@ -13,6 +16,7 @@ interface UseGameSyncResult {
   teams: GameWithTeamsDto['teams'];
   players: PlayerStatusDto[];
   gameState: GameStateDto | null;
+  timers: Record<string, ServerTimer>;
   loading: boolean;
   error: string | null;
 }
@@ -22,6 +26,7 @@ export function useGameSync(gameId: string | null, pollIntervalMs = 1500): UseGa
   const [teams, setTeams] = useState<GameWithTeamsDto['teams']>([]);
   const [players, setPlayers] = useState<PlayerStatusDto[]>([]);
   const [gameState, setGameState] = useState<GameStateDto | null>(null);
+  const [timers, setTimers] = useState<Record<string, ServerTimer>>({});
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
   const [wsConnected, setWsConnected] = useState(false);
@@ -38,16 +43,23 @@ export function useGameSync(gameId: string | null, pollIntervalMs = 1500): UseGa
 
     const fetchAll = async () => {
       try {
-        const [gameResponse, stateResponse, playersResponse] = await Promise.all([
-          getGame(gameId),
-          getGameState(gameId),
-          getPlayersForGame(gameId),
-        ]);
+        const [bundle, running] = await Promise.all([getGameBundle(gameId), listTimers(gameId)]);
         if (!isMounted) return;
-        setGame(gameResponse.game);
-        setTeams(gameResponse.teams);
-        setGameState(stateResponse);
-        setPlayers(playersResponse);
+        setGame(bundle.game);
+        setTeams(bundle.teams);
+        setGameState(bundle.game_state);
+        setPlayers(bundle.players);
+        setTimers(prev => {
+          const now = Date.now();
+          const next: Record<string, ServerTimer> = {};
+          Object.values(prev).forEach(timer => {
+            if (timer.deadline <= now) next[timer.name] = timer;
+          });
+          running.forEach(timer => {
+            next[timer.name] = mapTimerDto(timer);
+          });
+          return next;
+        });
         setError(null);
       } catch (err) {
         if (!isMounted) return;
@@ -79,18 +91,24 @@ export function useGameSync(gameId: string | null, pollIntervalMs = 1500): UseGa
 
     const apiBase = import.meta.env.VITE_API_URL || 'http://localhost:8000';
     const wsBase = import.meta.env.VITE_WS_URL || apiBase.replace(/^http/, 'ws');
-    const wsUrl = `${wsBase.replace(/\/$/, '')}/ws/games/${gameId}`;
+    const hostPin = getStoredHostPin(gameId);
+    const roleQuery = hostPin ? '?role=host' : '';
+    const wsUrl = `${wsBase.replace(/\/$/, '')}/ws/games/${gameId}${roleQuery}`;
     const ws = new WebSocket(wsUrl);
     wsRef.current = ws;
 
     ws.onopen = () => {
+      if (hostPin) {
+        ws.send(JSON.stringify({ type: 'auth', host_pin: hostPin }));
+      }
       setWsConnected(true);
     };
 
     ws.onmessage = (event) => {
       try {
-        const message = JSON.parse(event.data) as {
+        const message = JSON.parse(event.data) as TimerDto & {
           type: string;
+          event?: 'started' | 'cancelled' | 'expired';
           data: {
             game?: GameWithTeamsDto['game'];
             teams?: GameWithTeamsDto['teams'];
@@ -105,6 +123,16 @@ export function useGameSync(gameId: string | null, pollIntervalMs = 1500): UseGa
           if (message.data.game_state !== undefined) setGameState(message.data.game_state);
           setLoading(false);
           setError(null);
+        } else if (message.type === 'timer') {
+          setTimers(prev => {
+            const next = { ...prev };
+            if (message.event === 'cancelled') {
+              delete next[message.name];
+            } else {
+              next[message.name] = mapTimerDto(message);
+            }
+            return next;
+          });
         }
       } catch (err) {
         setError(err instanceof Error ? err.message : 'Failed to parse live update');
@@ -125,5 +153,5 @@ export function useGameSync(gameId: string | null, pollIntervalMs = 1500): UseGa
     };
   }, [gameId]);
 
-  return { game, teams, players, gameState, loading, error };
+  return { game, teams, players, gameState, timers, loading, error };
 }
@@ -0,0 +1,75 @@
+import { useCallback, useEffect, useRef, useState } from 'react';
+import { ServerTimer, cancelTimer, mapTimerDto, startTimer } from '@/services/gameService';
+
+function secondsUntil(deadline: number): number {
+  return Math.max(Math.ceil((deadline - Date.now()) / 1000), 0);
+}
+
+export function useCountdowns(timers: Record<string, ServerTimer>): Record<string, number> {
+  const [, setTick] = useState(0);
+  const running = Object.values(timers).some(timer => timer.deadline > Date.now());
+  const deadlines = Object.values(timers)
+    .map(timer => `${timer.name}:${timer.deadline}`)
+    .join('|');
+
+  useEffect(() => {
+    if (!running) return;
+    const interval = window.setInterval(() => setTick(tick => tick + 1), 250);
+    return () => window.clearInterval(interval);
+  }, [running, deadlines]);
+
+  return Object.fromEntries(Object.values(timers).map(timer => [timer.name, secondsUntil(timer.deadline)]));
+}
+
+export function useCountdown(timer: ServerTimer | null | undefined): number | null {
+  const countdowns = useCountdowns(timer ? { [timer.name]: timer } : {});
+  return timer ? countdowns[timer.name] : null;
+}
+
+interface RoundTimerResult {
+  remaining: number | null;
+  start: (seconds: number, onExpire?: 'disable_buzzing') => void;
+  cancel: () => void;
+}
+
+export function useRoundTimer(
+  gameId: string | null | undefined,
+  name: string,
+  onExpire?: () => void
+): RoundTimerResult {
+  const [timer, setTimer] = useState<ServerTimer | null>(null);
+  const remaining = useCountdown(timer);
+  const generationRef = useRef(0);
+  const expiredGenerationRef = useRef(0);
+  const onExpireRef = useRef(onExpire);
+  onExpireRef.current = onExpire;
+
+  useEffect(() => {
+    if (remaining !== 0 || expiredGenerationRef.current === generationRef.current) return;
+    expiredGenerationRef.current = generationRef.current;
+    onExpireRef.current?.();
+  }, [remaining]);
+
+  const start = useCallback(
+    (seconds: number, onExpire?: 'disable_buzzing') => {
+      const generation = ++generationRef.current;
+      setTimer({ name, durationSeconds: seconds, deadline: Date.now() + seconds * 1000 });
+      if (!gameId) return;
+      startTimer(gameId, name, seconds, onExpire)
+        .then(started => {
+          if (generationRef.current === generation) setTimer(mapTimerDto(started));
+        })
+        .catch(() => undefined);
+    },
+    [gameId, name]
+  );
+
+  const cancel = useCallback(() => {
+    generationRef.current += 1;
+    setTimer(null);
+    if (!gameId || !timer || timer.deadline <= Date.now()) return;
+    cancelTimer(gameId, name).catch(() => undefined);
+  }, [gameId, name, timer]);
+
+  return { remaining, start, cancel };
+}
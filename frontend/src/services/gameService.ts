@@ -62,6 +62,20 @@ export interface GameStateUpdatePayload {
   round_data?: Record<string, unknown> | null;
 }
 
+export interface TimerDto {
+  name: string;
+  duration_seconds: number;
+  deadline_ms: number;
+  on_expire: string | null;
+  server_time_ms: number;
+}
+
+export interface ServerTimer {
+  name: string;
+  durationSeconds: number;
+  deadline: number;
+}
+
 export interface GameUpdatePayload {
   status?: string | null;
   current_round?: number | null;
@@ -69,18 +83,34 @@ export interface GameUpdatePayload {
   difficulty?: string | null;
 }
 
+const HOST_PIN_KEY_PREFIX = 'gameshow:host-pin:';
+
+export function getStoredHostPin(gameId: string): string | null {
+  return window.sessionStorage.getItem(`${HOST_PIN_KEY_PREFIX}${gameId}`);
+}
+
+function storeHostPin(gameId: string, hostPin: string | undefined) {
+  if (hostPin) {
+    window.sessionStorage.setItem(`${HOST_PIN_KEY_PREFIX}${gameId}`, hostPin);
+  }
+}
+
 export async function createGame(payload: GameCreatePayload): Promise<GameWithTeamsDto> {
-  return apiRequest<GameWithTeamsDto>('/api/games', {
+  const response = await apiRequest<GameWithTeamsDto>('/api/games', {
     method: 'POST',
     body: payload,
   });
+  storeHostPin(response.game.id, payload.host_pin);
+  return response;
 }
 
 export async function getHostGameByCode(code: string, hostPin: string): Promise<GameWithTeamsDto> {
-  return apiRequest<GameWithTeamsDto>(`/api/games/code/${code}/host`, {
+  const response = await apiRequest<GameWithTeamsDto>(`/api/games/code/${code}/host`, {
     method: 'POST',
     body: { host_pin: hostPin },
   });
+  storeHostPin(response.game.id, hostPin);
+  return response;
 }
 
 export async function getGameByCode(code: string): Promise<GameWithTeamsDto> {
@@ -108,8 +138,24 @@ export async function joinGame(code: string, playerName: string, teamId: string)
   );
 }
 
+export interface GameBundleDto extends GameWithTeamsDto {
+  game_state: GameStateDto | null;
+  players: PlayerStatusDto[];
+}
+
+function hostPinHeaders(gameId: string): Record<string, string> {
+  const hostPin = getStoredHostPin(gameId);
+  return hostPin ? { 'X-Host-Pin': hostPin } : {};
+}
+
+export async function getGameBundle(gameId: string): Promise<GameBundleDto> {
+  const headers = hostPinHeaders(gameId);
+  const query = headers['X-Host-Pin'] ? '?role=host' : '';
+  return apiRequest<GameBundleDto>(`/api/games/${gameId}/bundle${query}`, { headers });
+}
+
 export async function getGameState(gameId: string): Promise<GameStateDto> {
-  return apiRequest<GameStateDto>(`/api/games/${gameId}/state`);
+  return apiRequest<GameStateDto>(`/api/games/${gameId}/state`, { headers: hostPinHeaders(gameId) });
 }
 
 export async function getPlayersForGame(gameId: string): Promise<PlayerStatusDto[]> {
@@ -139,6 +185,36 @@ export async function updateTeamScore(teamId: string, points: number): Promise<T
   });
 }
 
+export async function listTimers(gameId: string): Promise<TimerDto[]> {
+  return apiRequest<TimerDto[]>(`/api/games/${gameId}/timers`);
+}
+
+export async function startTimer(
+  gameId: string,
+  name: string,
+  seconds: number,
+  onExpire?: 'disable_buzzing'
+): Promise<TimerDto> {
+  return apiRequest<TimerDto>(`/api/games/${gameId}/timers`, {
+    method: 'POST',
+    body: { name, seconds, on_expire: onExpire ?? null },
+  });
+}
+
+export async function cancelTimer(gameId: string, name: string): Promise<TimerDto> {
+  return apiRequest<TimerDto>(`/api/games/${gameId}/timers/${encodeURIComponent(name)}`, {
+    method: 'DELETE',
+  });
+}
+
+export function mapTimerDto(timer: TimerDto): ServerTimer {
+  return {
+    name: timer.name,
+    durationSeconds: timer.duration_seconds,
+    deadline: Date.now() + timer.deadline_ms - timer.server_time_ms,
+  };
+}
+
 export function mapTeamDto(team: TeamDto): Team {
   return {
     id: team.id,